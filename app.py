@@ -2,583 +2,27 @@
 #  네이버 뉴스 클리핑 v4 - Streamlit 앱
 #
 #  실행 방법:
-#    pip install streamlit requests beautifulsoup4 pandas xlsxwriter
-#    streamlit run naver_news_clipping_streamlit.py
+#    pip install streamlit requests beautifulsoup4 pandas xlsxwriter aiohttp
+#    streamlit run app.py
+#
+#  수집 · 내보내기 로직은 clipping 패키지에 있다 (헤드리스: python -m clipping)
 # ============================================================
 
-import io
-import re
-import html
-import time
-import requests
+import os
+import uuid
 import pandas as pd
 import streamlit as st
-from datetime import datetime, timedelta, timezone
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from bs4 import BeautifulSoup
-
-# ══════════════════════════════════════════════════════════════
-#  설정값
-# ══════════════════════════════════════════════════════════════
-
-MAX_WORKERS     = 10
-REQUEST_TIMEOUT = 6
-HEADERS = {
-    'User-Agent': (
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-        'AppleWebKit/537.36 (KHTML, like Gecko) '
-        'Chrome/124.0.0.0 Safari/537.36'
-    )
-}
-
-GROUP_COLORS = {
-    "그룹 A": "#D5F5E3",
-    "그룹 B": "#FEF9E7",
-    "그룹 C": "#FDEBD0",
-    "":       "#FFFFFF",
-}
-
-# ── 그룹 배지 색상 (Streamlit 테이블용 HTML) ─────────────────
-GROUP_BADGE = {
-    "그룹 A": "background:#D5F5E3; color:#1e7e34; padding:2px 8px; border-radius:4px; font-weight:bold;",
-    "그룹 B": "background:#FEF9E7; color:#856404; padding:2px 8px; border-radius:4px; font-weight:bold;",
-    "그룹 C": "background:#FDEBD0; color:#c05621; padding:2px 8px; border-radius:4px; font-weight:bold;",
-    "":       "color:#999; padding:2px 8px;",
-}
-
-# ══════════════════════════════════════════════════════════════
-#  매핑 테이블
-# ══════════════════════════════════════════════════════════════
-
-FIXED_MAP = {
-    "1conomynews": "1코노미뉴스",
-    "cctimes": "충청타임즈",
-    "chungnamilbo": "충남일보",
-    "dtnews24": "대전뉴스",
-    "enetnews": "이넷뉴스",
-    "financialreview": "파이낸셜리뷰",
-    "globalepic": "글로벌에픽",
-    "gokorea": "고코리아",
-    "goodmorningcc": "굿모닝충청",
-    "hinews": "하이뉴스",
-    "idaegu": "아이대구",
-    "joongdo": "중도일보",
-    "kdfnews": "한국면세뉴스",
-    "ktnews": "강원타임즈",
-    "newslock": "뉴스락",
-    "newsway": "뉴스웨이",
-    "opinionnews": "오피니언뉴스",
-    "startuptoday": "스타트업투데이",
-    "straightnews": "스트레이트뉴스",
-    "tfmedia": "조세금융신문",
-    "weekly": "주간한국",
-    "wolyo": "월요신문",
-    "womaneconomy": "여성경제신문",
-    "lawissue": "로이슈", "newsworker": "뉴스워커", "topdaily": "톱데일리",
-    "wikitree": "위키트리", "thepublic": "더퍼블릭", "thebigdata": "빅데이터뉴스",
-    "socialvalue": "소셜밸류", "smartfn": "스마트에프엔", "sisacast": "시사캐스트",
-    "siminilbo": "시민일보", "seoultimes": "서울타임즈", "sentv": "서울경제TV",
-    "segyebiz": "세계비즈", "pressman": "프레스맨", "popcornnews": "팝콘뉴스",
-    "pointe": "포인트데일리", "onews": "열린뉴스통신", "nextdaily": "넥스트데일리",
-    "newswatch": "뉴스워치", "newsquest": "뉴스퀘스트", "newsprime": "뉴스프라임",
-    "newsinside": "뉴스인사이드", "mkhealth": "매경헬스", "metroseoul": "메트로신문",
-    "meconomynews": "M이코노미", "kbsm": "경북신문", "joongangenews": "중앙이코노미뉴스",
-    "iminju": "민주신문", "ilyo": "일요신문", "hankooki": "스포츠한국",
-    "ezyeconomy": "이지경제", "enewstoday": "이뉴스투데이", "ekn": "에너지경제",
-    "dizzotv": "디지틀조선일보", "cstimes": "컨슈머타임스",
-    "consumernews": "소비자가만드는신문", "ceoscoredaily": "CEO스코어데일리",
-    "breaknews": "브레이크뉴스", "bizwnews": "비즈월드", "beyondpost": "비욘드포스트",
-    "asiatime": "아시아타임즈", "apnews": "아시아에이", "biz": "패션비즈",
-    "viva100": "브릿지경제", "srtimes": "SR타임스", "kpenews": "한국정경신문",
-    "news2day": "뉴스투데이", "fashionbiz": "패션비즈", "econovill": "이코노믹리뷰",
-    "businessplus": "비즈니스플러스", "newspim": "뉴스핌", "m-i": "매일일보",
-    "pointdaily": "포인트데일리", "ajunews": "아주경제", "asiatoday": "아시아투데이", "xportsnews": "엑스포츠뉴스", "sports": "엑스포츠뉴스", "youthdaily": "청년일보",
-    "seoulwire": "서울와이어", "newstomato": "뉴스토마토", "widedaily": "와이드경제",
-    "apparelnews": "어패럴뉴스", "biztribune": "비즈트리뷴", "etoday": "이투데이",
-    "ngetnews": "뉴스저널리즘", "hansbiz": "한스경제", "byline": "바이라인네트워크",
-    "dealsite": "딜사이트", "businesspost": "비즈니스포스트", "dnews": "대한경제",
-    "insight": "인사이트", "slist": "싱글리스트", "theviewers": "뷰어스",
-    "daily": "데일리한국", "veritas-a": "베리타스알파", "fortunekorea": "포춘코리아",
-    "huffingtonpost": "허프포스트", "mediapen": "미디어펜", "paxetv": "팍스경제TV",
-    "shinailbo": "신아일보", "pinpointnews": "핀포인트뉴스", "sisunnews": "시선뉴스",
-    "sisaon": "시사온", "smarttoday": "스마트투데이", "ziksir": "직썰",
-    "job-post": "잡포스트", "issuenbiz": "이슈앤비즈", "fashionn": "패션엔",
-    "thebell": "더벨", "ftoday": "파이낸셜투데이", "newspost": "뉴스포스트",
-    "econonews": "이코노뉴스", "thevaluenews": "더밸류뉴스", "megaeconomy": "메가경제", "greened": "녹색경제신문", "sisajournal-e": "시사저널이코노미", "digitaltoday": "디지털투데이"
-}
-
-OID_MAP = {
-    "001": "연합뉴스", "002": "프레시안", "003": "뉴시스", "004": "내일신문",
-    "005": "국민일보", "008": "머니투데이", "009": "매일경제", "011": "서울경제",
-    "014": "파이낸셜뉴스", "015": "한국경제", "016": "헤럴드경제", "018": "이데일리",
-    "020": "동아일보", "021": "문화일보", "022": "세계일보", "023": "조선일보",
-    "025": "중앙일보", "028": "한겨레", "029": "디지털타임스", "030": "전자신문",
-    "031": "아이뉴스24", "032": "경향신문", "034": "이코노미스트", "038": "한국일보",
-    "052": "YTN", "055": "SBS", "056": "KBS", "057": "MBN", "065": "스포츠서울",
-    "076": "스포츠조선", "079": "노컷뉴스", "081": "서울신문", "082": "부산일보",
-    "088": "매일신문", "092": "지디넷코리아", "117": "마이데일리", "119": "데일리안",
-    "123": "조세일보", "138": "디지털데일리", "143": "쿠키뉴스", "144": "스포츠월드",
-    "214": "MBC", "215": "한국경제TV", "241": "시사IN", "243": "이코노미스트",
-    "277": "아시아경제", "584": "아시아투데이", "293": "블로터", "321": "브릿지경제", "323": "한국섬유신문",
-    "324": "이투데이", "329": "뉴데일리", "366": "조선비즈", "374": "SBS Biz",
-    "383": "한국정경신문", "410": "어패럴뉴스", "417": "머니S", "421": "뉴스1",
-    "437": "JTBC", "445": "대한경제", "448": "서울와이어", "449": "TV조선",
-    "465": "여성경제신문", "468": "스포츠경향", "512": "뉴스핌", "529": "싱글리스트",
-    "586": "시사저널e", "629": "뉴스토마토", "645": "아주경제", "648": "비즈워치",
-    "654": "비즈트리뷴", "658": "뷰어스", "660": "청년일보", "929": "디지털투데이",
-    "239": "바이라인네트워크", "273": "패션비즈",
-}
-
-GROUP_MAP = {
-    "1코노미뉴스":"그룹 B","CBS노컷뉴스":"그룹 A","CEO스코어데일리":"그룹 C",
-    "EBN":"그룹 B","FETV":"그룹 C","IT조선":"그룹 C","KBS":"그룹 A",
-    "K패션뉴스":"그룹 C","MBC":"그룹 A","MBN":"그룹 A","S-저널":"그룹 C",
-    "SBS":"그룹 A","SBS Biz":"그룹 A","SR타임스":"그룹 C","TV조선":"그룹 A",
-    "YTN":"그룹 A","경향신문":"그룹 A","공공뉴스":"그룹 B","국민일보":"그룹 A",
-    "국제섬유신문":"그룹 A","굿모닝경제":"그룹 C","남다른디테일":"그룹 B",
-    "내일신문":"그룹 A","녹색경제신문":"그룹 C","뉴데일리":"그룹 A","뉴스1":"그룹 A",
-    "뉴스워치":"그룹 C","뉴스워커":"그룹 C","뉴스웨이":"그룹 B","뉴스인사이드":"그룹 C",
-    "뉴스저널리즘":"그룹 B","뉴스토마토":"그룹 C","뉴스톱":"그룹 B","뉴스투데이":"그룹 B",
-    "뉴스포스트":"그룹 C","뉴스핌":"그룹 A","뉴시스":"그룹 A","뉴시안":"그룹 C",
-    "대한경제":"그룹 B","더리브스":"그룹 C","더밸류뉴스":"그룹 B","더벨":"그룹 B",
-    "더스쿠프":"그룹 B","더스탁":"그룹 B","더팩트":"그룹 A","더피알":"그룹 C",
-    "데일리안":"그룹 A","데일리한국":"그룹 A","동아닷컴":"그룹 C","동아일보":"그룹 A",
-    "동행미디어 시대":"그룹 A","디지털데일리":"그룹 A","디지털타임스":"그룹 A",
-    "디지털투데이":"그룹 B","디지틀조선일보":"그룹 C","디토앤디토":"그룹 A",
-    "딜사이트":"그룹 B","딜사이트TV":"그룹 C","로이슈":"그룹 B","마이데일리":"그룹 B",
-    "매경이코노미":"그룹 B","매경헬스":"그룹 B","매일경제":"그룹 A",
-    "매일경제 레이더M":"그룹 B","매일경제TV":"그룹 C","매일신문":"그룹 B",
-    "매일일보":"그룹 B","머니투데이":"그룹 A","머니투데이방송":"그룹 A",
-    "메가경제":"그룹 C","메트로신문":"그룹 C","문화일보":"그룹 A","문화저널21":"그룹 C",
-    "미디어펜":"그룹 C","바이라인네트워크":"그룹 A","부산일보":"그룹 B","뷰어스":"그룹 C",
-    "브릿지경제":"그룹 B","블로터":"그룹 A","비즈니스워치":"그룹 A","비즈니스포스트":"그룹 B",
-    "비즈니스플러스":"그룹 B","비즈트리뷴":"그룹 C","비즈한국":"그룹 C",
-    "서울경제":"그룹 A","서울경제TV":"그룹 A","서울신문":"그룹 A","서울와이어":"그룹 C",
-    "서울파이낸스":"그룹 C","세계비즈":"그룹 C","세계일보":"그룹 A",
-    "소비자가만드는신문":"그룹 B","소셜밸류":"그룹 C","스마트투데이":"그룹 C",
-    "스트레이트뉴스":"그룹 C","스포츠조선":"그룹 B","스포츠한국":"그룹 B",
-    "시사오늘":"그룹 C","시사위크":"그룹 C","시사저널이코노미":"그룹 C","시사캐스트":"그룹 C",
-    "신아일보":"그룹 C","싱글리스트":"그룹 C","아시아경제":"그룹 A","아시아타임즈":"그룹 B",
-    "아시아투데이":"그룹 A","아웃스탠딩":"그룹 A","아이뉴스24":"그룹 A","아주경제":"그룹 A",
-    "아주일보":"그룹 C","알파경제":"그룹 B","약업신문":"그룹 C","어패럴뉴스":"그룹 A",
-    "에너지경제":"그룹 B","여성경제신문":"그룹 C","연합 인포맥스":"그룹 B",
-    "연합뉴스":"그룹 A","연합뉴스TV":"그룹 A","오늘경제":"그룹 C","월요신문":"그룹 B",
-    "위키리크스한국":"그룹 B","위키트리":"그룹 C","이뉴스투데이":"그룹 B","이데일리":"그룹 A",
-    "이코노미스트":"그룹 B","이코노믹리뷰":"그룹 B","이투데이":"그룹 A",
-    "인베스트조선":"그룹 B","인사이트":"그룹 C","인사이트코리아":"그룹 B",
-    "일간스포츠":"그룹 B","일요서울":"그룹 C","일요신문":"그룹 C","전자신문":"그룹 A",
-    "조선비즈":"그룹 A","조선일보":"그룹 A","주간한국":"그룹 B","중소기업신문":"그룹 C",
-    "중앙선데이":"그룹 A","중앙이코노미뉴스":"그룹 C","중앙일보":"그룹 A",
-    "지디넷코리아":"그룹 A","청년일보":"그룹 C","커넥터스":"그룹 C","컨슈머타임즈":"그룹 B",
-    "코리아중앙데일리":"그룹 A","코리아타임스":"그룹 A","코리아헤럴드":"그룹 A",
-    "쿠키뉴스":"그룹 A","테넌트뉴스":"그룹 A","테크엠":"그룹 A","토요경제":"그룹 C",
-    "톱데일리":"그룹 B","투데이신문":"그룹 B","투데이코리아":"그룹 C","파이낸셜뉴스":"그룹 A",
-    "파이낸셜리뷰":"그룹 C","파이낸셜투데이":"그룹 C","파이낸셜포스트":"그룹 C",
-    "팝콘뉴스":"그룹 C","패션비즈":"그룹 A","패션인사이트":"그룹 A","패션포스트":"그룹 A",
-    "포인트데일리":"그룹 C","프라임경제":"그룹 C","하이뉴스":"그룹 C","한겨레":"그룹 A",
-    "한경비즈니스":"그룹 B","한국경제":"그룹 A","한국경제TV":"그룹 A",
-    "한국금융신문":"그룹 C","한국면세뉴스":"그룹 C","한국섬유신문":"그룹 A",
-    "한국일보":"그룹 A","한국정경신문":"그룹 C","한스경제":"그룹 B","허프포스트":"그룹 C",
-    "헤럴드경제":"그룹 A","현대경제신문":"그룹 C","후지TV":"그룹 C","MTN":"그룹 A",
-}
-
-
-
-# ══════════════════════════════════════════════════════════════
-#  헬퍼 함수 (기존과 동일)
-# ══════════════════════════════════════════════════════════════
-
-def clean_html_text(text: str) -> str:
-    if not text:
-        return ""
-    text = html.unescape(text)
-    text = re.sub(r'<[^>]*>', '', text)
-    return text.replace('"', "'")
-
-
-def publisher_from_url(link: str) -> str:
-    if "naver.com" in link:
-        m = re.search(r'article/(\d+)/', link)
-        if m:
-            oid = m.group(1).zfill(3)
-            if oid in OID_MAP:
-                return OID_MAP[oid]
-    try:
-        domain = link.split('//')[-1].split('/')[0].lower()
-        domain = re.sub(r'^(www\.|n\.|news\.|m\.|blog\.|sports\.)', '', domain)
-        for key, name in FIXED_MAP.items():
-            if key in domain:
-                return name
-        return domain.split('.')[0].upper()
-    except Exception:
-        return "기타매체"
-
-
-
-def fetch_naver_article_info(link: str) -> dict:
-    result = {"publisher": publisher_from_url(link), "pick": ""}
-    if "naver.com" not in link:
-        return result
-    try:
-        res = requests.get(link, headers=HEADERS, timeout=REQUEST_TIMEOUT)
-        if res.status_code != 200:
-            return result
-        soup = BeautifulSoup(res.text, 'html.parser')
-
-        publisher = ""
-        logo = soup.select_one('a.press_logo img, .media_end_head_top a img')
-        if logo:
-            publisher = logo.get('alt', '').strip()
-        if not publisher:
-            meta = soup.find('meta', property='og:article:author')
-            if meta:
-                publisher = meta.get('content', '').strip()
-        if not publisher:
-            press_tag = soup.select_one('.media_end_linked_more_point')
-            if press_tag:
-                publisher = press_tag.get_text(strip=True)
-        if publisher:
-            result["publisher"] = publisher
-
-        # ── PICK 여부 ─────────────────────────────────────────
-        if soup.select_one('.is_pick, .media_end_head_journalist_edit_label'):
-            result["pick"] = "PICK"
-        elif "PICK" in res.text:
-            result["pick"] = "PICK"
-
-
-
-    except Exception:
-        pass
-    return result
-
-
-
-# ══════════════════════════════════════════════════════════════
-#  외부 매체 크롤러 (네이버 미등록 4개 매체)
-# ══════════════════════════════════════════════════════════════
-
-def crawl_fi(query: str, since: datetime) -> list:
-    """패션인사이트 fi.co.kr 크롤링"""
-    results = []
-    try:
-        search_url = f"https://www.fi.co.kr/main/list.asp?search={requests.utils.quote(query)}"
-        res = requests.get(search_url, headers=HEADERS, timeout=8)
-        soup = BeautifulSoup(res.text, 'html.parser')
-        for a in soup.select('a[href*="view.asp"]'):
-            title = a.get_text(strip=True)
-            if not title or len(title) < 5:
-                continue
-            href = a['href']
-            if not href.startswith('http'):
-                href = 'https://www.fi.co.kr' + ('' if href.startswith('/') else '/main/') + href.lstrip('/')
-            # 날짜: 상위 태그에서 탐색
-            parent = a.find_parent(['li', 'div', 'tr'])
-            date_txt = ''
-            if parent:
-                import re as _re
-                m = _re.search(r'(\d{4})[.\-/](\d{2})[.\-/](\d{2})', parent.get_text())
-                if m:
-                    date_txt = f"{m.group(1)}-{m.group(2)}-{m.group(3)}"
-            pub_date = None
-            if date_txt:
-                try:
-                    pub_date = datetime.strptime(date_txt, '%Y-%m-%d').replace(
-                        tzinfo=timezone(timedelta(hours=9)))
-                except Exception:
-                    pass
-            if pub_date and pub_date < since:
-                continue
-            results.append({
-                "그룹": "그룹 A", "매체명": "패션인사이트",
-                "제목": f'=HYPERLINK("{href}", "{title}")',
-                "제목_표시": title, "링크": href,
-                "PICK": "",
-                "게시일": pub_date.strftime('%Y-%m-%d') if pub_date else "",
-            })
-    except Exception:
-        pass
-    return results
-
-
-def crawl_itnk(query: str, since: datetime) -> list:
-    """국제섬유신문 itnk.co.kr 크롤링"""
-    results = []
-    try:
-        search_url = f"https://www.itnk.co.kr/news/articleList.html?sc_word={requests.utils.quote(query)}&view_type=sm"
-        res = requests.get(search_url, headers=HEADERS, timeout=8)
-        soup = BeautifulSoup(res.text, 'html.parser')
-        import re as _re
-        for item in soup.select('li.item, div.item, .article-list li'):
-            a = item.find('a', href=True)
-            if not a:
-                continue
-            title = a.get_text(strip=True)
-            if not title or len(title) < 5:
-                continue
-            href = a['href']
-            if not href.startswith('http'):
-                href = 'https://www.itnk.co.kr' + href
-            m = _re.search(r'(\d{4})[.\-/](\d{2})[.\-/](\d{2})', item.get_text())
-            pub_date = None
-            if m:
-                try:
-                    pub_date = datetime.strptime(f"{m.group(1)}-{m.group(2)}-{m.group(3)}", '%Y-%m-%d').replace(
-                        tzinfo=timezone(timedelta(hours=9)))
-                except Exception:
-                    pass
-            if pub_date and pub_date < since:
-                continue
-            results.append({
-                "그룹": "그룹 A", "매체명": "국제섬유신문",
-                "제목": f'=HYPERLINK("{href}", "{title}")',
-                "제목_표시": title, "링크": href,
-                "PICK": "",
-                "게시일": pub_date.strftime('%Y-%m-%d') if pub_date else "",
-            })
-    except Exception:
-        pass
-    return results
-
-
-def crawl_fpost(query: str, since: datetime) -> list:
-    """패션포스트 fpost.co.kr 크롤링"""
-    results = []
-    try:
-        import re as _re
-        search_url = f"https://fpost.co.kr/board/bbs/search.php?bo_table=mainFsp&sfl=wr_subject%2Cwr_content&stx={requests.utils.quote(query)}"
-        res = requests.get(search_url, headers=HEADERS, timeout=8)
-        soup = BeautifulSoup(res.text, 'html.parser')
-        for a in soup.select('a[href*="bo_table=mainFsp"]'):
-            title = a.get_text(strip=True)
-            if not title or len(title) < 5:
-                continue
-            href = a['href']
-            if not href.startswith('http'):
-                href = 'https://fpost.co.kr' + href
-            parent = a.find_parent(['li', 'div', 'tr', 'td'])
-            pub_date = None
-            if parent:
-                m = _re.search(r'(\d{4})[.\-/](\d{2})[.\-/](\d{2})', parent.get_text())
-                if m:
-                    try:
-                        pub_date = datetime.strptime(f"{m.group(1)}-{m.group(2)}-{m.group(3)}", '%Y-%m-%d').replace(
-                            tzinfo=timezone(timedelta(hours=9)))
-                    except Exception:
-                        pass
-            if pub_date and pub_date < since:
-                continue
-            results.append({
-                "그룹": "그룹 A", "매체명": "패션포스트",
-                "제목": f'=HYPERLINK("{href}", "{title}")',
-                "제목_표시": title, "링크": href,
-                "PICK": "",
-                "게시일": pub_date.strftime('%Y-%m-%d') if pub_date else "",
-            })
-    except Exception:
-        pass
-    return results
-
-
-def crawl_tnnews(query: str, since: datetime) -> list:
-    """테넌트뉴스 tnnews.co.kr 크롤링"""
-    results = []
-    try:
-        import re as _re
-        search_url = f"https://tnnews.co.kr/?s={requests.utils.quote(query)}"
-        res = requests.get(search_url, headers=HEADERS, timeout=8)
-        soup = BeautifulSoup(res.text, 'html.parser')
-        for item in soup.select('div.item-details, div.td-module-meta-info'):
-            a = item.find('a', href=True)
-            if not a:
-                continue
-            title = a.get_text(strip=True)
-            if not title or len(title) < 5:
-                continue
-            href = a['href']
-            m = _re.search(r'(\d{4})[.\-/](\d{2})[.\-/](\d{2})', item.get_text())
-            pub_date = None
-            if m:
-                try:
-                    pub_date = datetime.strptime(f"{m.group(1)}-{m.group(2)}-{m.group(3)}", '%Y-%m-%d').replace(
-                        tzinfo=timezone(timedelta(hours=9)))
-                except Exception:
-                    pass
-            if pub_date and pub_date < since:
-                continue
-            results.append({
-                "그룹": "그룹 A", "매체명": "테넌트뉴스",
-                "제목": f'=HYPERLINK("{href}", "{title}")',
-                "제목_표시": title, "링크": href,
-                "PICK": "",
-                "게시일": pub_date.strftime('%Y-%m-%d') if pub_date else "",
-            })
-    except Exception:
-        pass
-    return results
-
-
-EXTRA_CRAWLERS = {
-    "패션인사이트": crawl_fi,
-    "국제섬유신문": crawl_itnk,
-    "패션포스트":   crawl_fpost,
-    "테넌트뉴스":   crawl_tnnews,
-}
-
-def build_excel(df: pd.DataFrame) -> bytes:
-    """DataFrame → 서식 적용 엑셀 바이트 반환"""
-    output = io.BytesIO()
-    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-        df.to_excel(writer, index=False, sheet_name='뉴스클리핑')
-        workbook  = writer.book
-        worksheet = writer.sheets['뉴스클리핑']
-
-        header_fmt = workbook.add_format({
-            'bold': True, 'bg_color': '#2C3E50', 'font_color': '#FFFFFF',
-            'border': 1, 'align': 'center', 'valign': 'vcenter',
-        })
-        for col_num, col_name in enumerate(df.columns):
-            worksheet.write(0, col_num, col_name, header_fmt)
-
-        col_widths = {"그룹": 8, "매체명": 16, "제목": 60, "PICK": 6, "게시일": 18}
-        for col_num, col_name in enumerate(df.columns):
-            worksheet.set_column(col_num, col_num, col_widths.get(col_name, 12))
-
-        border_fmt_cache = {}
-        for row_num, row in df.iterrows():
-            group = row["그룹"]
-            color = GROUP_COLORS.get(group, "#FFFFFF")
-            if color not in border_fmt_cache:
-                border_fmt_cache[color] = workbook.add_format({
-                    'bg_color': color, 'border': 1, 'valign': 'vcenter',
-                })
-            cell_fmt = border_fmt_cache[color]
-            excel_row = row_num + 1
-            for col_num, col_name in enumerate(df.columns):
-                value = row[col_name]
-                if col_name == "제목":
-                    worksheet.write_formula(excel_row, col_num, value, cell_fmt)
-                else:
-                    worksheet.write(excel_row, col_num, value, cell_fmt)
-
-        worksheet.freeze_panes(1, 0)
-        worksheet.autofilter(0, 0, len(df), len(df.columns) - 1)
-
-    return output.getvalue()
-
-
-# ══════════════════════════════════════════════════════════════
-#  핵심 수집 로직 (Streamlit progress bar와 연동)
-# ══════════════════════════════════════════════════════════════
+from datetime import datetime, timedelta
 
-def run_search(query: str, client_id: str, client_secret: str,
-               progress_bar, status_text, days: int = 7) -> pd.DataFrame | None:
-
-    naver_headers = {
-        "X-Naver-Client-Id": client_id,
-        "X-Naver-Client-Secret": client_secret,
-    }
-    kst = timezone(timedelta(hours=9))
-    now = datetime.now(kst)
-    since = now - timedelta(days=days)
-
-    # ── Step 1: API 수집 ──────────────────────────────────────
-    raw_items = []
-    status_text.text(f"🔍 '{query}' 기사 수집 중...")
-    progress_bar.progress(5)
-
-    for start_index in [1, 101]:
-        url = (
-            f"https://openapi.naver.com/v1/search/news.json"
-            f"?query={query}&display=100&start={start_index}&sort=date"
-        )
-        try:
-            res = requests.get(url, headers=naver_headers, timeout=10)
-            if res.status_code != 200:
-                st.error(f"네이버 API 오류: {res.status_code} — API 키를 확인해주세요.")
-                return None
-
-            items = res.json().get('items', [])
-            if not items:
-                break
-
-            stop_early = False
-            for item in items:
-                pub_date = datetime.strptime(
-                    item['pubDate'], '%a, %d %b %Y %H:%M:%S +0900'
-                ).replace(tzinfo=kst)
-                if pub_date < since:
-                    stop_early = True
-                    break
-                raw_items.append({
-                    "pub_date": pub_date,
-                    "link": item.get('link', ''),
-                    "title": clean_html_text(item.get('title', '')),
-                })
-            if stop_early:
-                break
-            time.sleep(0.2)
-
-        except Exception as e:
-            st.error(f"API 요청 오류: {e}")
-            return None
-
-    if not raw_items:
-        st.warning("검색 결과가 없습니다.")
-        return None
-
-    status_text.text(f"📰 {len(raw_items)}개 기사 수집 완료 — 매체명 · PICK 크롤링 중...")
-    progress_bar.progress(20)
-
-    # ── Step 2: 병렬 크롤링 ───────────────────────────────────
-    crawl_results = {}
-    total = len(raw_items)
-
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        future_to_idx = {
-            executor.submit(fetch_naver_article_info, item["link"]): idx
-            for idx, item in enumerate(raw_items)
-        }
-        done = 0
-        for future in as_completed(future_to_idx):
-            idx = future_to_idx[future]
-            try:
-                crawl_results[idx] = future.result()
-            except Exception:
-                crawl_results[idx] = {
-                    "publisher": publisher_from_url(raw_items[idx]["link"]),
-                    "pick": ""
-                }
-            done += 1
-            pct = 20 + int(done / total * 70)   # 20~90% 구간
-            progress_bar.progress(pct)
-            status_text.text(f"🔄 크롤링 진행: {done} / {total}")
-
-    # ── Step 3: DataFrame 구성 ────────────────────────────────
-    status_text.text("📊 데이터 정리 중...")
-    progress_bar.progress(95)
-
-    news_data = []
-    for idx, item in enumerate(raw_items):
-        info      = crawl_results.get(idx, {})
-        publisher = info.get("publisher", "기타매체")
-        pick_val  = info.get("pick", "")
-        group_val = GROUP_MAP.get(publisher, "")
-        link      = item["link"]
-        title     = item["title"].replace('"', "'")
-        news_data.append({
-            "그룹":   group_val,
-            "매체명": publisher,
-            "제목":   f'=HYPERLINK("{link}", "{title}")',
-            "제목_표시": title,   # 화면 표시용 (수식 없는 버전)
-            "링크":   link,
-            "PICK":   pick_val,
-            "게시일": item["pub_date"].strftime('%Y-%m-%d %H:%M'),
-        })
-
-    progress_bar.progress(100)
-    status_text.text("✅ 완료!")
-    return pd.DataFrame(news_data)
+from clipping import KST, run_all_sources
+from clipping.archive import get_archive, search_archive
+from clipping.config import JOB_POLL_INTERVAL, PREVIEW_ROWS
+from clipping.export import EXPORT_FORMATS, available_formats, build_export
+from clipping.prewarm import load_prewarmed, prewarm_query
+from clipping.jobs import JobQueueFull, get_job_manager
+from clipping.publishers import current_mappings
+from clipping.cache import BoundedLRU, frame_fingerprint
+from clipping.table import filter_view, render_table
 
 
 # ══════════════════════════════════════════════════════════════
@@ -603,7 +47,6 @@ try:
     client_id     = st.secrets["naver"]["client_id"]
     client_secret = st.secrets["naver"]["client_secret"]
 except Exception:
-    import os
     client_id     = os.environ.get("NAVER_CLIENT_ID", "")
     client_secret = os.environ.get("NAVER_CLIENT_SECRET", "")
 
@@ -626,6 +69,15 @@ with st.sidebar:
     st.markdown("**수집 기간**")
     days = st.slider("기사 게재일 기준", min_value=1, max_value=7, value=7, step=1,
                      format="%d일")
+    incremental = st.checkbox(
+        "빠른 새로고침 (증분 검색)", value=True,
+        help="같은 검색어·기간으로 최근에 검색한 결과가 있으면 그 이후의 새 기사만 수집해 합칩니다.",
+    )
+    refresh_prewarmed = st.checkbox(
+        "미리 수집한 결과에 새 기사 반영", value=True,
+        help="예약 수집(python -m clipping.prewarm)해 둔 키워드는 저장된 결과를 바로 보여줍니다. "
+             "켜 두면 그 이후의 새 기사를 이어서 수집해 반영합니다.",
+    )
     st.divider()
     st.markdown("**추가 매체 수집** (네이버 미등록)")
     extra_fi    = st.checkbox("패션인사이트", value=True)
@@ -634,64 +86,207 @@ with st.sidebar:
     extra_tn    = st.checkbox("테넌트뉴스",   value=True)
 
 # ── 메인: 검색 입력 ───────────────────────────────────────────
+toggle_col1, toggle_col2 = st.columns(2)
+with toggle_col1:
+    batch_mode = st.toggle("여러 키워드 일괄 검색", value=False,
+                           help="한 줄에 키워드 하나씩 입력하면 한 번에 수집합니다.")
+with toggle_col2:
+    archive_mode = st.toggle("📚 아카이브에서 검색", value=False,
+                             help="지금까지 수집한 기사를 네트워크 없이 찾습니다 (7일 제한 없음).")
+archive = get_archive() if archive_mode else None
+if archive_mode:
+    if archive is None:
+        st.error("아카이브를 열 수 없습니다.")
+    else:
+        info = archive.stats()
+        today = datetime.now(KST).date()
+        arch_col1, arch_col2 = st.columns([2, 3])
+        with arch_col1:
+            date_range = st.date_input("게시일 범위", value=(today - timedelta(days=90), today),
+                                       max_value=today)
+        with arch_col2:
+            publisher_filter = st.multiselect("매체", options=archive.publishers(),
+                                              placeholder="전체 매체")
+        if info["articles"]:
+            st.caption(f"보관 기사 {info['articles']:,}건 · "
+                       f"{info['oldest']:%Y-%m-%d} ~ {info['newest']:%Y-%m-%d}"
+                       " · 검색어를 비우면 기간 · 매체 조건만으로 찾습니다.")
+        else:
+            st.caption("아직 보관된 기사가 없습니다. 검색을 하면 결과가 자동으로 쌓입니다.")
 col_input, col_btn = st.columns([4, 1])
 with col_input:
-    query = st.text_input(
-        "검색어",
-        placeholder="예: 패션 트렌드",
-        label_visibility="collapsed"
-    )
+    if batch_mode:
+        query = st.text_area(
+            "검색어",
+            placeholder="한 줄에 하나씩 입력\n예: 패션 트렌드\n브랜드 A",
+            height=150,
+            label_visibility="collapsed"
+        )
+    else:
+        query = st.text_input(
+            "검색어",
+            placeholder="예: 패션 트렌드",
+            label_visibility="collapsed"
+        )
 with col_btn:
     search_clicked = st.button("🔍 검색", use_container_width=True, type="primary")
 
-# ── 검색 실행 ─────────────────────────────────────────────────
+# ── 검색 실행 (프로세스 공용 작업 관리자에 맡김) ───────────
+# 검색은 백그라운드 워커에서 돌고, 화면은 작업 ID로 진행 상태만 가져온다
+if "session_id" not in st.session_state:
+    st.session_state["session_id"] = uuid.uuid4().hex
+job_manager = get_job_manager()
+
 if search_clicked:
-    if not query.strip():
+    queries = [line.strip() for line in query.splitlines() if line.strip()]
+    if not batch_mode:
+        queries = [query.strip()] if query.strip() else []
+    if archive_mode:
+        # 로컬 색인 조회라 작업 관리자를 거치지 않고 바로 결과를 띄운다
+        if archive is not None:
+            start_date, end_date = (tuple(date_range) * 2)[:2] if date_range else (None, None)
+            df = search_archive(
+                queries,
+                datetime.combine(start_date, datetime.min.time(), KST) if start_date else None,
+                datetime.combine(end_date + timedelta(days=1), datetime.min.time(), KST)
+                if end_date else None,
+                publishers=tuple(publisher_filter),
+            )
+            if df is None or df.empty:
+                st.warning("검색 결과가 없습니다.")
+            else:
+                st.session_state["df"]    = df
+                st.session_state["df_hash"] = frame_fingerprint(df)
+                st.session_state["query"] = "아카이브_" + (
+                    "전체" if not queries else
+                    queries[0] if len(queries) == 1 else f"{queries[0]}_외{len(queries) - 1}건"
+                )
+                st.session_state["days"]  = days
+                st.session_state["table_page"] = 1
+                st.session_state.pop("prewarmed_at", None)
+    elif not queries:
         st.warning("검색어를 입력해주세요.")
-    elif not client_id or not client_secret:
-        st.error("API 키가 설정되지 않았습니다. Streamlit Secrets를 확인해주세요.")
+    elif getattr(job_manager.get(st.session_state.get("job_id")), "active", False):
+        st.warning("이전 검색이 아직 진행 중입니다.")
     else:
-        progress_bar = st.progress(0)
-        status_text  = st.empty()
-
-        df = run_search(query.strip(), client_id, client_secret,
-                        progress_bar, status_text, days)
-
-        if df is not None and not df.empty:
-            # ── 외부 매체 크롤링 병합 ─────────────────────────
-            kst_now  = datetime.now(timezone(timedelta(hours=9)))
-            since_dt = kst_now - timedelta(days=days)
-            extra_rows = []
-            selected_extras = {
-                "패션인사이트": extra_fi,
-                "국제섬유신문": extra_itnk,
-                "패션포스트":   extra_fpost,
-                "테넌트뉴스":   extra_tn,
-            }
-            for name, enabled in selected_extras.items():
-                if enabled:
-                    status_text.text(f"🔍 {name} 크롤링 중...")
-                    rows = EXTRA_CRAWLERS[name](query.strip(), since_dt)
-                    extra_rows.extend(rows)
-
-            if extra_rows:
-                df_extra = pd.DataFrame(extra_rows)
-                df = pd.concat([df, df_extra], ignore_index=True)
-
-            # 세션에 저장 (그룹 필터링 등 후속 조작을 위해)
-            st.session_state["df"]    = df
-            st.session_state["query"] = query.strip()
+        extras = [name for name, enabled in {
+            "패션인사이트": extra_fi,
+            "국제섬유신문": extra_itnk,
+            "패션포스트":   extra_fpost,
+            "테넌트뉴스":   extra_tn,
+        }.items() if enabled]
+        search_args = dict(days=days, extras=extras, batch=batch_mode, incremental=incremental)
+
+        def search(job) -> pd.DataFrame | None:
+            return run_all_sources(queries, client_id, client_secret, job.progress,
+                                   preview=job.preview, **search_args)
+
+        # 예약 수집(clipping.prewarm) 결과가 있으면 바로 보여주고,
+        # 그 이후의 새 기사는 백그라운드 작업으로 반영한다 (미리보기 없이)
+        prewarmed = None if batch_mode else load_prewarmed(queries[0], days, extras)
+        if prewarmed is not None:
+            st.session_state["df"]    = prewarmed["frame"]
+            st.session_state["df_hash"] = frame_fingerprint(prewarmed["frame"])
+            st.session_state["query"] = queries[0]
             st.session_state["days"]  = days
+            st.session_state["table_page"] = 1
+            st.session_state["prewarmed_at"] = prewarmed["saved_at"]
+
+            def search(job) -> pd.DataFrame | None:
+                return prewarm_query(queries[0], client_id, client_secret, job.progress,
+                                     days, extras)
+
+        if prewarmed is not None and not refresh_prewarmed:
+            pass
+        elif not client_id or not client_secret:
+            st.error("API 키가 설정되지 않았습니다. Streamlit Secrets를 확인해주세요.")
+        else:
+            try:
+                job = job_manager.submit(st.session_state["session_id"], ", ".join(queries),
+                                         search)
+            except JobQueueFull as e:
+                st.warning(str(e))
+            else:
+                st.session_state["job_id"] = job.id
+                st.session_state["job_query"] = (
+                    queries[0] if len(queries) == 1 else f"{queries[0]}_외{len(queries) - 1}건"
+                )
+                st.session_state["job_days"] = days
+
+
+# ── 진행 상태 (JOB_POLL_INTERVAL마다 이 fragment만 다시 실행) ──
+@st.fragment(run_every=JOB_POLL_INTERVAL)
+def show_job() -> None:
+    job = job_manager.get(st.session_state.get("job_id"))
+    if job is None:
+        st.session_state.pop("job_id", None)
+        return
+
+    if job.active:
+        if job.status == "queued":
+            col_wait, col_cancel = st.columns([4, 1])
+            col_wait.info(f"⏳ 대기 중 — 앞에 {job_manager.position(job)}건의 검색이 있습니다.")
+            if col_cancel.button("취소", use_container_width=True):
+                job_manager.cancel(job.id)
+                st.rerun()
+        st.progress(job.pct)
+        st.text(job.message)
+        df_partial = job.partial
+        if df_partial is not None and not df_partial.empty:
+            # 크롤링 중간 결과: 최신 기사 순 상위 PREVIEW_ROWS건만 그림
+            # (같은 내용의 행 HTML은 캐시되므로 바뀐 행만 새로 만든다)
+            df_partial = df_partial.sort_values("게시일", ascending=False)
+            st.caption(f"⏳ 미리보기 {len(df_partial)}건 — 매체명 · PICK 확인 중 (최신 {PREVIEW_ROWS}건 표시)")
+            st.markdown(render_table(df_partial, 0, min(PREVIEW_ROWS, len(df_partial))),
+                        unsafe_allow_html=True)
+        return
+
+    # ── 끝난 작업: 결과를 세션으로 옮기고 전체 화면 갱신 ──────
+    df = job.result
+    if job.report is not None:
+        st.session_state["last_report"] = job.report
+    if job.status == "failed":
+        st.session_state["job_notice"] = ("error", job.error)
+    elif job.status == "done" and (df is None or df.empty):
+        st.session_state["job_notice"] = ("warning", "검색 결과가 없습니다.")
+    elif job.status == "done":
+        # 세션에 저장 (그룹 필터링 등 후속 조작을 위해)
+        st.session_state["df"]    = df
+        st.session_state["df_hash"] = frame_fingerprint(df)
+        st.session_state["query"] = st.session_state["job_query"]
+        st.session_state["days"]  = st.session_state["job_days"]
+        st.session_state["table_page"] = 1
+        st.session_state.pop("prewarmed_at", None)
+    st.session_state.pop("job_id", None)
+    job_manager.forget(job.id)
+    st.rerun()
+
+
+if "job_id" in st.session_state:
+    show_job()
+if "job_notice" in st.session_state:
+    kind, message = st.session_state.pop("job_notice")
+    (st.error if kind == "error" else st.warning)(message)
 
 # ── 결과 표시 ─────────────────────────────────────────────────
 if "df" in st.session_state:
     df    = st.session_state["df"]
     query = st.session_state["query"]
+    if "df_hash" not in st.session_state:
+        st.session_state["df_hash"] = frame_fingerprint(df)
+    # 필터 뷰 · 엑셀 바이트 캐시 (세션별, 최근 변형 몇 개만 유지)
+    if "view_cache" not in st.session_state:
+        st.session_state["view_cache"] = BoundedLRU()
+    view_cache = st.session_state["view_cache"]
 
-    kst = timezone(timedelta(hours=9))
-    now = datetime.now(kst)
+    now = datetime.now(KST)
 
     st.divider()
+    if "prewarmed_at" in st.session_state:
+        saved_at = datetime.fromtimestamp(st.session_state["prewarmed_at"], KST)
+        refreshing = "job_id" in st.session_state
+        st.info(f"🌅 {saved_at:%m/%d %H:%M}에 예약 수집한 결과입니다."
+                + (" 이후의 새 기사를 반영하는 중..." if refreshing else ""))
 
     # 요약 지표
     total   = len(df)
@@ -699,7 +294,7 @@ if "df" in st.session_state:
     cnt_b   = (df["그룹"] == "그룹 B").sum()
     cnt_c   = (df["그룹"] == "그룹 C").sum()
     cnt_etc = (df["그룹"] == "").sum()
-    cnt_pick = (df["PICK"] == "PICK").sum()
+    cnt_pick = df["PICK"].sum()
 
     m1, m2, m3, m4, m5, m6 = st.columns(6)
     m1.metric("전체", f"{total}건")
@@ -721,6 +316,10 @@ if "df" in st.session_state:
         )
     with filter_col2:
         pick_filter = st.checkbox("PICK 기사만 보기", value=False)
+        collapse = st.checkbox(
+            "유사 기사 묶기", value=False,
+            help="같은 기사를 여러 매체가 고쳐 쓴 경우 묶음마다 한 건만 표시 · 내보냅니다.",
+        )
     with filter_col3:
         keyword_filter = st.text_input("제목 키워드 필터", placeholder="추가 필터...")
 
@@ -740,80 +339,108 @@ if "df" in st.session_state:
             index=0,
         )
 
-    # 필터 적용
-    mask = pd.Series([True] * len(df), index=df.index)
-
-    # 그룹 필터 (미분류 = "")
-    selected_groups = [("" if g == "미분류" else g) for g in group_filter]
-    mask &= df["그룹"].isin(selected_groups)
+    # 필터 · 정렬 적용 (데이터 해시 + 조건이 같으면 캐시된 뷰 재사용)
+    ascending = (sort_order == "오름차순 ↑")
+    view_key = (st.session_state["df_hash"], tuple(group_filter), pick_filter,
+                keyword_filter.strip(), sort_by, ascending, collapse)
+    df_filtered = view_cache.get_or_build(
+        ("view",) + view_key,
+        lambda: filter_view(df, group_filter, pick_filter, keyword_filter,
+                            sort_by, ascending, collapse),
+    )
 
-    if pick_filter:
-        mask &= df["PICK"] == "PICK"
-    if keyword_filter.strip():
-        mask &= df["제목_표시"].str.contains(keyword_filter.strip(), case=False, na=False)
+    if collapse and "유사기사" in df_filtered.columns:
+        st.caption(f"필터 결과: {len(df_filtered)}건 (유사 기사 묶음 기준)")
+    else:
+        st.caption(f"필터 결과: {len(df_filtered)}건")
+
+    # ── 테이블 렌더링 (HTML, 페이지 단위) ───────────────────
+    # 페이지 이동은 이 fragment만 다시 실행하므로 필터 · 엑셀은 재계산되지 않는다
+    @st.fragment
+    def show_table(df_view: pd.DataFrame) -> None:
+        total_rows = len(df_view)
+        page_size  = st.session_state.get("table_page_size", 100)
+        n_pages    = max(1, -(-total_rows // page_size))
+        if st.session_state.get("table_page", 1) > n_pages:
+            st.session_state["table_page"] = n_pages
+
+        start = (st.session_state.get("table_page", 1) - 1) * page_size
+        stop  = min(start + page_size, total_rows)
+        st.markdown(render_table(df_view, start, stop), unsafe_allow_html=True)
+
+        page_col1, page_col2, page_col3 = st.columns([2, 2, 4])
+        with page_col1:
+            st.number_input("페이지", min_value=1, max_value=n_pages, step=1, key="table_page")
+        with page_col2:
+            st.selectbox("페이지당 행 수", options=[50, 100, 200, 500], index=1, key="table_page_size")
+        with page_col3:
+            st.caption(f"{start + 1 if total_rows else 0}–{stop} / {total_rows}건 · {n_pages}페이지")
+
+    show_table(df_filtered)
+
+    # ── 다운로드 (엑셀 · CSV · JSON Lines · Parquet ...) ──────
+    st.divider()
+    # 엑셀: 그룹 · 매체명 · 제목(HYPERLINK 수식) · PICK · 게시일 (+ 키워드)
+    # 데이터 형식(CSV · JSON · Parquet)은 제목 · 링크를 따로 담는다
+    formats = [fmt for fmt in available_formats()
+               if fmt != "sheets" or "키워드" in df_filtered.columns]
+    col_fmt, col_download = st.columns([1, 3])
+    with col_fmt:
+        export_fmt = st.selectbox("내보내기 형식", options=formats,
+                                  format_func=lambda fmt: EXPORT_FORMATS[fmt]["label"],
+                                  label_visibility="collapsed")
+
+    def export_bytes() -> bytes:
+        # 다운로드 버튼을 누를 때만 만든다 (필터 조작마다 다시 만들지 않음)
+        return view_cache.get_or_build(
+            (export_fmt,) + view_key,
+            lambda: build_export(df_filtered, export_fmt, query),
+        )
 
-    df_filtered = df[mask].reset_index(drop=True)
+    spec = EXPORT_FORMATS[export_fmt]
+    file_name = f"naver_news_{query}_{now.strftime('%Y%m%d_%H%M%S')}.{spec['ext']}"
+
+    with col_download:
+        st.download_button(
+            label=f"📥 {spec['label']} 다운로드",
+            data=export_bytes,
+            file_name=file_name,
+            mime=spec["mime"],
+            use_container_width=True,
+            type="primary",
+        )
 
-    # 정렬 적용
-    sort_col_map = {"게시일": "게시일", "그룹": "그룹", "매체명": "매체명", "제목": "제목_표시"}
-    ascending = (sort_order == "오름차순 ↑")
-    df_filtered = df_filtered.sort_values(
-        by=sort_col_map[sort_by], ascending=ascending
-    ).reset_index(drop=True)
-
-    st.caption(f"필터 결과: {len(df_filtered)}건")
-
-    # ── 테이블 렌더링 (HTML) ──────────────────────────────────
-    def render_table(df_view: pd.DataFrame) -> str:
-        rows_html = ""
-        for _, row in df_view.iterrows():
-            group     = row["그룹"]
-            badge_style = GROUP_BADGE.get(group, GROUP_BADGE[""])
-            badge     = f'<span style="{badge_style}">{group if group else "미분류"}</span>'
-            pick_html  = '<span style="color:#e74c3c;font-weight:bold;">PICK</span>' if row["PICK"] == "PICK" else ""
-            title_html = f'<a href="{row["링크"]}" target="_blank" style="text-decoration:none;color:#1a73e8;">{row["제목_표시"]}</a>'
-            row_bg = GROUP_COLORS.get(group, "#FFFFFF")
-            rows_html += f"""
-            <tr style="background:{row_bg};">
-                <td style="padding:6px 10px;border-bottom:1px solid #eee;white-space:nowrap;">{badge}</td>
-                <td style="padding:6px 10px;border-bottom:1px solid #eee;white-space:nowrap;font-weight:500;">{row["매체명"]}</td>
-                <td style="padding:6px 10px;border-bottom:1px solid #eee;">{title_html}</td>
-                <td style="padding:6px 10px;border-bottom:1px solid #eee;text-align:center;">{pick_html}</td>
-                <td style="padding:6px 10px;border-bottom:1px solid #eee;white-space:nowrap;color:#666;font-size:0.85em;">{row["게시일"]}</td>
-            </tr>"""
-
-        return f"""
-        <style>
-            .clip-table {{ width:100%; border-collapse:collapse; font-size:0.9rem; }}
-            .clip-table th {{ background:#2C3E50; color:#fff; padding:8px 10px;
-                              text-align:left; position:sticky; top:0; }}
-            .clip-table tr:hover {{ filter: brightness(0.96); }}
-        </style>
-        <div style="overflow-x:auto; max-height:600px; overflow-y:auto;">
-        <table class="clip-table">
-            <thead>
-                <tr>
-                    <th>그룹</th><th>매체명</th><th>제목</th><th>PICK</th><th>게시일</th>
-                </tr>
-            </thead>
-            <tbody>{rows_html}</tbody>
-        </table>
-        </div>"""
-
-    st.markdown(render_table(df_filtered), unsafe_allow_html=True)
-
-    # ── 엑셀 다운로드 ─────────────────────────────────────────
-    st.divider()
-    # 엑셀용 df (제목_표시, 링크 컬럼 제거, 제목은 HYPERLINK 수식 유지)
-    df_excel = df_filtered[["그룹", "매체명", "제목", "PICK", "게시일"]].reset_index(drop=True)
-    excel_bytes = build_excel(df_excel)
-    file_name   = f"naver_news_{query}_{now.strftime('%Y%m%d_%H%M%S')}.xlsx"
-
-    st.download_button(
-        label="📥 엑셀 다운로드",
-        data=excel_bytes,
-        file_name=file_name,
-        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        use_container_width=True,
-        type="primary",
-    )
+# ── 진단 패널 (마지막 검색의 구간 · 호스트별 소요 시간) ──────
+if "last_report" in st.session_state:
+    report = st.session_state["last_report"]
+    with st.sidebar:
+        st.divider()
+        with st.expander("🩺 진단 (마지막 검색)"):
+            st.caption(f"{report['label']} · {report['started']} · 총 {report['elapsed_s']:.1f}초")
+
+            st.markdown("**구간별 소요 시간**")
+            st.dataframe(
+                pd.DataFrame([
+                    {"구간": name, "초": s["seconds"], "횟수": s["count"]}
+                    for name, s in sorted(report["stages"].items(),
+                                          key=lambda kv: -kv[1]["seconds"])
+                ]),
+                hide_index=True, use_container_width=True,
+            )
+
+            if report["hosts"]:
+                st.markdown("**호스트별 요청**")
+                st.dataframe(
+                    pd.DataFrame([
+                        {"호스트": host, "요청": h["requests"], "오류": h["errors"],
+                         "p50(ms)": h["p50_ms"], "p95(ms)": h["p95_ms"],
+                         "KB": round(h["bytes"] / 1024), "대기열": h["queue_max"]}
+                        for host, h in report["hosts"].items()
+                    ]),
+                    hide_index=True, use_container_width=True,
+                )
+
+            for name, c in report["caches"].items():
+                rate = "-" if c["hit_rate"] is None else f"{c['hit_rate']:.0%}"
+                st.caption(f"캐시 {name}: 적중 {c['hit']} · 미스 {c['miss']} ({rate})")
+            st.caption(f"매체 매핑 버전 {current_mappings().version}")
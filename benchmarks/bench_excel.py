@@ -0,0 +1,120 @@
+# ============================================================
+#  엑셀 내보내기 벤치마크 (시간 · 최대 RSS)
+#
+#  실행 방법:
+#    python benchmarks/bench_excel.py                 # 1k / 10k / 100k 행
+#    python benchmarks/bench_excel.py 5000 50000      # 행 수 지정
+#
+#  구현 · 행 수 조합마다 별도 프로세스에서 실행한다.
+#  RSS 증가분 = 엑셀 작성 중 최대 RSS - 작성 직전 RSS (rss.PeakRss)
+# ============================================================
+
+import io
+import os
+import sys
+import json
+import time
+import tempfile
+import subprocess
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from rss import PeakRss  # noqa: E402
+
+IMPLS = ("legacy", "stream-bytes", "stream-file")
+
+
+def build_excel_legacy(df) -> bytes:
+    """개선 전 구현 (to_excel 후 iterrows로 전체 셀 재기록, 비교 기준)"""
+    import pandas as pd
+    from clipping.config import GROUP_COLORS
+
+    output = io.BytesIO()
+    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
+        df.to_excel(writer, index=False, sheet_name='뉴스클리핑')
+        workbook  = writer.book
+        worksheet = writer.sheets['뉴스클리핑']
+        header_fmt = workbook.add_format({
+            'bold': True, 'bg_color': '#2C3E50', 'font_color': '#FFFFFF',
+            'border': 1, 'align': 'center', 'valign': 'vcenter',
+        })
+        for col_num, col_name in enumerate(df.columns):
+            worksheet.write(0, col_num, col_name, header_fmt)
+        border_fmt_cache = {}
+        for row_num, row in df.iterrows():
+            color = GROUP_COLORS.get(row["그룹"], "#FFFFFF")
+            if color not in border_fmt_cache:
+                border_fmt_cache[color] = workbook.add_format({
+                    'bg_color': color, 'border': 1, 'valign': 'vcenter',
+                })
+            cell_fmt = border_fmt_cache[color]
+            for col_num, col_name in enumerate(df.columns):
+                value = row[col_name]
+                if col_name == "제목":
+                    worksheet.write_formula(row_num + 1, col_num, value, cell_fmt)
+                else:
+                    worksheet.write(row_num + 1, col_num, value, cell_fmt)
+        worksheet.freeze_panes(1, 0)
+        worksheet.autofilter(0, 0, len(df), len(df.columns) - 1)
+    return output.getvalue()
+
+
+def make_frame(rows: int):
+    from datetime import datetime, timedelta
+    from clipping.config import KST
+    from clipping.frame import make_frame as build_frame
+
+    groups = ["그룹 A", "그룹 B", "그룹 C", ""]
+    base = datetime(2024, 5, 1, 9, tzinfo=KST)
+    return build_frame(
+        groups=[groups[i % 4] for i in range(rows)],
+        publishers=[f"매체{i % 150}" for i in range(rows)],
+        titles=[f"테스트 기사 제목 {i} — 패션 트렌드 브랜드 동향" for i in range(rows)],
+        links=[f"https://n.news.naver.com/mnews/article/001/{i:010d}" for i in range(rows)],
+        picks=[i % 9 == 0 for i in range(rows)],
+        pub_dates=[base + timedelta(minutes=i) for i in range(rows)],
+    )
+
+
+def run_one(impl: str, rows: int) -> dict:
+    from clipping.excel import build_excel, write_excel
+
+    df = make_frame(rows)
+    with PeakRss() as mem:
+        t0 = time.perf_counter()
+        if impl == "legacy":
+            from clipping.frame import export_frame
+            size = len(build_excel_legacy(export_frame(df)))
+        elif impl == "stream-bytes":
+            size = len(build_excel(df))
+        else:
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, "out.xlsx")
+                write_excel(df, path)
+                size = os.path.getsize(path)
+        elapsed = time.perf_counter() - t0
+    return {"impl": impl, "rows": rows, "seconds": elapsed,
+            "rss_delta_mb": mem.delta_mb, "bytes": size}
+
+
+def main() -> None:
+    if len(sys.argv) > 2 and sys.argv[1] == "--one":
+        print(json.dumps(run_one(sys.argv[2], int(sys.argv[3]))))
+        return
+
+    sizes = [int(a) for a in sys.argv[1:]] or [1_000, 10_000, 100_000]
+    print(f"{'impl':14s} {'rows':>8s} {'time(s)':>9s} {'rows/s':>10s} {'ΔRSS(MB)':>9s} {'size(KB)':>9s}")
+    for rows in sizes:
+        for impl in IMPLS:
+            out = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--one", impl, str(rows)],
+                capture_output=True, text=True, check=True,
+            ).stdout
+            r = json.loads(out.strip().splitlines()[-1])
+            print(f"{impl:14s} {rows:8,d} {r['seconds']:9.2f} {rows / r['seconds']:10,.0f} "
+                  f"{r['rss_delta_mb']:9.1f} {r['bytes'] / 1024:9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# ============================================================
+#  내보내기 형식별 벤치마크 (시간 · 최대 RSS)
+#
+#  실행 방법:
+#    python benchmarks/bench_export.py                 # 10k / 100k 행
+#    python benchmarks/bench_export.py 50000 300000    # 행 수 지정
+#
+#  형식마다 한 번에 변환하는 방식(whole, 개선 전 CLI와 같은 방식)과
+#  clipping.export의 조각 단위 기록(stream)을 파일로 써서 비교한다.
+#  조합마다 별도 프로세스에서 실행하고, RSS 증가분은 기록 중 최대 RSS -
+#  기록 직전 RSS (rss.PeakRss)다.
+# ============================================================
+
+import os
+import sys
+import json
+import time
+import tempfile
+import subprocess
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+
+from bench_excel import make_frame  # noqa: E402
+from rss import PeakRss  # noqa: E402
+
+FORMATS = ("csv", "jsonl", "parquet", "sheets")
+
+
+def write_whole(df, path: str, fmt: str) -> None:
+    """전체 프레임을 한 번에 변환해 기록 (비교 기준)"""
+    from clipping.frame import export_frame
+
+    if fmt == "csv":
+        export_frame(df, hyperlink=False).to_csv(path, index=False, encoding="utf-8-sig")
+    elif fmt == "jsonl":
+        df.to_json(path, orient="records", lines=True, force_ascii=False, date_format="iso")
+    elif fmt == "parquet":
+        df.to_parquet(path, index=False)
+    else:
+        from clipping.excel import write_excel
+        write_excel(df, path)
+
+
+def run_one(impl: str, fmt: str, rows: int) -> dict:
+    from clipping.export import write_export
+
+    df = make_frame(rows)
+    df["키워드"] = [("패션 트렌드", "브랜드 A", "소재")[i % 3] for i in range(rows)]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "out")
+        with PeakRss() as mem:
+            t0 = time.perf_counter()
+            if impl == "whole":
+                write_whole(df, path, fmt)
+            else:
+                write_export(df, path, fmt)
+            elapsed = time.perf_counter() - t0
+        size = os.path.getsize(path)
+    return {"seconds": elapsed, "rss_delta_mb": mem.delta_mb, "bytes": size}
+
+
+def main() -> None:
+    if len(sys.argv) > 2 and sys.argv[1] == "--one":
+        print(json.dumps(run_one(sys.argv[2], sys.argv[3], int(sys.argv[4]))))
+        return
+
+    sizes = [int(a) for a in sys.argv[1:]] or [10_000, 100_000]
+    print(f"{'format':8s} {'impl':7s} {'rows':>8s} {'time(s)':>9s} {'rows/s':>10s} "
+          f"{'ΔRSS(MB)':>9s} {'size(KB)':>9s}")
+    for rows in sizes:
+        for fmt in FORMATS:
+            # sheets(키워드별 시트)는 기존에 없던 형식 → 한 시트 엑셀과 비교
+            for impl in ("whole", "stream"):
+                out = subprocess.run(
+                    [sys.executable, os.path.abspath(__file__), "--one", impl, fmt, str(rows)],
+                    capture_output=True, text=True, check=True,
+                ).stdout
+                r = json.loads(out.strip().splitlines()[-1])
+                print(f"{fmt:8s} {impl:7s} {rows:8,d} {r['seconds']:9.2f} {rows / r['seconds']:10,.0f} "
+                      f"{r['rss_delta_mb']:9.1f} {r['bytes'] / 1024:9.0f}")
+
+
+if __name__ == "__main__":
+    main()
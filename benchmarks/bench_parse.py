@@ -0,0 +1,120 @@
+# ============================================================
+#  HTML 파싱 벤치마크 (기사 페이지 · 추가 매체 검색 페이지)
+#
+#  실행 방법:
+#    python benchmarks/bench_parse.py
+#    python benchmarks/bench_parse.py --page-kb 300 --repeat 50
+#
+#  fixtures/article_*.html (<!--BODY--> 자리에 --page-kb 만큼 본문)과
+#  fixtures/extra_*.html 을 설치된 파서 백엔드마다 파싱해 페이지당 시간을 비교한다.
+#    article  : parse_article_html (페이지 전체)
+#    stream   : make_head_parser로 16KB 조각 스트리밍 (본문 시작 시 중단)
+#    extras   : 매체 검색 페이지 → 행 목록 (parse_site)
+#  html.parser 결과를 기준으로 다른 백엔드의 결과가 같은지도 확인한다.
+# ============================================================
+
+import os
+import sys
+import time
+import argparse
+from datetime import datetime, timedelta, timezone
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+FIXTURES = os.path.join(HERE, "fixtures")
+
+from clipping import parsing  # noqa: E402
+from clipping.articles import parse_article_html, make_head_parser  # noqa: E402
+from clipping.config import STREAM_CHUNK_SIZE  # noqa: E402
+from clipping.extras import parse_site  # noqa: E402
+
+EXTRA_FIXTURES = {
+    "패션인사이트": ("extra_fi.html", "https://www.fi.co.kr/main/list.asp?search=x"),
+    "국제섬유신문": ("extra_itnk.html", "https://www.itnk.co.kr/news/articleList.html?sc_word=x"),
+    "패션포스트": ("extra_fpost.html", "https://fpost.co.kr/board/bbs/search.php?stx=x"),
+    "테넌트뉴스": ("extra_tnnews.html", "https://tnnews.co.kr/?s=x"),
+}
+SINCE = datetime(2000, 1, 1, tzinfo=timezone(timedelta(hours=9)))
+
+
+def load_articles(page_kb: int) -> list:
+    filler = "<p>" + "본문 문단입니다. " * 40 + "</p>\n"
+    body = filler * max(1, page_kb * 1024 // len(filler.encode()))
+    pages = []
+    for name in sorted(os.listdir(FIXTURES)):
+        if name.startswith("article_") and name.endswith(".html"):
+            with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+                pages.append(f.read().replace("<!--BODY-->", body))
+    return pages
+
+
+def load_extras() -> list:
+    pages = []
+    for name, (filename, url) in EXTRA_FIXTURES.items():
+        with open(os.path.join(FIXTURES, filename), encoding="utf-8") as f:
+            pages.append((name, f.read(), url))
+    return pages
+
+
+def use_backend(name: str) -> bool:
+    parsing.get_backend.cache_clear()
+    parsing.compile_css.cache_clear()
+    parsing.HTML_PARSER = name
+    return parsing.get_backend().name == name
+
+
+def stream(page: bytes) -> dict:
+    parser = make_head_parser()
+    for i in range(0, len(page), STREAM_CHUNK_SIZE):
+        if parser.feed_bytes(page[i:i + STREAM_CHUNK_SIZE]):
+            break
+    return parser.apply({"publisher": "", "pick": ""})
+
+
+def run_backend(articles: list, extras: list, repeat: int) -> tuple:
+    """→ (구간별 페이지당 ms, 결과) — 결과는 기준 백엔드와 비교용"""
+    encoded = [page.encode() for page in articles]
+    tasks = {
+        "article": (articles, lambda page: parse_article_html(page, {"publisher": "", "pick": ""})),
+        "stream": (encoded, stream),
+        "extras": (extras, lambda x: parse_site(x[0], x[1], x[2], SINCE)),
+    }
+    timings, outputs = {}, {}
+    for task, (pages, fn) in tasks.items():
+        outputs[task] = [fn(page) for page in pages]    # 워밍업 겸 결과 수집
+        started = time.perf_counter()
+        for _ in range(repeat):
+            for page in pages:
+                fn(page)
+        timings[task] = (time.perf_counter() - started) / (repeat * len(pages)) * 1000
+    return timings, outputs
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="HTML 파싱 벤치마크")
+    parser.add_argument("--page-kb", type=int, default=150, help="기사 페이지 본문 크기 (KB)")
+    parser.add_argument("--repeat", type=int, default=20, help="페이지당 반복 횟수")
+    args = parser.parse_args()
+
+    articles, extras = load_articles(args.page_kb), load_extras()
+    print(f"기사 {len(articles)}쪽 ({args.page_kb}KB) · 매체 검색 페이지 {len(extras)}쪽 · 반복 {args.repeat}")
+    print(f"{'backend':>12s} {'article':>10s} {'stream':>10s} {'extras':>10s}  결과")
+
+    reference, mismatch = None, False
+    for name in reversed(list(parsing._BACKENDS)):     # html.parser(기준)부터
+        if not use_backend(name):
+            print(f"{name:>12s}  (미설치)")
+            continue
+        timings, outputs = run_backend(articles, extras, args.repeat)
+        if reference is None:
+            reference, status = outputs, "기준"
+        else:
+            same = outputs == reference
+            mismatch |= not same
+            status = "일치" if same else "불일치!"
+        print(f"{name:>12s} " + " ".join(f"{timings[t]:8.2f}ms" for t in timings) + f"  {status}")
+    return 1 if mismatch else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+# ============================================================
+#  publisher_from_url 마이크로 벤치마크
+#
+#  실행 방법:
+#    python benchmarks/bench_publisher.py                # 합성 링크 코퍼스
+#    python benchmarks/bench_publisher.py links.txt      # 기록된 링크 (한 줄에 하나)
+#
+#  기존 선형 FIXED_MAP 스캔과 DomainIndex 기반 조회를 같은 코퍼스로 비교하고,
+#  결과가 달라지는 링크(짧은 키가 긴 키를 가리던 경우)를 출력한다.
+# ============================================================
+
+import os
+import re
+import sys
+import random
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from clipping import publishers  # noqa: E402
+
+
+def publisher_from_url_linear(link: str) -> str:
+    """개선 전 구현 (비교 기준)"""
+    if "naver.com" in link:
+        m = re.search(r'article/(\d+)/', link)
+        if m:
+            oid = m.group(1).zfill(3)
+            if oid in publishers.OID_MAP:
+                return publishers.OID_MAP[oid]
+    try:
+        domain = link.split('//')[-1].split('/')[0].lower()
+        domain = re.sub(r'^(www\.|n\.|news\.|m\.|blog\.|sports\.)', '', domain)
+        for key, name in publishers.FIXED_MAP.items():
+            if key in domain:
+                return name
+        return domain.split('.')[0].upper()
+    except Exception:
+        return "기타매체"
+
+
+def synthetic_corpus(size: int, seed: int = 42) -> list:
+    """네이버 기사 / 매핑된 언론사 / 미등록 도메인을 섞은 링크 목록"""
+    rng = random.Random(seed)
+    keys = list(publishers.FIXED_MAP)
+    oids = list(publishers.OID_MAP)
+    prefixes = ["www.", "news.", "m.", "", "sports."]
+    tlds = [".co.kr", ".com", ".kr", ".net"]
+    links = []
+    for i in range(size):
+        r = rng.random()
+        if r < 0.55:
+            links.append(f"https://n.news.naver.com/mnews/article/{rng.choice(oids)}/{rng.randint(10**9, 10**10)}?sid=101")
+        elif r < 0.9:
+            links.append(f"https://{rng.choice(prefixes)}{rng.choice(keys)}{rng.choice(tlds)}/news/articleView.html?idxno={i}")
+        else:
+            name = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(5, 14)))
+            links.append(f"https://www.{name}{rng.choice(tlds)}/view/{i}")
+    return links
+
+
+def bench(fn, links: list, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for link in links:
+            fn(link)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], encoding="utf-8") as f:
+            links = [line.strip() for line in f if line.strip()]
+    else:
+        links = synthetic_corpus(200_000)
+
+    def indexed_cold(link):
+        return publishers.publisher_from_url(link)
+
+    t_linear = bench(publisher_from_url_linear, links)
+    publishers.current_mappings().clear_cache()
+    t_cold = bench(indexed_cold, links, repeat=1)
+    t_warm = bench(publishers.publisher_from_url, links)
+
+    n = len(links)
+    print(f"links          : {n:,}")
+    print(f"linear scan    : {t_linear:8.3f}s  ({n / t_linear:12,.0f} links/s)")
+    print(f"index (cold)   : {t_cold:8.3f}s  ({n / t_cold:12,.0f} links/s)")
+    print(f"index (memo)   : {t_warm:8.3f}s  ({n / t_warm:12,.0f} links/s)")
+    print(f"speedup (memo) : {t_linear / t_warm:8.1f}x")
+
+    diffs = {}
+    for link in links:
+        old, new = publisher_from_url_linear(link), publishers.publisher_from_url(link)
+        if old != new:
+            domain = link.split('//')[-1].split('/')[0]
+            diffs[domain] = (old, new)
+    print(f"changed domains: {len(diffs)}")
+    for domain, (old, new) in sorted(diffs.items())[:20]:
+        print(f"  {domain:40s} {old} → {new}")
+
+
+if __name__ == "__main__":
+    main()
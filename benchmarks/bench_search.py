@@ -0,0 +1,192 @@
+# ============================================================
+#  검색 파이프라인 오프라인 벤치마크 (로컬 대역 서버 사용)
+#
+#  실행 방법:
+#    python benchmarks/bench_search.py                          # 200 / 1,000 / 10,000건
+#    python benchmarks/bench_search.py 500 5000 --latency 40 --jitter 20 --error-rate 0.01
+#    python benchmarks/bench_search.py --save-baseline          # 현재 결과를 기준값으로 저장
+#
+#  fakeserver.py를 별도 프로세스로 띄우고 NAVER_API_URL을 그쪽으로 돌린 뒤,
+#  시나리오마다 새 프로세스 · 빈 캐시에서 run_all_sources → build_excel을 실행한다.
+#  1,000건을 넘는 시나리오는 검색어 여러 개(각 최대 1,000건)의 일괄 검색이 된다.
+#
+#  구간은 진행 콜백 시점으로 나눈다:
+#    api (수집) → crawl (매체명 · PICK) → frame (DataFrame) → cluster (유사 기사)
+#    → excel (엑셀 바이트), publisher (결과 링크 전체 publisher_from_url)
+#  기준값(--baseline)이 있으면 구간별 증감을 출력하고, 허용 범위를 넘게
+#  느려진 항목이 있으면 종료 코드 1을 반환한다.
+# ============================================================
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.join(HERE, "..")
+sys.path.insert(0, ROOT)
+
+from rss import PeakRss  # noqa: E402
+
+DEFAULT_SCENARIOS = (200, 1_000, 10_000)
+DEFAULT_BASELINE = os.path.join(HERE, "baseline.json")
+STAGES = ("api", "crawl", "frame", "cluster", "excel", "publisher", "total")
+PER_QUERY_MAX = 1000    # 검색 API가 검색어 하나에 돌려주는 최대 기사 수
+
+
+def run_one(articles: int, api_url: str, cache_dir: str) -> dict:
+    """(자식 프로세스) 시나리오 하나 실행 → 구간별 시간 · RSS"""
+    os.environ["NAVER_API_URL"] = api_url
+    os.environ["CLIPPING_CACHE_PATH"] = os.path.join(cache_dir, "article_info.sqlite3")
+    os.environ["CLIPPING_SNAPSHOT_PATH"] = os.path.join(cache_dir, "search_snapshots.sqlite3")
+    # run_all_sources는 결과를 아카이브에 쌓고 계측 로그를 남기므로 운영 파일과 분리
+    os.environ["CLIPPING_ARCHIVE_PATH"] = os.path.join(cache_dir, "archive.sqlite3")
+    os.environ["CLIPPING_METRICS_LOG"] = os.path.join(cache_dir, "metrics.jsonl")
+
+    from clipping import config
+    # 대역 서버의 기사 호스트(127.0.0.1)에도 운영 기사 호스트와 같은 제한 적용
+    config.HOST_LIMITS["127.0.0.1"] = config.HOST_LIMITS["n.news.naver.com"]
+
+    from clipping import build_excel, run_all_sources
+    from clipping.publishers import current_mappings, publisher_from_url
+    # 지연 import되는 모듈을 미리 올려 RSS 증가분에서 라이브러리 적재분을 뺀다
+    import numpy, pandas, bs4, xlsxwriter  # noqa: F401,E401
+    try:
+        import aiohttp  # noqa: F401
+    except ImportError:
+        pass
+
+    n_queries = -(-articles // PER_QUERY_MAX)
+    per_query = -(-articles // n_queries)
+    queries = [f"벤치{i}:{per_query}" for i in range(n_queries)]
+
+    marks = {}
+
+    def progress(pct: int, message: str) -> None:
+        now = time.perf_counter()
+        if pct >= 20:
+            marks.setdefault("api", now)
+        if pct >= 95:
+            marks.setdefault("crawl", now)
+        if pct >= 100:
+            marks.setdefault("frame", now)
+
+    with PeakRss() as mem:
+        t0 = time.perf_counter()
+        df = run_all_sources(queries, "bench", "bench", progress, days=7,
+                             batch=n_queries > 1)
+        t_cluster = time.perf_counter()
+        size = len(build_excel(df))
+        t_excel = time.perf_counter()
+
+    links = df["링크"].tolist()
+    current_mappings().clear_cache()
+    t_pub = time.perf_counter()
+    for link in links:
+        publisher_from_url(link)
+    publisher = time.perf_counter() - t_pub
+
+    return {
+        "articles": articles,
+        "rows": len(df),
+        "api": marks["api"] - t0,
+        "crawl": marks["crawl"] - marks["api"],
+        "frame": marks["frame"] - marks["crawl"],
+        "cluster": t_cluster - marks["frame"],
+        "excel": t_excel - t_cluster,
+        "publisher": publisher,
+        "total": t_excel - t0,
+        "rss_mb": mem.delta_mb,
+        "excel_kb": size / 1024,
+    }
+
+
+def start_server(args) -> tuple:
+    proc = subprocess.Popen(
+        [sys.executable, os.path.join(HERE, "fakeserver.py"),
+         "--latency", str(args.latency), "--jitter", str(args.jitter),
+         "--error-rate", str(args.error_rate), "--page-kb", str(args.page_kb)],
+        stdout=subprocess.PIPE, text=True,
+    )
+    return proc, proc.stdout.readline().strip()
+
+
+def compare(result: dict, base: dict | None, tolerance: float) -> tuple:
+    """기준값 대비 증감 문자열 · 회귀 여부"""
+    if not base:
+        return "", False
+    cells, regressed = [], False
+    for stage in ("api", "crawl", "total"):
+        if base.get(stage):
+            change = result[stage] / base[stage] - 1
+            mark = ""
+            if change > tolerance:
+                mark, regressed = "!", True
+            cells.append(f"{stage} {change:+.0%}{mark}")
+    return "  vs 기준: " + ", ".join(cells), regressed
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="검색 파이프라인 오프라인 벤치마크")
+    parser.add_argument("scenarios", nargs="*", type=int,
+                        help=f"기사 수 (기본 {' / '.join(map(str, DEFAULT_SCENARIOS))})")
+    parser.add_argument("--latency", type=float, default=20, help="서버 응답 지연 (ms, 기본 20)")
+    parser.add_argument("--jitter", type=float, default=10, help="지연 편차 (± ms, 기본 10)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503/429 비율 (0~1)")
+    parser.add_argument("--page-kb", type=int, default=150, help="기사 페이지 크기 (KB)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="기준값 JSON 경로")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준값으로 저장")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="이 비율 이상 느려지면 회귀로 표시 (기본 0.25)")
+    parser.add_argument("--one", nargs=3, metavar=("ARTICLES", "API_URL", "CACHE_DIR"),
+                        help=argparse.SUPPRESS)
+    return parser
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    if args.one:
+        print(json.dumps(run_one(int(args.one[0]), args.one[1], args.one[2])))
+        return 0
+
+    scenarios = args.scenarios or list(DEFAULT_SCENARIOS)
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    server, api_url = start_server(args)
+    results, regressed = {}, False
+    try:
+        print(f"서버 {api_url} · 지연 {args.latency}±{args.jitter}ms · 오류율 {args.error_rate:.0%}")
+        print(f"{'articles':>8s} " + " ".join(f"{s:>9s}" for s in STAGES)
+              + f" {'art/s':>8s} {'ΔRSS(MB)':>9s}")
+        for articles in scenarios:
+            with tempfile.TemporaryDirectory() as cache_dir:
+                out = subprocess.run(
+                    [sys.executable, os.path.abspath(__file__), "--one",
+                     str(articles), api_url, cache_dir],
+                    capture_output=True, text=True, check=True,
+                ).stdout
+            r = json.loads(out.strip().splitlines()[-1])
+            results[str(articles)] = r
+            note, worse = compare(r, baseline.get(str(articles)), args.tolerance)
+            regressed |= worse
+            print(f"{articles:8,d} " + " ".join(f"{r[s]:9.2f}" for s in STAGES)
+                  + f" {r['rows'] / r['total']:8,.0f} {r['rss_mb']:9.1f}{note}")
+    finally:
+        server.terminate()
+        server.wait()
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=1)
+        print(f"기준값 저장: {args.baseline}")
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
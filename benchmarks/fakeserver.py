@@ -0,0 +1,164 @@
+# ============================================================
+#  벤치마크용 로컬 네이버 대역 서버 (검색 API + 기사 페이지)
+#
+#  실행 방법 (단독):
+#    python benchmarks/fakeserver.py --latency 30 --jitter 20 --error-rate 0.02
+#
+#  - /v1/search/news.json : fixtures/news.json 의 기록된 기사를 틀로 삼아
+#    요청한 start · display 구간의 기사를 만들어 돌려준다.
+#    검색어 끝의 ":숫자"가 그 검색어의 전체 기사 수 (예: "패션:1000", 기본 1000).
+#  - /n.news.naver.com/mnews/article/<oid>/<aid> : fixtures/article_*.html
+#    (<!--BODY--> 자리에 --page-kb 만큼 본문을 채워 실제 페이지 크기를 흉내)
+#  - 모든 응답에 latency ± jitter(ms) 지연, error-rate 비율로 503 · 429 응답
+#
+#  API는 localhost, 기사 링크는 127.0.0.1 로 내보내 호스트별 제한이
+#  운영 환경(API 호스트 / 기사 호스트)과 같은 구조로 걸리게 한다.
+# ============================================================
+
+import os
+import re
+import sys
+import json
+import time
+import random
+import zlib
+import argparse
+import threading
+import http.server
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlsplit, parse_qs
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+KST = timezone(timedelta(hours=9))
+DEFAULT_ARTICLES = 1000
+WINDOW_DAYS = 7     # 합성 기사의 게시일을 이 기간 안에 고르게 배치
+
+_ARTICLE_RE = re.compile(r'/n\.news\.naver\.com/mnews/article/(\d+)/(\d+)')
+
+
+def load_fixtures(page_kb: int) -> tuple:
+    with open(os.path.join(FIXTURES, "news.json"), encoding="utf-8") as f:
+        news = json.load(f)["items"]
+    filler = ("<p>" + "본문 문단입니다. " * 40 + "</p>\n").encode()
+    body = filler * max(1, page_kb * 1024 // len(filler))
+    pages = []
+    for name in sorted(os.listdir(FIXTURES)):
+        if name.startswith("article_") and name.endswith(".html"):
+            with open(os.path.join(FIXTURES, name), "rb") as f:
+                pages.append(f.read().replace(b"<!--BODY-->", body))
+    return news, pages
+
+
+class FakeNaverHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        delay = max(0.0, server.latency + random.uniform(-server.jitter, server.jitter))
+        if delay:
+            time.sleep(delay)
+        if server.error_rate and random.random() < server.error_rate:
+            status = random.choice((503, 429))
+            self.send_response(status)
+            if status == 429:
+                self.send_header("Retry-After", "1")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        url = urlsplit(self.path)
+        if url.path.endswith("/search/news.json"):
+            body, content_type = self._news(parse_qs(url.query)), "application/json; charset=utf-8"
+        else:
+            m = _ARTICLE_RE.search(url.path)
+            if not m:
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            body = server.pages[int(m.group(2)) % len(server.pages)]
+            content_type = "text/html; charset=utf-8"
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _news(self, params: dict) -> bytes:
+        server = self.server
+        query = params.get("query", [""])[0]
+        start = int(params.get("start", ["1"])[0])
+        display = int(params.get("display", ["10"])[0])
+        m = re.search(r':(\d+)$', query)
+        total = int(m.group(1)) if m else DEFAULT_ARTICLES
+        query_id = zlib.crc32(query.encode()) % 1000
+        step = timedelta(days=WINDOW_DAYS) * 0.9 / max(total, 1)
+        host = f"127.0.0.1:{server.server_address[1]}"
+
+        items = []
+        for i in range(start - 1, min(total, start - 1 + display)):
+            template = server.news[i % len(server.news)]
+            oid = re.search(r'article/(\d+)/', template["link"]).group(1)
+            aid = f"{query_id:03d}{i:07d}"
+            items.append({
+                **template,
+                "title": f"{template['title']} ({i})",
+                "link": f"http://{host}/n.news.naver.com/mnews/article/{oid}/{aid}?sid=101",
+                "pubDate": (server.now - step * i).strftime('%a, %d %b %Y %H:%M:%S +0900'),
+            })
+        return json.dumps({
+            "lastBuildDate": server.now.strftime('%a, %d %b %Y %H:%M:%S +0900'),
+            "total": total, "start": start, "display": len(items), "items": items,
+        }, ensure_ascii=False).encode()
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeNaverServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port: int = 0, latency_ms: float = 0, jitter_ms: float = 0,
+                 error_rate: float = 0.0, page_kb: int = 150):
+        super().__init__(("127.0.0.1", port), FakeNaverHandler)
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.error_rate = error_rate
+        self.news, self.pages = load_fixtures(page_kb)
+        self.now = datetime.now(KST)
+
+    @property
+    def api_url(self) -> str:
+        return f"http://localhost:{self.server_address[1]}/v1/search/news.json"
+
+    def handle_error(self, request, client_address):
+        pass    # 클라이언트가 스트리밍 도중 끊는 경우 (정상 동작)
+
+    def start(self) -> "FakeNaverServer":
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="로컬 네이버 대역 서버")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0, help="응답 지연 (ms)")
+    parser.add_argument("--jitter", type=float, default=0, help="지연 편차 (± ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503/429 응답 비율 (0~1)")
+    parser.add_argument("--page-kb", type=int, default=150, help="기사 페이지 본문 크기 (KB)")
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    server = FakeNaverServer(args.port, args.latency, args.jitter, args.error_rate, args.page_kb)
+    # 부모 프로세스가 읽을 수 있게 첫 줄에 API 주소 출력
+    print(server.api_url, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+# ============================================================
+#  벤치마크용 메모리 측정 (구간 안의 최대 RSS 증가분)
+#
+#  ru_maxrss는 프로세스 전체의 최댓값이라, 측정 구간보다 앞에서(프레임
+#  생성 등) 더 높은 값을 찍었으면 구간 안의 증가분이 0으로 나온다.
+#  PeakRss는 구간 시작 시점의 현재 RSS를 기준으로, 구간 동안 현재 RSS
+#  (/proc/self/statm)를 짧은 간격으로 읽어 그 최댓값과의 차이를 잰다.
+#  /proc이 없는 환경에서는 ru_maxrss 차이로 대신한다 (과소 측정될 수 있음).
+# ============================================================
+
+import os
+import gc
+import sys
+import resource
+import threading
+
+_STATM = "/proc/self/statm"
+_PAGE_MB = os.sysconf("SC_PAGE_SIZE") / 2 ** 20 if hasattr(os, "sysconf") else 0
+
+
+def current_rss_mb() -> float | None:
+    """현재 RSS (MB), 읽을 수 없으면 None"""
+    try:
+        with open(_STATM) as f:
+            return int(f.read().split()[1]) * _PAGE_MB
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def peak_rss_mb() -> float:
+    """프로세스 최대 RSS (MB, ru_maxrss는 Linux KB · macOS 바이트)"""
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss / 2 ** 20 if sys.platform == "darwin" else maxrss / 1024
+
+
+class PeakRss:
+    """
+    with PeakRss() as mem: ...  →  mem.delta_mb = 블록 안 최대 RSS - 시작 시 RSS.
+    INTERVAL보다 짧게 잡혔다 풀리는 메모리는 놓칠 수 있다.
+    """
+
+    INTERVAL = 0.002    # 초
+
+    def __init__(self):
+        self.delta_mb = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+        self._start = self._peak = None
+
+    def _sample(self) -> None:
+        rss = current_rss_mb()
+        if rss is not None and rss > self._peak:
+            self._peak = rss
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.INTERVAL):
+            self._sample()
+
+    def __enter__(self) -> "PeakRss":
+        gc.collect()
+        self._start = current_rss_mb()
+        if self._start is None:
+            self._start = peak_rss_mb()
+            return self
+        self._peak = self._start
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._thread is None:
+            self.delta_mb = peak_rss_mb() - self._start
+            return
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+        self.delta_mb = self._peak - self._start
@@ -0,0 +1,37 @@
+# ============================================================
+#  네이버 뉴스 클리핑 - 코어 라이브러리
+#
+#  Streamlit 없이 import 가능한 수집 · 내보내기 모듈 모음.
+#  pandas / bs4 / xlsxwriter 는 실제로 쓰는 시점에 import 한다.
+#
+#  사용 예:
+#    from clipping import run_search
+#    df = run_search("패션 트렌드", client_id, client_secret, days=3)
+#
+#  CLI:
+#    python -m clipping "패션 트렌드" -o result.xlsx
+#    python -m clipping "패션" --archive --since 2024-01-01 -o old.xlsx
+#    python -m clipping.prewarm -f keywords.txt       # 예약 사전 수집 (스케줄러)
+# ============================================================
+
+from . import metrics
+from .config import KST, GROUP_COLORS
+from .publishers import (
+    FIXED_MAP, OID_MAP, GROUP_MAP, PublisherMappings, current_mappings, publisher_from_url,
+    reload_mappings,
+)
+from .articles import fetch_naver_article_info, crawl_articles
+from .cache import (
+    ArticleCache, SearchSnapshotStore, SharedResultCache,
+    get_article_cache, get_snapshot_store, get_search_cache,
+)
+from .naver_api import NaverApiError, collect_api_items
+from .extras import EXTRA_CRAWLERS
+from .frame import make_frame, export_frame
+from .excel import build_excel
+from .export import EXPORT_FORMATS, build_export, write_export
+from .search import (
+    SearchError, build_news_frame, run_search, run_batch_search, run_all_sources,
+)
+from .jobs import JobManager, JobQueueFull, get_job_manager
+from .archive import ClippingArchive, get_archive, search_archive
@@ -0,0 +1,238 @@
+# ============================================================
+#  네이버 뉴스 클리핑 - 로컬 기사 아카이브 (SQLite + FTS5 전문 검색)
+#
+#  run_all_sources가 만든 결과(네이버 + 추가 매체)를 링크 기준으로 중복 없이
+#  쌓아 두고, 검색 API의 7일 · 1,000건 제한 밖의 기간도 네트워크 없이
+#  바로 조회한다 (기간 · 그룹 · 매체 필터).
+#
+#  한국어는 띄어쓰기 단위로 검색하기 어려워 제목을 2글자 n-gram으로 나눠
+#  색인한다 ("트렌드" → "트렌 렌드"). 검색어도 같은 방식으로 나눠 연속된
+#  n-gram 구(phrase)로 찾으므로 단어 중간의 부분 문자열도 걸린다.
+# ============================================================
+
+from __future__ import annotations
+
+import os
+import re
+import time
+import sqlite3
+import threading
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from .config import KST, ARCHIVE_PATH, ARCHIVE_QUERY_LIMIT
+from .cache import normalize_link, transaction
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+_WORD_RE = re.compile(r'[^\W_]+')
+
+
+def _words(text: str) -> list:
+    return _WORD_RE.findall((text or "").lower())
+
+
+def ngrams(text: str) -> str:
+    """제목 → 색인용 2글자 n-gram (공백 구분, 한 글자 단어는 그대로)"""
+    grams = []
+    for word in _words(text):
+        if len(word) == 1:
+            grams.append(word)
+        else:
+            grams.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return " ".join(grams)
+
+
+def match_query(text: str) -> str | None:
+    """검색어 → FTS5 MATCH 식 (단어마다 n-gram 구, 모두 포함 = AND)"""
+    terms = []
+    for word in _words(text):
+        if len(word) == 1:
+            terms.append(f'"{word}"*')
+        else:
+            terms.append('"' + " ".join(word[i:i + 2] for i in range(len(word) - 1)) + '"')
+    return " AND ".join(terms) or None
+
+
+def _timestamp(value) -> float | None:
+    if value is None or value != value:    # None · NaT
+        return None
+    return value.timestamp()
+
+
+class ClippingArchive:
+    """
+    링크(normalize_link) 기준 기사 보관소 (SQLite WAL).
+    같은 기사를 다시 저장하면 매체명 · 그룹을 갱신하고, PICK은 한 번 붙으면
+    유지하며, 키워드는 합친다.
+    """
+
+    def __init__(self, path: str = ARCHIVE_PATH):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS articles (
+                id         INTEGER PRIMARY KEY,
+                link_key   TEXT NOT NULL UNIQUE,
+                link       TEXT NOT NULL,
+                title      TEXT NOT NULL,
+                publisher  TEXT NOT NULL,
+                grp        TEXT NOT NULL,
+                pick       INTEGER NOT NULL,
+                pub_date   REAL,
+                keywords   TEXT NOT NULL,
+                first_seen REAL NOT NULL,
+                last_seen  REAL NOT NULL
+            )""")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_pub_date ON articles(pub_date)")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_articles_publisher ON articles(publisher, pub_date)")
+        self._conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(grams, tokenize='unicode61')")
+
+    # ── 저장 ──────────────────────────────────────────────────
+    def add_frame(self, df: pd.DataFrame, keywords: str = "") -> int:
+        """
+        결과 DataFrame 저장 → 새로 추가된 기사 수.
+        키워드 컬럼이 있으면 행별 값을, 없으면 keywords를 쓴다.
+        """
+        if df is None or df.empty:
+            return 0
+        now = time.time()
+        row_keywords = df["키워드"].tolist() if "키워드" in df.columns else [keywords] * len(df)
+        rows = {}
+        for group, publisher, title, link, pick, pub_date, kw in zip(
+                df["그룹"].tolist(), df["매체명"].tolist(), df["제목"].tolist(),
+                df["링크"].tolist(), df["PICK"].tolist(), df["게시일"].tolist(), row_keywords):
+            rows[normalize_link(link)] = (
+                link, title, publisher, group or "", int(bool(pick)), _timestamp(pub_date), kw or "")
+
+        with self._lock:
+            existing = {}
+            keys = list(rows)
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                existing.update(self._conn.execute(
+                    f"SELECT link_key, keywords FROM articles "
+                    f"WHERE link_key IN ({','.join('?' * len(chunk))})", chunk).fetchall())
+
+            with transaction(self._conn):
+                added = 0
+                for key, (link, title, publisher, group, pick, pub_date, kw) in rows.items():
+                    if key in existing:
+                        merged = ", ".join(dict.fromkeys(
+                            k for k in (existing[key] + ", " + kw).split(", ") if k))
+                        self._conn.execute(
+                            "UPDATE articles SET publisher = ?, grp = ?, pick = max(pick, ?), "
+                            "pub_date = coalesce(?, pub_date), keywords = ?, last_seen = ? "
+                            "WHERE link_key = ?",
+                            (publisher, group, pick, pub_date, merged, now, key))
+                        continue
+                    cursor = self._conn.execute(
+                        "INSERT INTO articles (link_key, link, title, publisher, grp, pick, "
+                        "pub_date, keywords, first_seen, last_seen) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (key, link, title, publisher, group, pick, pub_date, kw, now, now))
+                    self._conn.execute("INSERT INTO articles_fts (rowid, grams) VALUES (?, ?)",
+                                       (cursor.lastrowid, ngrams(title)))
+                    added += 1
+        return added
+
+    # ── 조회 ──────────────────────────────────────────────────
+    def search(self, text: str = "", start: datetime | None = None, end: datetime | None = None,
+               groups: tuple = (), publishers: tuple = (),
+               limit: int = ARCHIVE_QUERY_LIMIT) -> pd.DataFrame:
+        """
+        제목 검색어 · 게시일 구간 [start, end) · 그룹("미분류" = 그룹 없음) · 매체
+        조건으로 조회 → 결과 DataFrame (최신순, 최대 limit건, 키워드 컬럼 포함)
+        """
+        from .frame import make_frame
+
+        where, params = [], []
+        match = match_query(text)
+        if match:
+            where.append("a.id IN (SELECT rowid FROM articles_fts WHERE articles_fts MATCH ?)")
+            params.append(match)
+        if start is not None:
+            where.append("a.pub_date >= ?")
+            params.append(start.timestamp())
+        if end is not None:
+            where.append("a.pub_date < ?")
+            params.append(end.timestamp())
+        if groups:
+            where.append(f"a.grp IN ({','.join('?' * len(groups))})")
+            params += ["" if g == "미분류" else g for g in groups]
+        if publishers:
+            where.append(f"a.publisher IN ({','.join('?' * len(publishers))})")
+            params += list(publishers)
+        sql = ("SELECT grp, publisher, title, link, pick, pub_date, keywords FROM articles a"
+               + (" WHERE " + " AND ".join(where) if where else "")
+               + " ORDER BY a.pub_date IS NULL, a.pub_date DESC LIMIT ?")
+        with self._lock:
+            rows = self._conn.execute(sql, params + [limit]).fetchall()
+
+        columns = list(zip(*rows)) or [()] * 7
+        return make_frame(
+            groups=columns[0], publishers=columns[1], titles=columns[2], links=columns[3],
+            picks=[bool(p) for p in columns[4]],
+            pub_dates=[datetime.fromtimestamp(t, KST) if t is not None else None
+                       for t in columns[5]],
+            keywords=columns[6],
+        )
+
+    def publishers(self) -> list:
+        """보관된 매체명 (기사 수 많은 순)"""
+        with self._lock:
+            return [name for name, in self._conn.execute(
+                "SELECT publisher FROM articles GROUP BY publisher ORDER BY count(*) DESC")]
+
+    def stats(self) -> dict:
+        with self._lock:
+            count, oldest, newest = self._conn.execute(
+                "SELECT count(*), min(pub_date), max(pub_date) FROM articles").fetchone()
+        return {
+            "articles": count,
+            "oldest": datetime.fromtimestamp(oldest, KST) if oldest else None,
+            "newest": datetime.fromtimestamp(newest, KST) if newest else None,
+        }
+
+
+_archive = None
+_archive_lock = threading.Lock()
+
+
+def get_archive() -> ClippingArchive | None:
+    """프로세스 공용 아카이브 (열 수 없으면 None → 보관 없이 동작)"""
+    global _archive
+    with _archive_lock:
+        if _archive is None:
+            try:
+                _archive = ClippingArchive()
+            except sqlite3.Error:
+                return None
+        return _archive
+
+
+def search_archive(queries: list, start: datetime | None = None, end: datetime | None = None,
+                   groups: tuple = (), publishers: tuple = ()) -> pd.DataFrame | None:
+    """
+    검색어 여러 개로 아카이브 조회 → 링크 기준으로 합친 결과 (최신순).
+    검색어가 없으면 조건에 맞는 전체, 아카이브를 열 수 없으면 None.
+    """
+    from . import metrics
+    from .frame import concat_frames
+
+    archive = get_archive()
+    if archive is None:
+        return None
+    with metrics.stage("archive_query"):
+        frames = [archive.search(q, start, end, groups, publishers) for q in queries or [""]]
+        if len(frames) == 1:
+            return frames[0]
+        df = concat_frames(frames).drop_duplicates(subset="링크")
+        return df.sort_values("게시일", ascending=False, ignore_index=True)
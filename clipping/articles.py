@@ -0,0 +1,483 @@
+# ============================================================
+#  네이버 뉴스 클리핑 - 네이버 기사 매체명 · PICK 수집
+# ============================================================
+
+import re
+import time
+import codecs
+import asyncio
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+
+from .config import (
+    HEADERS, MAX_WORKERS, REQUEST_TIMEOUT,
+    FETCH_BACKEND, ASYNC_MAX_CONCURRENCY, ASYNC_PER_HOST_LIMIT,
+    ARTICLE_STREAMING, STREAM_CHUNK_SIZE, STREAM_BYTE_CAP, STREAM_DRAIN_MAX,
+)
+from . import metrics, parsing
+from .cache import get_article_cache
+from .http import http_get, http_get_async
+from .publishers import publisher_from_url
+
+
+def _aiohttp():
+    """aiohttp 모듈 (미설치 시 None → 스레드 백엔드로 동작)"""
+    try:
+        import aiohttp
+    except ImportError:
+        return None
+    return aiohttp
+
+
+# ── 기사 페이지 선택자 (매체명: 로고 > og:article:author > 매체 링크 문구) ──
+_LOGO_CSS = 'a.press_logo img, .media_end_head_top a img'
+_AUTHOR_CSS = 'meta[property="og:article:author"]'
+_POINT_CSS = '.media_end_linked_more_point'
+_PICK_CSS = '.is_pick, .media_end_head_journalist_edit_label'
+
+
+def _extract_article(doc) -> tuple:
+    """파싱된 문서 → (로고 alt, og:article:author, 매체 링크 문구, PICK 태그 여부)"""
+    logo = parsing.select_one(doc, _LOGO_CSS)
+    meta = parsing.select_one(doc, _AUTHOR_CSS)
+    point = parsing.select_one(doc, _POINT_CSS)
+    return (
+        parsing.attr(logo, 'alt').strip() if logo is not None else "",
+        parsing.attr(meta, 'content').strip() if meta is not None else "",
+        parsing.text(point, strip=True) if point is not None else "",
+        parsing.select_one(doc, _PICK_CSS) is not None,
+    )
+
+
+def parse_article_html(text: str, result: dict) -> dict:
+    """기사 HTML에서 매체명 · PICK 여부를 추출해 result에 반영"""
+    started = time.perf_counter()
+    logo, author, point, pick = _extract_article(parsing.parse(text))
+    publisher = logo or author or point
+    if publisher:
+        result["publisher"] = publisher
+
+    # ── PICK 여부 ─────────────────────────────────────────────
+    if pick or "PICK" in text:
+        result["pick"] = "PICK"
+    metrics.add_stage("parse", time.perf_counter() - started)
+    return result
+
+
+class ArticleHeadParser(HTMLParser):
+    """
+    parse_article_html과 같은 규칙을 조각 단위로 적용하는 증분 파서.
+    feed_bytes()가 True를 반환하면 매체명 · PICK이 확정된 것이다.
+
+    - 매체명: 로고 img alt > og:article:author > .media_end_linked_more_point
+    - PICK  : .is_pick / .media_end_head_journalist_edit_label 또는 "PICK" 문자열
+    - 본문(#dic_area, #newsct_article)이 시작되면 앞부분 정보는 모두 나온 것으로 본다
+    """
+
+    VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input",
+                 "link", "meta", "source", "track", "wbr"}
+    PICK_CLASSES = {"is_pick", "media_end_head_journalist_edit_label"}
+    BODY_IDS = {"dic_area", "newsct_article"}
+
+    def __init__(self, charset: str = "utf-8"):
+        super().__init__(convert_charrefs=True)
+        self._decoder = codecs.getincrementaldecoder(charset)(errors="replace")
+        self._stack = []            # (tag, classes) — 열린 non-void 태그
+        self._point_depth = None    # .media_end_linked_more_point 내부 여부
+        self._point_text = []
+        self.logo = ""
+        self.meta_author = ""
+        self.point = ""
+        self.pick = False
+        self.body_started = False
+        self.bytes_read = 0
+        self.parse_seconds = 0.0
+        self._tail = ""             # 조각 경계에 걸친 "PICK" 검출용
+
+    # ── 상태 ──────────────────────────────────────────────────
+    @property
+    def done(self) -> bool:
+        publisher_known = bool(self.logo) or (self.body_started and bool(self.meta_author))
+        return publisher_known and (self.pick or self.body_started)
+
+    def feed_bytes(self, chunk: bytes) -> bool:
+        started = time.perf_counter()
+        self.bytes_read += len(chunk)
+        text = self._decoder.decode(chunk)
+        if "PICK" in self._tail + text:
+            self.pick = True
+        self._tail = text[-3:]
+        self.feed(text)
+        self.parse_seconds += time.perf_counter() - started
+        return self.done
+
+    def apply(self, result: dict) -> dict:
+        metrics.add_stage("parse", self.parse_seconds)
+        publisher = self.logo or self.meta_author or self.point
+        if publisher:
+            result["publisher"] = publisher
+        if self.pick:
+            result["pick"] = "PICK"
+        return result
+
+    # ── HTMLParser 콜백 ───────────────────────────────────────
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        classes = set((attrs.get("class") or "").split())
+        if classes & self.PICK_CLASSES:
+            self.pick = True
+        if attrs.get("id") in self.BODY_IDS:
+            self.body_started = True
+
+        if tag == "meta" and attrs.get("property") == "og:article:author" and not self.meta_author:
+            self.meta_author = (attrs.get("content") or "").strip()
+        elif tag == "img" and not self.logo:
+            in_logo = any(t == "a" and "press_logo" in c for t, c in self._stack)
+            in_head_top = (any(t == "a" for t, _ in self._stack)
+                           and any("media_end_head_top" in c for _, c in self._stack))
+            if in_logo or in_head_top:
+                self.logo = (attrs.get("alt") or "").strip()
+
+        if tag in self.VOID_TAGS:
+            return
+        self._stack.append((tag, classes))
+        if "media_end_linked_more_point" in classes and self._point_depth is None and not self.point:
+            self._point_depth = len(self._stack)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in self.VOID_TAGS and self._stack and self._stack[-1][0] == tag:
+            self._pop_to(len(self._stack) - 1)
+
+    def handle_endtag(self, tag):
+        for i in range(len(self._stack) - 1, -1, -1):
+            if self._stack[i][0] == tag:
+                self._pop_to(i)
+                return
+
+    def handle_data(self, data):
+        if self._point_depth is not None:
+            self._point_text.append(data)
+
+    def _pop_to(self, depth: int) -> None:
+        del self._stack[depth:]
+        if self._point_depth is not None and len(self._stack) < self._point_depth:
+            self.point = "".join(self._point_text).strip()
+            self._point_depth = None
+            self._point_text = []
+
+
+class ArticlePrefixParser:
+    """
+    빠른 파서(selectolax · lxml)용 스트리밍 파서. ArticleHeadParser와 같은 인터페이스.
+    조각은 모아 두기만 하고, 본문 시작 표시가 나오면 그 앞부분을 한 번 파싱한다.
+    로고나 og:article:author가 있으면 거기서 끝, 없으면 끝(또는 상한)까지 읽고
+    apply()에서 전체를 다시 파싱한다.
+    """
+
+    BODY_RE = re.compile(rb'id=["\']?(?:dic_area|newsct_article)["\'\s>]')
+    OVERLAP = 40    # 조각 경계에 걸친 본문 표시 · "PICK" 검출용
+
+    def __init__(self, charset: str = "utf-8"):
+        self._charset = charset
+        self._buffer = bytearray()
+        self._tail = b""
+        self._parsed_at = -1        # 마지막으로 파싱한 버퍼 길이
+        self.logo = ""
+        self.meta_author = ""
+        self.point = ""
+        self.pick = False
+        self.body_started = False
+        self.bytes_read = 0
+        self.parse_seconds = 0.0
+
+    @property
+    def done(self) -> bool:
+        return self.body_started and bool(self.logo or self.meta_author)
+
+    def feed_bytes(self, chunk: bytes) -> bool:
+        started = time.perf_counter()
+        self.bytes_read += len(chunk)
+        self._buffer += chunk
+        window = self._tail + chunk
+        if b"PICK" in window:
+            self.pick = True
+        if not self.body_started and self.BODY_RE.search(window):
+            self.body_started = True
+            self._parse()
+        self._tail = window[-self.OVERLAP:]
+        self.parse_seconds += time.perf_counter() - started
+        return self.done
+
+    def _parse(self) -> None:
+        if self._parsed_at == len(self._buffer):
+            return
+        self._parsed_at = len(self._buffer)
+        doc = parsing.parse(self._buffer.decode(self._charset, errors="replace"))
+        self.logo, self.meta_author, self.point, pick = _extract_article(doc)
+        self.pick = self.pick or pick
+
+    def apply(self, result: dict) -> dict:
+        if not self.done:
+            started = time.perf_counter()
+            self._parse()
+            self.parse_seconds += time.perf_counter() - started
+        metrics.add_stage("parse", self.parse_seconds)
+        publisher = self.logo or self.meta_author or self.point
+        if publisher:
+            result["publisher"] = publisher
+        if self.pick:
+            result["pick"] = "PICK"
+        return result
+
+
+def make_head_parser(charset: str = "utf-8"):
+    """설정된 HTML 파서에 맞는 스트리밍 파서 (html.parser면 증분 파서)"""
+    if parsing.get_backend().name == "html.parser":
+        return ArticleHeadParser(charset)
+    return ArticlePrefixParser(charset)
+
+
+def _charset(content_type: str | None) -> str:
+    m = re.search(r'charset=([\w-]+)', content_type or "", re.I)
+    if m:
+        try:
+            return codecs.lookup(m.group(1)).name
+        except LookupError:
+            pass
+    return "utf-8"
+
+
+def _drain_budget(headers, bytes_read: int) -> int:
+    """
+    조기 종료 뒤 남은 본문을 마저 받을 바이트 한도 (0이면 바로 끊음).
+    압축되지 않은 응답은 Content-Length로 남은 양을 알 수 있어 크면 읽지 않고,
+    모르면 STREAM_DRAIN_MAX까지만 읽어 보고 그 안에 끝나지 않으면 끊는다.
+    """
+    length = headers.get("Content-Length") or ""
+    if length.isdigit() and not headers.get("Content-Encoding"):
+        remaining = int(length) - bytes_read
+        return remaining if remaining <= STREAM_DRAIN_MAX else 0
+    return STREAM_DRAIN_MAX
+
+
+def _drain(chunks, budget: int) -> tuple:
+    """남은 조각을 budget까지 버리며 읽는다 → (본문 끝까지 읽었는지, 읽은 바이트)"""
+    read = 0
+    for chunk in chunks:
+        read += len(chunk)
+        if read > budget:
+            return False, read
+    return True, read
+
+
+async def _drain_async(chunks, budget: int) -> tuple:
+    read = 0
+    async for chunk in chunks:
+        read += len(chunk)
+        if read > budget:
+            return False, read
+    return True, read
+
+
+def _fetch_article(link: str) -> tuple:
+    """
+    기사 하나의 (페이지에서 찾은 매체명 · PICK dict, 성공 여부).
+    매체명을 찾지 못하면 ""이고, URL 기준 매체명은 _with_fallback이 채운다
+    (캐시에는 페이지 값만 남겨 매핑이 바뀌어도 최신 매핑을 쓰도록).
+    성공은 200 응답을 끝까지 파싱한 경우뿐이며, 실패는 캐시에 남기지 않는다
+    (일시적 오류가 몇 시간 고정되지 않도록).
+    """
+    result = {"publisher": "", "pick": ""}
+    if "naver.com" not in link:
+        return result, False
+    host = urlsplit(link).hostname or ""
+    nbytes = 0
+    try:
+        if not ARTICLE_STREAMING:
+            res = http_get(link, timeout=REQUEST_TIMEOUT)
+            if res.status_code != 200:
+                return result, False
+            return parse_article_html(res.text, result), True
+
+        with http_get(link, timeout=REQUEST_TIMEOUT, stream=True) as res:
+            if res.status_code != 200:
+                return result, False
+            parser = make_head_parser(_charset(res.headers.get("Content-Type")))
+            chunks = res.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+            try:
+                for chunk in chunks:
+                    if parser.feed_bytes(chunk) or parser.bytes_read >= STREAM_BYTE_CAP:
+                        # 남은 본문이 작으면 마저 받아 커넥션을 풀에 돌려준다
+                        # (다 읽지 못한 응답은 with 블록을 나가며 연결째 닫힌다)
+                        nbytes += _drain(chunks, _drain_budget(res.headers, parser.bytes_read))[1]
+                        break
+            finally:
+                nbytes += parser.bytes_read
+            parser.apply(result)
+    except Exception:
+        return result, False
+    finally:
+        metrics.record_bytes(host, nbytes)
+    return result, True
+
+
+def _with_fallback(link: str, info: dict) -> dict:
+    """페이지에서 매체명을 못 찾은 기사는 지금 매핑의 URL 기준 매체명으로 채움"""
+    if info["publisher"]:
+        return info
+    return {**info, "publisher": publisher_from_url(link)}
+
+
+def fetch_naver_article_info(link: str) -> dict:
+    return _with_fallback(link, _fetch_article(link)[0])
+
+
+async def _fetch_article_async(session, link: str) -> tuple:
+    """_fetch_article의 aiohttp 버전"""
+    result = {"publisher": "", "pick": ""}
+    if "naver.com" not in link:
+        return result, False
+    host = urlsplit(link).hostname or ""
+    nbytes = 0
+    try:
+        async with await http_get_async(session, link) as res:
+            if res.status != 200:
+                return result, False
+            if not ARTICLE_STREAMING:
+                nbytes = len(await res.read())
+                text = await res.text(errors='replace')
+                return parse_article_html(text, result), True
+
+            parser = make_head_parser(_charset(res.headers.get("Content-Type")))
+            chunks = res.content.iter_chunked(STREAM_CHUNK_SIZE)
+            try:
+                async for chunk in chunks:
+                    if parser.feed_bytes(chunk) or parser.bytes_read >= STREAM_BYTE_CAP:
+                        # 남은 본문이 작으면 마저 받아 커넥션을 풀에 돌려주고, 크면 끊는다
+                        drained, read = await _drain_async(
+                            chunks, _drain_budget(res.headers, parser.bytes_read))
+                        nbytes += read
+                        if not drained:
+                            res.close()
+                        break
+            finally:
+                nbytes += parser.bytes_read
+            parser.apply(result)
+    except Exception:
+        return result, False
+    finally:
+        metrics.record_bytes(host, nbytes)
+    return result, True
+
+
+async def fetch_naver_article_info_async(session, link: str) -> dict:
+    """fetch_naver_article_info의 aiohttp 버전 (같은 dict 반환)"""
+    return _with_fallback(link, (await _fetch_article_async(session, link))[0])
+
+
+async def _crawl_articles_async(links: list, on_done) -> None:
+    aiohttp = _aiohttp()
+    # 연결 대기 시간은 제한하지 않고, 소켓 연결/읽기에만 타임아웃 적용
+    timeout = aiohttp.ClientTimeout(
+        total=None, sock_connect=REQUEST_TIMEOUT, sock_read=REQUEST_TIMEOUT)
+    connector = aiohttp.TCPConnector(
+        limit=ASYNC_MAX_CONCURRENCY,
+        limit_per_host=ASYNC_PER_HOST_LIMIT,
+        ttl_dns_cache=300,
+    )
+    async with aiohttp.ClientSession(
+        headers=HEADERS, connector=connector, timeout=timeout
+    ) as session:
+        async def _one(idx: int, link: str):
+            return idx, await _fetch_article_async(session, link)
+
+        tasks = [asyncio.create_task(_one(idx, link)) for idx, link in enumerate(links)]
+        for future in asyncio.as_completed(tasks):
+            idx, (info, ok) = await future
+            on_done(idx, info, ok)
+
+
+def _crawl_articles_threaded(links: list, on_done) -> None:
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        future_to_idx = {
+            executor.submit(metrics.bind(_fetch_article), link): idx
+            for idx, link in enumerate(links)
+        }
+        for future in as_completed(future_to_idx):
+            idx = future_to_idx[future]
+            try:
+                info, ok = future.result()
+            except Exception:
+                info, ok = {"publisher": "", "pick": ""}, False
+            on_done(idx, info, ok)
+
+
+def crawl_articles(links: list, on_progress=None, backend: str | None = None,
+                   use_cache: bool = True, on_result=None) -> list:
+    """
+    링크 목록의 매체명 · PICK을 병렬 수집 → 입력 순서대로 dict 리스트 반환.
+    캐시에 있는 기사는 건너뛰고, on_progress(done, total)는 기사 하나가
+    끝날 때마다 호출된다. on_result(idx, info)는 기사별 결과가 나올 때마다
+    (캐시 적중분은 시작 시 한꺼번에) 호출된다.
+    """
+    backend = backend or FETCH_BACKEND
+    total = len(links)
+    results = [None] * total
+
+    # 캐시 대상은 실제로 페이지를 받아야 하는 네이버 기사뿐
+    cache = get_article_cache() if use_cache else None
+    cached = {}
+    if cache is not None:
+        try:
+            cached = cache.get_many([link for link in links if "naver.com" in link])
+        except sqlite3.Error:
+            # 다른 프로세스(앱 · 사전 수집)가 잠그고 있으면 캐시 없이 진행
+            metrics.count("article_cache_error")
+            cached = {}
+    pending = []
+    for idx, link in enumerate(links):
+        if link in cached:
+            results[idx] = _with_fallback(link, cached[link])
+        else:
+            pending.append(idx)
+    if cache is not None:
+        metrics.count("article_cache_hit", len(cached))
+        metrics.count("article_cache_miss", len(pending))
+    if on_result and cached:
+        for idx, link in enumerate(links):
+            if link in cached:
+                on_result(idx, results[idx])
+
+    done = total - len(pending)
+    if on_progress and done:
+        on_progress(done, total)
+    fetched = {}    # 캐시에 저장할 결과 (200 응답을 파싱한 기사만)
+
+    def on_done(i: int, info: dict, ok: bool) -> None:
+        nonlocal done
+        idx = pending[i]
+        if ok:
+            fetched[links[idx]] = info
+        info = results[idx] = _with_fallback(links[idx], info)
+        done += 1
+        if on_result:
+            on_result(idx, info)
+        if on_progress:
+            on_progress(done, total)
+
+    pending_links = [links[idx] for idx in pending]
+    if pending_links:
+        if backend == "async" and _aiohttp() is not None:
+            asyncio.run(_crawl_articles_async(pending_links, on_done))
+        else:
+            _crawl_articles_threaded(pending_links, on_done)
+
+    if cache is not None:
+        try:
+            cache.put_many({link: info for link, info in fetched.items() if "naver.com" in link})
+        except sqlite3.Error:
+            metrics.count("article_cache_error")
+    return results
@@ -0,0 +1,388 @@
+# ============================================================
+#  네이버 뉴스 클리핑 - 기사 정보 캐시 · 검색 스냅샷
+# ============================================================
+
+from __future__ import annotations
+
+import os
+import re
+import sys
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import contextmanager
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from .config import (
+    ARTICLE_CACHE_PATH, ARTICLE_CACHE_MAX_ROWS, PUBLISHER_TTL, PICK_TTL,
+    SNAPSHOT_PATH, SNAPSHOT_MAX_AGE, VIEW_CACHE_ITEMS, VIEW_CACHE_BYTES,
+    SEARCH_CACHE_TTL, SEARCH_CACHE_ITEMS, SEARCH_CACHE_BYTES,
+)
+from . import metrics
+from .frame import frame_from_json, frame_to_json, stored_publishers
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+_NAVER_ARTICLE_RE = re.compile(r'article/(\d+)/(\d+)')
+
+
+def normalize_link(link: str) -> str:
+    """캐시 키용 링크 정규화 (네이버 기사는 oid/aid, 그 외는 scheme·쿼리 제거)"""
+    if "naver.com" in link:
+        m = _NAVER_ARTICLE_RE.search(link)
+        if m:
+            return f"naver:{m.group(1).zfill(3)}/{m.group(2)}"
+    link = link.split('#')[0].split('?')[0]
+    return link.split('//')[-1].lower().rstrip('/')
+
+
+@contextmanager
+def transaction(conn: sqlite3.Connection):
+    """
+    BEGIN … COMMIT (isolation_level=None 연결용). 도중에 실패하면 ROLLBACK —
+    열린 트랜잭션이 남으면 이후 BEGIN이 모두 실패하고 WAL 체크포인트도 막힌다.
+    """
+    conn.execute("BEGIN")
+    try:
+        yield conn
+        conn.execute("COMMIT")
+    except BaseException:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+
+
+class ArticleCache:
+    """
+    normalize_link(link) → {"publisher", "pick"} 영속 캐시 (SQLite WAL).
+    매체명은 기사 페이지에서 찾은 값만 담는다 (못 찾았으면 "", URL 기준
+    매체명은 매핑에 따라 바뀌므로 읽을 때 채운다).
+
+    - 매체명은 PUBLISHER_TTL, PICK 미지정 결과는 PICK_TTL 동안 유효
+      (한 번 PICK으로 확인된 기사는 매체명과 같은 기간 유지)
+    - max_rows 초과 시 최근 조회 시각이 오래된 순으로 제거
+    - hits / misses 는 프로세스 내 누적 조회 수
+    """
+
+    def __init__(self, path: str = ARTICLE_CACHE_PATH,
+                 max_rows: int = ARTICLE_CACHE_MAX_ROWS):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.max_rows = max_rows
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS article_info (
+                key         TEXT PRIMARY KEY,
+                publisher   TEXT NOT NULL,
+                pick        TEXT NOT NULL,
+                fetched_at  REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )""")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_article_info_accessed ON article_info(accessed_at)")
+
+    def get_many(self, links: list) -> dict:
+        """유효한 캐시가 있는 링크만 {link: info}로 반환"""
+        now = time.time()
+        keys = {normalize_link(link): link for link in links}
+        found = {}
+        with self._lock:
+            key_list = list(keys)
+            for i in range(0, len(key_list), 500):
+                chunk = key_list[i:i + 500]
+                rows = self._conn.execute(
+                    f"SELECT key, publisher, pick, fetched_at FROM article_info "
+                    f"WHERE key IN ({','.join('?' * len(chunk))})", chunk).fetchall()
+                for key, publisher, pick, fetched_at in rows:
+                    age = now - fetched_at
+                    ttl = PUBLISHER_TTL if pick == "PICK" else PICK_TTL
+                    if age <= ttl:
+                        found[keys[key]] = {"publisher": publisher, "pick": pick}
+            if found:
+                with transaction(self._conn):
+                    self._conn.executemany(
+                        "UPDATE article_info SET accessed_at = ? WHERE key = ?",
+                        [(now, normalize_link(link)) for link in found])
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, infos: dict) -> None:
+        """{link: info} 저장 후 max_rows 초과분 LRU 제거"""
+        if not infos:
+            return
+        now = time.time()
+        with self._lock, transaction(self._conn):
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO article_info VALUES (?, ?, ?, ?, ?)",
+                [(normalize_link(link), info["publisher"], info["pick"], now, now)
+                 for link, info in infos.items()])
+            count = self._conn.execute("SELECT COUNT(*) FROM article_info").fetchone()[0]
+            if count > self.max_rows:
+                self._conn.execute(
+                    "DELETE FROM article_info WHERE key IN ("
+                    "SELECT key FROM article_info ORDER BY accessed_at LIMIT ?)",
+                    (count - self.max_rows,))
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+_article_cache = None
+_store_lock = threading.Lock()
+
+
+def get_article_cache() -> ArticleCache | None:
+    """프로세스 공용 캐시 (열 수 없으면 None → 캐시 없이 동작)"""
+    global _article_cache
+    with _store_lock:
+        if _article_cache is None:
+            try:
+                _article_cache = ArticleCache()
+            except sqlite3.Error:
+                return None
+        return _article_cache
+
+
+class SearchSnapshotStore:
+    """
+    (query, days)별 직전 검색 결과와 가장 최신 pubDate 보관 (SQLite WAL).
+    증분 검색은 이 시점 이후 기사만 받아 저장된 결과에 합친다.
+    """
+
+    def __init__(self, path: str = SNAPSHOT_PATH):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS search_snapshot (
+                query      TEXT NOT NULL,
+                days       INTEGER NOT NULL,
+                newest_pub TEXT NOT NULL,
+                saved_at   REAL NOT NULL,
+                frame      TEXT NOT NULL,
+                PRIMARY KEY (query, days)
+            )""")
+
+    def load(self, query: str, days: int, max_age: float = SNAPSHOT_MAX_AGE) -> dict | None:
+        """{"newest": datetime, "saved_at": float, "frame": DataFrame} 또는 None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT newest_pub, saved_at, frame FROM search_snapshot "
+                "WHERE query = ? AND days = ?", (query, days)).fetchone()
+        if row is None or time.time() - row[1] > max_age:
+            return None
+        frame = frame_from_json(row[2])
+        if frame is None:   # 이전 스키마로 저장된 결과
+            return None
+        return {
+            "newest": datetime.fromisoformat(row[0]),
+            "saved_at": row[1],
+            "frame": frame,
+        }
+
+    def save(self, query: str, days: int, newest: datetime, df: pd.DataFrame) -> None:
+        frame = frame_to_json(df)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_snapshot VALUES (?, ?, ?, ?, ?)",
+                (query, days, newest.isoformat(), time.time(), frame))
+
+    def discard_publishers(self, publishers: set) -> int:
+        """매체명 중 하나라도 publishers에 든 결과 삭제 (매핑 변경 시) → 삭제한 개수"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT query, days, frame FROM search_snapshot").fetchall()
+            keys = [(query, days) for query, days, frame in rows
+                    if stored_publishers(frame) & publishers]
+            self._conn.executemany(
+                "DELETE FROM search_snapshot WHERE query = ? AND days = ?", keys)
+        return len(keys)
+
+
+_snapshot_store = None
+
+
+def get_snapshot_store() -> SearchSnapshotStore | None:
+    global _snapshot_store
+    with _store_lock:
+        if _snapshot_store is None:
+            try:
+                _snapshot_store = SearchSnapshotStore()
+            except sqlite3.Error:
+                return None
+        return _snapshot_store
+
+
+# ══════════════════════════════════════════════════════════════
+#  메모리 LRU (화면 파생 결과용)
+# ══════════════════════════════════════════════════════════════
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """DataFrame 내용 해시 (같은 내용이면 같은 값, 컬럼 구성도 반영)"""
+    import pandas as pd
+
+    h = hashlib.blake2b(digest_size=16)
+    h.update("\x1f".join(map(str, df.columns)).encode())
+    h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def _sizeof(value) -> int:
+    if value is None:
+        return 0
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    memory_usage = getattr(value, "memory_usage", None)
+    if memory_usage is not None:   # DataFrame
+        return int(memory_usage(index=False, deep=True).sum())
+    if isinstance(value, (list, tuple)):   # 행 dict 목록 등 (대략값)
+        return sys.getsizeof(value) + sum(_sizeof(v) for v in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_sizeof(v) for v in value.values())
+    return sys.getsizeof(value)
+
+
+class BoundedLRU:
+    """
+    개수 · 총 크기 상한이 있는 스레드 안전 LRU.
+    상한을 넘으면 가장 오래 안 쓴 항목부터 버린다 (상한보다 큰 값은 담지 않음).
+    """
+
+    def __init__(self, max_items: int = VIEW_CACHE_ITEMS, max_bytes: int = VIEW_CACHE_BYTES):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self._items = OrderedDict()   # key → (value, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                return default
+            self._items.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value) -> None:
+        size = _sizeof(value)
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            if size > self.max_bytes:
+                return
+            self._items[key] = (value, size)
+            self._bytes += size
+            while len(self._items) > self.max_items or self._bytes > self.max_bytes:
+                _, (_, dropped) = self._items.popitem(last=False)
+                self._bytes -= dropped
+
+    def discard_if(self, predicate) -> int:
+        """predicate(value)가 참인 항목 삭제 → 삭제한 개수"""
+        with self._lock:
+            keys = [key for key, (value, _) in self._items.items() if predicate(value)]
+            for key in keys:
+                _, size = self._items.pop(key)
+                self._bytes -= size
+        return len(keys)
+
+    def get_or_build(self, key, build):
+        """key에 값이 없을 때만 build()를 호출해 채운다"""
+        value = self.get(key)
+        if value is None:
+            value = build()
+            self.put(key, value)
+        return value
+
+
+class SharedResultCache:
+    """
+    프로세스 공용 결과 캐시 (TTL · 개수 · 크기 상한) + single-flight.
+    같은 key의 실행이 이미 진행 중이면 새로 실행하지 않고 그 결과를 함께 받는다.
+    실패(예외)는 기다리던 쪽에도 그대로 올리고 캐시하지 않는다.
+    캐시된 값은 여러 세션이 공유하므로 호출 측에서 고치지 않는다.
+    """
+
+    def __init__(self, ttl: float = SEARCH_CACHE_TTL, max_items: int = SEARCH_CACHE_ITEMS,
+                 max_bytes: int = SEARCH_CACHE_BYTES):
+        self.ttl = ttl
+        self._lru = BoundedLRU(max_items, max_bytes)    # key → (만료 시각, 값)
+        self._inflight = {}                             # key → Future
+        self._lock = threading.Lock()
+
+    def get_or_run(self, key, run, name: str = "search_cache", on_wait=None):
+        """
+        캐시 값 또는 run() 결과 (metrics: <name>_hit / _miss / _shared).
+        on_wait()는 진행 중인 실행을 기다리게 될 때 한 번 호출된다.
+        """
+        with self._lock:
+            entry = self._lru.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                metrics.count(f"{name}_hit")
+                return entry[1]
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = Future()
+
+        if not leader:
+            metrics.count(f"{name}_shared")
+            if on_wait:
+                on_wait()
+            return flight.result()
+
+        metrics.count(f"{name}_miss")
+        try:
+            value = run()
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        else:
+            self._lru.put(key, (time.monotonic() + self.ttl, value))
+            flight.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def discard_if(self, predicate) -> int:
+        """캐시된 값 중 predicate(value)가 참인 것만 버림 (진행 중인 실행은 그대로)"""
+        return self._lru.discard_if(lambda entry: predicate(entry[1]))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._lru = BoundedLRU(self._lru.max_items, self._lru.max_bytes)
+
+
+_search_cache = None
+
+
+def get_search_cache() -> SharedResultCache:
+    """세션 공용 검색 결과 캐시"""
+    global _search_cache
+    with _store_lock:
+        if _search_cache is None:
+            _search_cache = SharedResultCache()
+        return _search_cache
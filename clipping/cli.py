@@ -0,0 +1,181 @@
+# ============================================================
+#  네이버 뉴스 클리핑 - 헤드리스 CLI
+#
+#  실행 방법:
+#    python -m clipping "패션 트렌드" --days 3 -o result.xlsx
+#    python -m clipping -f keywords.txt --format csv -o morning.csv
+#    python -m clipping -f keywords.txt --format sheets -o morning.xlsx   # 키워드별 시트
+#    python -m clipping -f keywords.txt -o morning.parquet                # 확장자로 형식 결정
+#    python -m clipping --archive "브랜드" --since 2026-07-01 -o q3.xlsx   # 네트워크 없이
+#
+#  API 키: 환경변수 NAVER_CLIENT_ID / NAVER_CLIENT_SECRET
+#          (없으면 .streamlit/secrets.toml 의 [naver] 항목)
+# ============================================================
+
+import os
+import sys
+import json
+import time
+import argparse
+from datetime import datetime, timedelta
+
+from . import metrics
+from .config import KST
+from .export import EXPORT_FORMATS, available_formats, format_for_path, write_export
+
+FORMATS = tuple(EXPORT_FORMATS)
+
+
+def load_credentials() -> tuple:
+    client_id     = os.environ.get("NAVER_CLIENT_ID", "")
+    client_secret = os.environ.get("NAVER_CLIENT_SECRET", "")
+    if client_id and client_secret:
+        return client_id, client_secret
+    try:
+        import tomllib
+        with open(os.path.join(".streamlit", "secrets.toml"), "rb") as f:
+            naver = tomllib.load(f).get("naver", {})
+        return naver.get("client_id", ""), naver.get("client_secret", "")
+    except (OSError, ValueError):
+        return client_id, client_secret
+
+
+def build_parser() -> argparse.ArgumentParser:
+    from .extras import EXTRA_CRAWLERS
+
+    parser = argparse.ArgumentParser(
+        prog="python -m clipping",
+        description="네이버 뉴스 클리핑 (헤드리스)",
+    )
+    parser.add_argument("queries", nargs="*", help="검색어 (여러 개면 일괄 검색)")
+    parser.add_argument("-f", "--file", help="검색어 파일 (한 줄에 하나)")
+    parser.add_argument("--days", type=int, default=7, help="수집 기간 (일, 기본 7)")
+    parser.add_argument(
+        "--extras", default="all",
+        help=f"추가 매체: all | none | 쉼표 구분 ({', '.join(EXTRA_CRAWLERS)})")
+    parser.add_argument("--incremental", action="store_true",
+                        help="직전 결과 이후의 새 기사만 수집 (검색어 1개일 때)")
+    parser.add_argument("--collapse", action="store_true",
+                        help="유사 기사 묶음마다 한 건만 출력")
+    parser.add_argument("--format", choices=FORMATS,
+                        help="출력 형식 (기본: 출력 파일 확장자, 없으면 xlsx) — "
+                             "sheets = 요약 + 키워드별 시트 엑셀")
+    parser.add_argument("-o", "--output", help="출력 파일 경로")
+    parser.add_argument("-q", "--quiet", action="store_true", help="진행 상황 출력 안 함")
+    parser.add_argument("--metrics-port", type=int,
+                        help="실행 중 http://127.0.0.1:PORT/metrics 로 Prometheus 지표 제공")
+    parser.add_argument("--metrics-file",
+                        help="끝난 뒤 Prometheus 텍스트 지표를 이 파일에 기록 (textfile collector용)")
+    parser.add_argument("--report", action="store_true",
+                        help="구간 · 호스트별 계측 요약(JSON)을 stderr에 출력")
+
+    archive = parser.add_argument_group("아카이브 조회 (--archive, 네트워크 없이 로컬 보관분 검색)")
+    archive.add_argument("--archive", action="store_true",
+                         help="검색 API 대신 로컬 아카이브에서 조회 (검색어가 없으면 기간 내 전체)")
+    archive.add_argument("--since", type=_date, help="게시일 시작 (YYYY-MM-DD, 포함)")
+    archive.add_argument("--until", type=_date, help="게시일 끝 (YYYY-MM-DD, 포함)")
+    archive.add_argument("--group", action="append", default=[],
+                         help="그룹 필터 (여러 번 지정 가능, 예: '그룹 A', 미분류)")
+    archive.add_argument("--publisher", action="append", default=[],
+                         help="매체명 필터 (여러 번 지정 가능)")
+    return parser
+
+
+def _date(value: str) -> datetime:
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=KST)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"날짜 형식은 YYYY-MM-DD 입니다: {value}")
+
+
+def main(argv: list | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    from .extras import EXTRA_CRAWLERS
+    from .search import SearchError, run_all_sources
+
+    queries = list(args.queries)
+    if args.file:
+        with open(args.file, encoding="utf-8") as f:
+            queries += [line.strip() for line in f if line.strip()]
+    queries = list(dict.fromkeys(q.strip() for q in queries if q.strip()))
+    if not queries and not args.archive:
+        parser.error("검색어를 입력해주세요.")
+
+    if args.extras == "all":
+        extras = list(EXTRA_CRAWLERS)
+    elif args.extras == "none":
+        extras = []
+    else:
+        extras = [name.strip() for name in args.extras.split(",") if name.strip()]
+        unknown = [name for name in extras if name not in EXTRA_CRAWLERS]
+        if unknown:
+            parser.error(f"알 수 없는 추가 매체: {', '.join(unknown)}")
+
+    client_id, client_secret = load_credentials()
+    if not args.archive and (not client_id or not client_secret):
+        print("API 키가 설정되지 않았습니다. NAVER_CLIENT_ID / NAVER_CLIENT_SECRET 을 확인해주세요.",
+              file=sys.stderr)
+        return 2
+
+    fmt = args.format or format_for_path(args.output or "")
+    if fmt not in available_formats():
+        parser.error(f"{EXPORT_FORMATS[fmt]['label']} 내보내기에는 pyarrow가 필요합니다 "
+                     "(pip install pyarrow)")
+    if not queries:
+        label = "archive"
+    else:
+        label = queries[0] if len(queries) == 1 else f"{queries[0]}_외{len(queries) - 1}건"
+    output = args.output
+    if not output:
+        ext = EXPORT_FORMATS[fmt]["ext"]
+        output = f"naver_news_{label}_{datetime.now(KST).strftime('%Y%m%d_%H%M%S')}.{ext}"
+
+    last_pct = -100
+
+    def progress(pct: int, message: str) -> None:
+        # 크롤링 진행 문구는 5% 단위로만 출력
+        nonlocal last_pct
+        if args.quiet or (message.startswith("🔄") and pct - last_pct < 5):
+            return
+        last_pct = pct
+        print(f"[{pct:3d}%] {message.replace(chr(10), ' | ')}", file=sys.stderr)
+
+    if args.metrics_port:
+        metrics.serve_metrics(args.metrics_port)
+
+    started = time.perf_counter()
+    try:
+        with metrics.recording(", ".join(queries)) as report:
+            if args.archive:
+                from .archive import search_archive
+                df = search_archive(queries, args.since,
+                                    args.until + timedelta(days=1) if args.until else None,
+                                    tuple(args.group), tuple(args.publisher))
+            else:
+                df = run_all_sources(queries, client_id, client_secret, progress, args.days,
+                                     extras=extras, batch=len(queries) > 1,
+                                     incremental=args.incremental)
+            if df is not None and not df.empty:
+                if args.collapse:
+                    from .dedupe import collapse_clusters
+                    df = collapse_clusters(df)
+                write_export(df, output, fmt, label)
+    except SearchError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+    finally:
+        if args.metrics_file:
+            with open(args.metrics_file, "w", encoding="utf-8") as f:
+                f.write(metrics.render_prometheus())
+    if args.report:
+        print(json.dumps(report.summary(), ensure_ascii=False, indent=1), file=sys.stderr)
+
+    if df is None or df.empty:
+        print("검색 결과가 없습니다.", file=sys.stderr)
+        return 1
+
+    if not args.quiet:
+        print(f"{len(df)}건 → {output} ({time.perf_counter() - started:.1f}초)", file=sys.stderr)
+    return 0
@@ -0,0 +1,136 @@
+# ============================================================
+#  네이버 뉴스 클리핑 - 설정값
+# ============================================================
+
+import os
+from datetime import timedelta, timezone
+
+KST = timezone(timedelta(hours=9))
+
+MAX_WORKERS     = 10
+REQUEST_TIMEOUT = 6
+HEADERS = {
+    'User-Agent': (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+        'AppleWebKit/537.36 (KHTML, like Gecko) '
+        'Chrome/124.0.0.0 Safari/537.36'
+    )
+}
+
+
+# ── 기사 크롤링 백엔드 ───────────────────────────────────────
+#   "async"  : asyncio + aiohttp, 호스트별 keep-alive 커넥션 풀 재사용
+#   "thread" : ThreadPoolExecutor(MAX_WORKERS) + 공유 requests.Session
+FETCH_BACKEND         = "async"
+ASYNC_MAX_CONCURRENCY = 200     # 전체 동시 요청 수
+ASYNC_PER_HOST_LIMIT  = 32      # 호스트당 동시 연결 수
+
+# ── 기사 스트리밍 수집 ───────────────────────────────────────
+#   매체 로고 · og:article:author · PICK 라벨은 문서 앞부분에 있으므로
+#   본문 시작 전에 확인되면 파싱을 멈춘다. 본문을 다 받지 않고 끊으면
+#   keep-alive 커넥션을 버리게 되므로(다음 요청에 TCP+TLS 핸드셰이크),
+#   남은 본문이 STREAM_DRAIN_MAX 이하면 파싱 없이 마저 받아 커넥션을
+#   풀에 돌려주고, 그보다 크면 끊는다.
+ARTICLE_STREAMING  = True
+STREAM_CHUNK_SIZE  = 16 * 1024
+STREAM_BYTE_CAP    = 512 * 1024    # 안전 상한 (이 이상은 읽지 않음)
+STREAM_DRAIN_MAX   = 64 * 1024     # 조기 종료 뒤 마저 받을 남은 본문 상한
+
+# ── HTML 파서 (clipping.parsing) ─────────────────────────────
+#   "auto" : selectolax > lxml > html.parser 중 설치된 가장 빠른 것
+HTML_PARSER = os.environ.get("CLIPPING_HTML_PARSER", "auto")
+
+# ── 네이버 검색 API 페이지네이션 ─────────────────────────────
+NAVER_API_URL   = os.environ.get("NAVER_API_URL", "https://openapi.naver.com/v1/search/news.json")
+API_TIMEOUT     = 10
+API_PAGE_SIZE   = 100      # display 최댓값
+API_MAX_START   = 1000     # start 최댓값 → 최대 1,000건
+API_MAX_WORKERS = 4        # 페이지 동시 요청 수
+API_RATE_LIMIT  = 8        # 초당 최대 API 요청 수
+
+# ── 호스트별 요청 제한 · 재시도 (clipping.http) ─────────────
+#   호스트 → (초당 요청 수, 동시 요청 수). 검색 API 호스트는 위 API 설정을 따른다.
+HOST_LIMITS = {
+    "n.news.naver.com": (100, 32),
+    "m.news.naver.com": (100, 32),
+}
+DEFAULT_HOST_LIMIT = (20, 8)
+HTTP_MAX_RETRIES   = 3
+RETRY_STATUSES     = (429, 500, 502, 503, 504)
+BACKOFF_BASE       = 0.5     # 재시도 대기 시간 = U(0, min(BACKOFF_MAX, BASE × 2^n))
+BACKOFF_MAX        = 8
+RETRY_AFTER_MAX    = 30      # 이보다 긴 Retry-After는 기다리지 않고 실패 처리
+
+# ── 추가 매체 동시 수집 ─────────────────────────────────────
+EXTRA_MAX_WORKERS     = 16
+EXTRA_SOURCE_DEADLINE = 10     # 추가 매체 한 건(매체 × 키워드)당 최대 대기 시간 (초)
+
+# ── 진행 중 미리보기 (API 수집 직후부터 결과 표시) ──────────
+PREVIEW_INTERVAL = 0.5    # 크롤링 결과를 미리보기에 반영하는 최소 간격 (초)
+PREVIEW_ROWS     = 100    # 미리보기로 그리는 행 수
+
+# ── 백그라운드 검색 작업 (clipping.jobs) ─────────────────────
+JOB_MAX_RUNNING   = 2          # 동시에 실행하는 검색 수 (프로세스 전체)
+JOB_MAX_QUEUED    = 3          # 세션당 대기 + 실행 중 작업 상한
+JOB_RESULT_TTL    = 30 * 60    # 끝난 작업 결과 보관 시간 (초)
+JOB_POLL_INTERVAL = 1.0        # 화면의 진행 상태 갱신 주기 (초)
+
+# ── 매체 매핑 파일 (clipping.publishers) ────────────────────
+#   파일을 고치면 재시작 없이 PUBLISHER_RELOAD_INTERVAL 안에 반영된다
+PUBLISHER_MAP_PATH = os.environ.get(
+    "CLIPPING_PUBLISHER_MAP",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "publishers.json"))
+PUBLISHER_RELOAD_INTERVAL = 5    # 파일 변경 확인 간격 (초)
+
+# ── 세션 공용 검색 결과 캐시 (같은 검색은 한 번만 실행) ──────
+SEARCH_CACHE_TTL   = 120                  # 결과 재사용 시간 (초)
+SEARCH_CACHE_ITEMS = 64
+SEARCH_CACHE_BYTES = 128 * 1024 * 1024    # 총 크기 상한
+
+# ── 기사 정보 캐시 (SQLite, 링크 기준) ──────────────────────
+#   매체명은 바뀌지 않으므로 길게, PICK은 나중에 붙을 수 있어 짧게 보관
+ARTICLE_CACHE_PATH     = os.environ.get("CLIPPING_CACHE_PATH", ".cache/article_info.sqlite3")
+ARTICLE_CACHE_MAX_ROWS = 50_000              # 초과 시 오래 안 쓴 항목부터 제거 (LRU)
+PUBLISHER_TTL          = 30 * 24 * 3600      # 매체명 유효기간 (초)
+PICK_TTL               = 3 * 3600            # PICK 미지정 결과 유효기간 (초)
+
+# ── 증분 검색 (검색어 · 기간별 직전 결과 보관) ──────────────
+SNAPSHOT_PATH    = os.environ.get("CLIPPING_SNAPSHOT_PATH", ".cache/search_snapshots.sqlite3")
+SNAPSHOT_MAX_AGE = 6 * 3600    # 이보다 오래된 결과는 전체 재검색 (PICK 갱신 목적)
+
+# ── 예약 사전 수집 (python -m clipping.prewarm) ───────────────
+#   자주 찾는 키워드를 한가한 시간에 미리 수집해 두고, 화면 검색은 저장된
+#   결과를 바로 보여준 뒤 그 이후의 새 기사만 증분으로 반영한다.
+PREWARM_PATH          = os.environ.get("CLIPPING_PREWARM_PATH", ".cache/prewarm.sqlite3")
+PREWARM_KEYWORDS_PATH = os.environ.get("CLIPPING_PREWARM_KEYWORDS", "prewarm_keywords.txt")
+PREWARM_SCHEDULE      = os.environ.get("CLIPPING_PREWARM_SCHEDULE", "20 8 * * 1-5")   # cron 5필드 (KST)
+PREWARM_MAX_AGE       = 12 * 3600    # 이보다 오래된 사전 수집 결과는 화면에 쓰지 않음 (초)
+
+# ── 기사 아카이브 (clipping.archive, SQLite FTS5) ─────────────
+ARCHIVE_PATH        = os.environ.get("CLIPPING_ARCHIVE_PATH", ".cache/archive.sqlite3")
+ARCHIVE_QUERY_LIMIT = 5000    # 아카이브 조회 최대 건수
+
+# ── 유사 기사 묶기 (MinHash + LSH, clipping.dedupe) ──────────
+#   밴드 수 b, 밴드당 행 수 r = NUM_PERM / b 일 때 후보가 되는 유사도 ≈ (1/b)^(1/r)
+CLUSTER_SHINGLE   = 3       # 제목 문자 n-gram 길이
+CLUSTER_NUM_PERM  = 64      # MinHash 서명 길이
+CLUSTER_BANDS     = 16      # → 밴드당 4행, 후보 기준 유사도 ≈ 0.5
+CLUSTER_THRESHOLD = 0.6     # 후보 중 추정 유사도(3-gram Jaccard)가 이 이상이면 같은 묶음
+
+# ── 계측 (clipping.metrics) ──────────────────────────────────
+METRICS_LOG_PATH = os.environ.get("CLIPPING_METRICS_LOG", ".cache/metrics.jsonl")   # 검색별 JSON Lines
+LATENCY_BUCKETS  = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)   # 요청 시간 히스토그램 경계 (초)
+
+# ── 내보내기 (clipping.export) ────────────────────────────────
+EXPORT_CHUNK_ROWS = 5000    # 한 번에 변환 · 기록하는 행 수 (Parquet은 row group 크기)
+
+# ── 화면 파생 결과 캐시 (필터 · 정렬 뷰, 엑셀 바이트) ─────────
+VIEW_CACHE_ITEMS = 8                  # 세션별로 남겨둘 변형 개수
+VIEW_CACHE_BYTES = 64 * 1024 * 1024   # 세션별 총 크기 상한
+
+GROUP_COLORS = {
+    "그룹 A": "#D5F5E3",
+    "그룹 B": "#FEF9E7",
+    "그룹 C": "#FDEBD0",
+    "":       "#FFFFFF",
+}
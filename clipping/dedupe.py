@@ -0,0 +1,125 @@
+# ============================================================
+#  네이버 뉴스 클리핑 - 유사 기사 묶기 (MinHash + LSH)
+#
+#  같은 통신 기사를 매체마다 조금씩 고쳐 쓴 제목을 한 묶음으로 모은다.
+#  제목을 문자 n-gram으로 쪼개 MinHash 서명을 만들고, 서명을 밴드로
+#  나눠 같은 버킷에 들어간 제목끼리만 비교하므로 제목 수에 거의
+#  비례하는 시간에 끝난다 (전체 쌍 비교 없음).
+# ============================================================
+
+from __future__ import annotations
+
+import re
+import zlib
+from typing import TYPE_CHECKING
+
+from .config import CLUSTER_SHINGLE, CLUSTER_NUM_PERM, CLUSTER_BANDS, CLUSTER_THRESHOLD
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_BLOCK = 2048    # 서명 계산 시 한 번에 처리할 제목 수 (메모리 상한)
+
+# [단독] · (종합) · <포토> 같은 머리말과 문장부호는 비교에서 뺀다
+_TAG_RE = re.compile(r'\[[^\]]*\]|\([^)]*\)|<[^>]*>|【[^】]*】')
+_NON_WORD_RE = re.compile(r'[^0-9a-z가-힣]+')
+
+
+def normalize_title(title: str) -> str:
+    title = _TAG_RE.sub(' ', title.lower())
+    return _NON_WORD_RE.sub('', title)
+
+
+def shingles(title: str, k: int = CLUSTER_SHINGLE) -> set:
+    """정규화한 제목 → 문자 k-gram 해시 집합"""
+    text = normalize_title(title)
+    if len(text) <= k:
+        return {zlib.crc32(text.encode())} if text else set()
+    return {zlib.crc32(text[i:i + k].encode()) for i in range(len(text) - k + 1)}
+
+
+def minhash_signatures(titles: list, num_perm: int = CLUSTER_NUM_PERM, seed: int = 1):
+    """
+    제목 목록 → (len(titles), num_perm) uint64 MinHash 서명 행렬.
+    n-gram이 없는 제목은 전부 최댓값인 행이 되어 어떤 제목과도 묶이지 않는다.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    # n-gram 해시가 32비트이므로 a < 2^31 이면 a·x + b 가 uint64 안에 들어간다
+    a = rng.integers(1, 1 << 31, size=num_perm, dtype=np.uint64)
+    b = rng.integers(0, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+    empty = np.iinfo(np.uint64).max
+
+    sets = [np.fromiter(shingles(t), dtype=np.uint64) for t in titles]
+    signatures = np.full((len(titles), num_perm), empty, dtype=np.uint64)
+    for lo in range(0, len(sets), _BLOCK):
+        block = sets[lo:lo + _BLOCK]
+        sizes = np.array([len(s) for s in block])
+        filled = np.flatnonzero(sizes)
+        if not len(filled):
+            continue
+        values = np.concatenate([block[i] for i in filled])
+        hashed = (a[:, None] * values + b[:, None]) % np.uint64(_MERSENNE_PRIME)
+        offsets = np.concatenate([[0], np.cumsum(sizes[filled])[:-1]])
+        signatures[lo + filled] = np.minimum.reduceat(hashed, offsets, axis=1).T
+    return signatures
+
+
+def cluster_titles(titles: list, threshold: float = CLUSTER_THRESHOLD,
+                   num_perm: int = CLUSTER_NUM_PERM, bands: int = CLUSTER_BANDS) -> list:
+    """
+    제목 목록 → 묶음 번호 리스트 (입력 순서상 처음 나온 제목 기준 0, 1, 2 ...).
+    같은 밴드 버킷에 들어온 후보 중 추정 유사도(서명 일치 비율)가
+    threshold 이상인 것만 묶는다.
+    """
+    import numpy as np
+
+    n = len(titles)
+    signatures = minhash_signatures(titles, num_perm)
+    rows = num_perm // bands
+    parent = list(range(n))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    valid = signatures[:, 0] != np.iinfo(np.uint64).max
+    for band in range(bands):
+        keys = signatures[:, band * rows:(band + 1) * rows]
+        buckets = {}
+        for i in np.flatnonzero(valid):
+            buckets.setdefault(keys[i].tobytes(), []).append(i)
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            head = members[0]
+            for other in members[1:]:
+                root_head, root_other = find(head), find(other)
+                if root_head == root_other:
+                    continue
+                if np.mean(signatures[head] == signatures[other]) >= threshold:
+                    parent[max(root_head, root_other)] = min(root_head, root_other)
+
+    ids, labels = {}, []
+    for i in range(n):
+        labels.append(ids.setdefault(find(i), len(ids)))
+    return labels
+
+
+def add_clusters(df: pd.DataFrame) -> pd.DataFrame:
+    """결과 DataFrame에 클러스터(묶음 번호) · 유사기사(묶음 크기) 컬럼 추가"""
+    df = df.copy()
+    df["클러스터"] = cluster_titles(df["제목"].tolist())
+    df["유사기사"] = df.groupby("클러스터")["클러스터"].transform("size")
+    return df
+
+
+def collapse_clusters(df: pd.DataFrame) -> pd.DataFrame:
+    """묶음마다 현재 순서상 첫 기사만 남김 (클러스터 컬럼이 없으면 그대로)"""
+    if "클러스터" not in df.columns:
+        return df
+    return df.drop_duplicates(subset="클러스터").reset_index(drop=True)
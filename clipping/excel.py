@@ -0,0 +1,163 @@
+# ============================================================
+#  네이버 뉴스 클리핑 - 엑셀 내보내기
+#
+#  write_excel           : 시트 하나 (화면 다운로드 · CLI 기본)
+#  write_keyword_workbook: 요약 시트 + 키워드별 시트 (일괄 검색 결과)
+# ============================================================
+
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING, BinaryIO
+
+from . import metrics
+from .config import GROUP_COLORS, EXPORT_CHUNK_ROWS
+from .frame import GROUPS, DATE_FORMAT, export_frame
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+SHEET_NAME = '뉴스클리핑'
+SUMMARY_SHEET_NAME = '요약'
+COL_WIDTHS = {"그룹": 8, "매체명": 16, "제목": 60, "PICK": 6, "게시일": 18, "키워드": 24,
+              "클러스터": 9, "유사기사": 9}
+
+
+def _column_values(series: pd.Series) -> list:
+    """컬럼 → 파이썬 값 리스트 (결측값은 None → 빈 셀)"""
+    return series.astype(object).where(series.notna(), None).tolist()
+
+
+def write_excel(df: pd.DataFrame, target: str | BinaryIO) -> None:
+    """
+    결과 DataFrame → 서식 적용 엑셀을 target(파일 경로 또는 바이너리 파일 객체)에 기록.
+
+    xlsxwriter constant_memory 모드로 행 단위로 한 번씩만 쓰고 바로 디스크로
+    내보내므로, 행 수와 관계없이 메모리 사용량이 거의 일정하다.
+    제목 컬럼은 이 시점에 =HYPERLINK(...) 수식으로 만들어 기록한다 (링크 컬럼은 제외).
+    """
+    with metrics.stage("excel"):
+        workbook = _Workbook(target)
+        try:
+            workbook.add_frame(SHEET_NAME, df)
+        finally:
+            workbook.close()
+
+
+def write_keyword_workbook(df: pd.DataFrame, target: str | BinaryIO, label: str = "") -> None:
+    """
+    결과 DataFrame → 요약 시트 + 키워드별 시트 엑셀.
+    여러 키워드에 걸린 기사는 해당 키워드 시트마다 들어간다.
+    키워드 컬럼이 없으면 label(검색어) 시트 하나로 쓴다.
+    """
+    with metrics.stage("excel"):
+        if "키워드" in df.columns:
+            keywords = df["키워드"].astype(str).str.split(", ").explode()
+            keywords = keywords[keywords != ""]
+            sheets = {kw: df.loc[rows.index.unique()]
+                      for kw, rows in keywords.groupby(keywords, sort=False)}
+        else:
+            sheets = {label or SHEET_NAME: df}
+
+        workbook = _Workbook(target)
+        try:
+            names = workbook.sheet_names(list(sheets))
+            workbook.add_summary([_summary_row(kw, names[kw], part) for kw, part in sheets.items()])
+            for kw, part in sheets.items():
+                workbook.add_frame(names[kw], part)
+        finally:
+            workbook.close()
+
+
+def _summary_row(keyword: str, sheet: str, df: pd.DataFrame) -> dict:
+    latest = df["게시일"].max()
+    return {
+        "키워드": keyword, "시트": sheet, "전체": len(df),
+        **{group or "미분류": int((df["그룹"] == group).sum()) for group in GROUPS},
+        "PICK": int(df["PICK"].sum()),
+        "최근 게시일": "" if latest != latest else latest.strftime(DATE_FORMAT),   # NaT
+    }
+
+
+class _Workbook:
+    """constant_memory 워크북 (시트는 하나씩 끝까지 쓴 뒤 다음 시트로)"""
+
+    _INVALID_SHEET_CHARS = str.maketrans({c: "_" for c in "[]:*?/\\"})
+
+    def __init__(self, target: str | BinaryIO):
+        import xlsxwriter
+
+        self.book = xlsxwriter.Workbook(target, {'constant_memory': True})
+        self.header_fmt = self.book.add_format({
+            'bold': True, 'bg_color': '#2C3E50', 'font_color': '#FFFFFF',
+            'border': 1, 'align': 'center', 'valign': 'vcenter',
+        })
+        # 그룹 → 셀 서식 (색상별로 한 번만 생성)
+        fmt_by_color = {}
+        for color in set(GROUP_COLORS.values()):
+            fmt_by_color[color] = self.book.add_format({
+                'bg_color': color, 'border': 1, 'valign': 'vcenter',
+            })
+        self.default_fmt = fmt_by_color[GROUP_COLORS[""]]
+        self.group_fmt = {group: fmt_by_color[color] for group, color in GROUP_COLORS.items()}
+
+    def close(self) -> None:
+        self.book.close()
+
+    def sheet_names(self, names: list) -> dict:
+        """이름 → 엑셀에서 쓸 수 있는 시트 이름 (31자, 금지 문자 치환, 중복 시 번호)"""
+        used, result = {SUMMARY_SHEET_NAME}, {}
+        for name in names:
+            base = (str(name).translate(self._INVALID_SHEET_CHARS).strip("'") or "시트")[:31]
+            candidate, n = base, 2
+            while candidate.lower() in used:
+                suffix = f" ({n})"
+                candidate, n = base[:31 - len(suffix)] + suffix, n + 1
+            used.add(candidate.lower())
+            result[name] = candidate
+        return result
+
+    def add_summary(self, rows: list) -> None:
+        worksheet = self.book.add_worksheet(SUMMARY_SHEET_NAME)
+        columns = list(rows[0]) if rows else ["키워드"]
+        for col_num, col_name in enumerate(columns):
+            worksheet.set_column(col_num, col_num, COL_WIDTHS.get(col_name, 12))
+        worksheet.freeze_panes(1, 0)
+        worksheet.write_row(0, 0, columns, self.header_fmt)
+        for row_idx, row in enumerate(rows, start=1):
+            worksheet.write_row(row_idx, 0, [row[col] for col in columns], self.default_fmt)
+
+    def add_frame(self, name: str, df: pd.DataFrame) -> None:
+        """결과 DataFrame → 시트 (EXPORT_CHUNK_ROWS행씩 내보내기 형식으로 바꿔 기록)"""
+        worksheet = self.book.add_worksheet(name)
+        columns = list(export_frame(df.iloc[:0]).columns)
+
+        # constant_memory 모드는 행 순서대로만 쓸 수 있으므로 열 너비 · 틀 고정을 먼저 지정
+        for col_num, col_name in enumerate(columns):
+            worksheet.set_column(col_num, col_num, COL_WIDTHS.get(col_name, 12))
+        worksheet.freeze_panes(1, 0)
+        worksheet.autofilter(0, 0, len(df), len(columns) - 1)
+        worksheet.write_row(0, 0, columns, self.header_fmt)
+
+        title_col = columns.index("제목") if "제목" in columns else -1
+        write, write_formula = worksheet.write, worksheet.write_formula
+        row_idx = 1
+        for start in range(0, len(df), EXPORT_CHUNK_ROWS):
+            chunk = export_frame(df.iloc[start:start + EXPORT_CHUNK_ROWS])
+            row_formats = [self.group_fmt.get(group, self.default_fmt)
+                           for group in chunk["그룹"].tolist()]
+            values = [_column_values(chunk[col]) for col in columns]
+            for cell_fmt, row in zip(row_formats, zip(*values)):
+                for col_num, value in enumerate(row):
+                    if col_num == title_col and value:
+                        write_formula(row_idx, col_num, value, cell_fmt)
+                    else:
+                        write(row_idx, col_num, value, cell_fmt)
+                row_idx += 1
+
+
+def build_excel(df: pd.DataFrame) -> bytes:
+    """DataFrame → 서식 적용 엑셀 바이트 반환"""
+    output = io.BytesIO()
+    write_excel(df, output)
+    return output.getvalue()
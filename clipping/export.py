@@ -0,0 +1,162 @@
+# ============================================================
+#  네이버 뉴스 클리핑 - 결과 내보내기 (형식별 스트리밍 기록)
+#
+#  xlsx    : 서식 엑셀 시트 하나 (제목 = HYPERLINK 수식)
+#  sheets  : 서식 엑셀, 요약 시트 + 키워드별 시트
+#  csv     : UTF-8 BOM (엑셀에서 한글 깨짐 방지), PICK · 게시일은 표시용 문자열
+#  json    : 레코드 배열 (csv와 같은 값)
+#  jsonl   : 한 줄에 레코드 하나 — PICK은 true/false, 게시일은 ISO 8601 (+09:00)
+#  parquet : 그룹 · 매체명 dictionary, PICK bool, 게시일 timestamp(+09:00) (pyarrow 필요)
+#
+#  모든 형식은 EXPORT_CHUNK_ROWS행씩 변환해 바로 기록한다 → 변환된 파일 전체를
+#  메모리에 만들지 않고, 파일로 쓰면 행 수와 관계없이 메모리 사용량이 거의 일정하다.
+# ============================================================
+
+from __future__ import annotations
+
+import io
+import json
+import contextlib
+import importlib.util
+from typing import TYPE_CHECKING, BinaryIO
+
+from . import metrics
+from .config import EXPORT_CHUNK_ROWS
+from .frame import export_frame
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+_XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+EXPORT_FORMATS = {
+    "xlsx":    {"ext": "xlsx",    "mime": _XLSX_MIME,                    "label": "엑셀"},
+    "sheets":  {"ext": "xlsx",    "mime": _XLSX_MIME,                    "label": "엑셀 (키워드별 시트)"},
+    "csv":     {"ext": "csv",     "mime": "text/csv",                    "label": "CSV"},
+    "json":    {"ext": "json",    "mime": "application/json",            "label": "JSON"},
+    "jsonl":   {"ext": "jsonl",   "mime": "application/x-ndjson",        "label": "JSON Lines"},
+    "parquet": {"ext": "parquet", "mime": "application/vnd.apache.parquet", "label": "Parquet"},
+}
+
+
+def available_formats() -> list:
+    """설치된 라이브러리로 쓸 수 있는 형식 (parquet은 pyarrow가 있을 때만)"""
+    has_arrow = importlib.util.find_spec("pyarrow") is not None
+    return [fmt for fmt in EXPORT_FORMATS if fmt != "parquet" or has_arrow]
+
+
+def format_for_path(path: str, default: str = "xlsx") -> str:
+    """출력 파일 확장자 → 형식 (모르는 확장자면 default)"""
+    ext = path.rsplit(".", 1)[-1].lower() if "." in path else ""
+    return next((fmt for fmt, spec in EXPORT_FORMATS.items() if spec["ext"] == ext), default)
+
+
+def _chunks(df: pd.DataFrame):
+    for start in range(0, len(df), EXPORT_CHUNK_ROWS):
+        yield df.iloc[start:start + EXPORT_CHUNK_ROWS]
+
+
+@contextlib.contextmanager
+def _binary(target: str | BinaryIO):
+    if isinstance(target, str):
+        with open(target, "wb") as f:
+            yield f
+    else:
+        yield target
+
+
+# ── 형식별 기록 ───────────────────────────────────────────────
+
+def _write_csv(df: pd.DataFrame, out: BinaryIO) -> None:
+    out.write("\ufeff".encode())
+    out.write(export_frame(df.iloc[:0], hyperlink=False).to_csv(index=False).encode())
+    for chunk in _chunks(df):
+        out.write(export_frame(chunk, hyperlink=False).to_csv(index=False, header=False).encode())
+
+
+def _write_json(df: pd.DataFrame, out: BinaryIO) -> None:
+    out.write(b"[")
+    sep = b"\n"
+    for chunk in _chunks(df):
+        for record in export_frame(chunk, hyperlink=False).to_dict("records"):
+            out.write(sep + json.dumps(record, ensure_ascii=False).encode())
+            sep = b",\n"
+    out.write(b"\n]\n")
+
+
+def _typed_columns(chunk: pd.DataFrame) -> dict:
+    """컬럼 → JSON에 그대로 쓸 파이썬 값 리스트 (게시일은 ISO 8601, 없으면 None)"""
+    columns = {col: chunk[col].astype(object).tolist() for col in chunk.columns if col != "게시일"}
+    columns["게시일"] = [None if d is None or d != d else d.isoformat()
+                        for d in chunk["게시일"].tolist()]
+    return columns
+
+
+def _write_jsonl(df: pd.DataFrame, out: BinaryIO) -> None:
+    names = list(df.columns)
+    for chunk in _chunks(df):
+        columns = _typed_columns(chunk)
+        lines = [json.dumps(dict(zip(names, row)), ensure_ascii=False)
+                 for row in zip(*(columns[name] for name in names))]
+        if lines:
+            out.write(("\n".join(lines) + "\n").encode())
+
+
+def _arrow_schema(df: pd.DataFrame):
+    import pyarrow as pa
+
+    types = {
+        "그룹":     pa.dictionary(pa.int8(), pa.string()),
+        "매체명":   pa.dictionary(pa.int32(), pa.string()),
+        "제목":     pa.string(),
+        "링크":     pa.string(),
+        "PICK":     pa.bool_(),
+        "게시일":   pa.timestamp("us", tz="+09:00"),
+        "키워드":   pa.string(),
+        "클러스터": pa.int32(),
+        "유사기사": pa.int32(),
+    }
+    return pa.schema([(col, types.get(col, pa.string())) for col in df.columns])
+
+
+def _write_parquet(df: pd.DataFrame, out: BinaryIO) -> None:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = _arrow_schema(df)
+    with pq.ParquetWriter(out, schema, compression="zstd") as writer:
+        for chunk in _chunks(df):    # 조각 하나 = row group 하나
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+_WRITERS = {
+    "csv": _write_csv,
+    "json": _write_json,
+    "jsonl": _write_jsonl,
+    "parquet": _write_parquet,
+}
+
+
+def write_export(df: pd.DataFrame, target: str | BinaryIO, fmt: str, label: str = "") -> None:
+    """
+    결과 DataFrame → target(파일 경로 또는 바이너리 파일 객체)에 fmt 형식으로 기록.
+    label은 키워드 컬럼이 없을 때 키워드별 시트(sheets)의 시트 이름으로 쓴다.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"지원하지 않는 내보내기 형식: {fmt}")
+    if fmt == "xlsx":
+        from .excel import write_excel
+        write_excel(df, target)
+    elif fmt == "sheets":
+        from .excel import write_keyword_workbook
+        write_keyword_workbook(df, target, label)
+    else:
+        with metrics.stage("export"), _binary(target) as out:
+            _WRITERS[fmt](df, out)
+
+
+def build_export(df: pd.DataFrame, fmt: str, label: str = "") -> bytes:
+    """결과 DataFrame → fmt 형식 바이트 (화면 다운로드용)"""
+    output = io.BytesIO()
+    write_export(df, output, fmt, label)
+    return output.getvalue()
@@ -0,0 +1,130 @@
+# ============================================================
+#  네이버 뉴스 클리핑 - 외부 매체 크롤러 (네이버 미등록 4개 매체)
+#
+#  각 크롤러는 (query, since) → 행 dict 리스트를 반환한다 (요청 실패 시 예외).
+#  행 형식은 clipping.frame 스키마를 따른다 (frame_from_rows로 DataFrame 변환).
+#
+#  매체별 차이는 EXTRA_SITES의 선언(검색 URL · 선택자 · 날짜 위치)뿐이고,
+#  수집은 crawl_site 하나가 맡는다. 선택자는 clipping.parsing에서 한 번만
+#  컴파일되고, 날짜는 미리 컴파일한 정규식으로 바로 datetime을 만든다.
+# ============================================================
+
+import re
+from datetime import datetime
+from urllib.parse import quote, urljoin
+
+from . import parsing
+from .config import KST
+from .http import http_get
+
+_DATE_RE = re.compile(r'(\d{4})[.\-/](\d{2})[.\-/](\d{2})')
+MIN_TITLE_LENGTH = 5
+
+# ── 매체별 선언 ───────────────────────────────────────────────
+#   url    : 검색 페이지 ({query} 자리에 URL 인코딩된 검색어)
+#   items  : 기사 하나에 해당하는 요소
+#   anchor : items 안의 제목 링크 (None이면 items 자체가 링크)
+#   date   : 날짜를 찾을 범위 — "item"이면 items 요소, 태그 튜플이면
+#            링크에서 가장 가까운 상위 태그 (못 찾으면 날짜 없음)
+EXTRA_SITES = {
+    "패션인사이트": {
+        "url": "https://www.fi.co.kr/main/list.asp?search={query}",
+        "items": 'a[href*="view.asp"]',
+        "anchor": None,
+        "date": ("li", "div", "tr"),
+    },
+    "국제섬유신문": {
+        "url": "https://www.itnk.co.kr/news/articleList.html?sc_word={query}&view_type=sm",
+        "items": 'li.item, div.item, .article-list li',
+        "anchor": 'a[href]',
+        "date": "item",
+    },
+    "패션포스트": {
+        "url": ("https://fpost.co.kr/board/bbs/search.php?bo_table=mainFsp"
+                "&sfl=wr_subject%2Cwr_content&stx={query}"),
+        "items": 'a[href*="bo_table=mainFsp"]',
+        "anchor": None,
+        "date": ("li", "div", "tr", "td"),
+    },
+    "테넌트뉴스": {
+        "url": "https://tnnews.co.kr/?s={query}",
+        "items": 'div.item-details, div.td-module-meta-info',
+        "anchor": 'a[href]',
+        "date": "item",
+    },
+}
+
+
+def _find_date(text: str) -> datetime | None:
+    m = _DATE_RE.search(text)
+    if not m:
+        return None
+    try:
+        return datetime(int(m.group(1)), int(m.group(2)), int(m.group(3)), tzinfo=KST)
+    except ValueError:
+        return None
+
+
+def parse_site(name: str, html: str, base_url: str, since: datetime) -> list:
+    """검색 결과 페이지 HTML → 행 dict 리스트 (since 이전 기사는 제외)"""
+    spec = EXTRA_SITES[name]
+    results = []
+    for item in parsing.select(parsing.parse(html), spec["items"]):
+        a = parsing.select_one(item, spec["anchor"]) if spec["anchor"] else item
+        if a is None:
+            continue
+        href = parsing.attr(a, 'href')
+        title = parsing.text(a, strip=True)
+        if not href or len(title) < MIN_TITLE_LENGTH:
+            continue
+        scope = item if spec["date"] == "item" else parsing.closest(a, spec["date"])
+        pub_date = _find_date(parsing.text(scope)) if scope is not None else None
+        if pub_date and pub_date < since:
+            continue
+        results.append({
+            "그룹": "그룹 A", "매체명": name,
+            "제목": title, "링크": urljoin(base_url, href),
+            "PICK": False,
+            "게시일": pub_date,   # 날짜를 못 찾으면 None
+        })
+    return results
+
+
+def crawl_site(name: str, query: str, since: datetime) -> list:
+    """
+    EXTRA_SITES[name] 검색 페이지 크롤링.
+    요청 실패 · 비정상 응답은 예외로 올린다 — 빈 결과로 돌려주면 세션 공용
+    캐시에 "0건"으로 남아 다른 세션도 재시도하지 못한다.
+    """
+    search_url = EXTRA_SITES[name]["url"].format(query=quote(query))
+    res = http_get(search_url, timeout=8)
+    res.raise_for_status()
+    return parse_site(name, res.text, search_url, since)
+
+
+def crawl_fi(query: str, since: datetime) -> list:
+    """패션인사이트 fi.co.kr 크롤링"""
+    return crawl_site("패션인사이트", query, since)
+
+
+def crawl_itnk(query: str, since: datetime) -> list:
+    """국제섬유신문 itnk.co.kr 크롤링"""
+    return crawl_site("국제섬유신문", query, since)
+
+
+def crawl_fpost(query: str, since: datetime) -> list:
+    """패션포스트 fpost.co.kr 크롤링"""
+    return crawl_site("패션포스트", query, since)
+
+
+def crawl_tnnews(query: str, since: datetime) -> list:
+    """테넌트뉴스 tnnews.co.kr 크롤링"""
+    return crawl_site("테넌트뉴스", query, since)
+
+
+EXTRA_CRAWLERS = {
+    "패션인사이트": crawl_fi,
+    "국제섬유신문": crawl_itnk,
+    "패션포스트":   crawl_fpost,
+    "테넌트뉴스":   crawl_tnnews,
+}
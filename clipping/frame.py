@@ -0,0 +1,152 @@
+# ============================================================
+#  네이버 뉴스 클리핑 - 결과 DataFrame 스키마
+#
+#  그룹 · 매체명 : category
+#  제목 · 링크   : 문자열 (HYPERLINK 수식은 내보낼 때만 만든다)
+#  PICK          : bool
+#  게시일        : datetime64 (KST, 날짜를 모르면 NaT)
+#  키워드        : 문자열 (일괄 검색일 때만)
+#  클러스터 · 유사기사 : 유사 기사 묶음 번호 · 묶음 크기 (clipping.dedupe)
+# ============================================================
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from .config import KST
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+GROUPS = ["그룹 A", "그룹 B", "그룹 C", ""]   # "" = 미분류
+DATE_FORMAT = '%Y-%m-%d %H:%M'
+
+# 스냅샷 등 저장된 프레임의 스키마 버전 (바뀌면 이전 저장분은 무시)
+SCHEMA_VERSION = 2
+
+
+def _dates(values) -> pd.Series:
+    import pandas as pd
+
+    return pd.Series(pd.to_datetime(list(values), utc=True)).dt.tz_convert(KST)
+
+
+def make_frame(groups, publishers, titles, links, picks, pub_dates,
+               keywords=None) -> pd.DataFrame:
+    """컬럼별 배열 → 결과 DataFrame (pub_dates: tz-aware datetime 또는 None)"""
+    import pandas as pd
+
+    columns = {
+        "그룹":   pd.Categorical(list(groups), categories=GROUPS),
+        "매체명": pd.Categorical(list(publishers)),
+        "제목":   list(titles),
+        "링크":   list(links),
+        "PICK":   pd.array(list(picks), dtype=bool),
+        "게시일": _dates(pub_dates),
+    }
+    if keywords is not None:
+        columns["키워드"] = list(keywords)
+    return pd.DataFrame(columns)
+
+
+def frame_from_rows(rows: list) -> pd.DataFrame:
+    """행 dict 리스트(추가 매체 크롤러 결과) → 결과 DataFrame"""
+    has_keywords = any("키워드" in row for row in rows)
+    return make_frame(
+        (row["그룹"] for row in rows),
+        (row["매체명"] for row in rows),
+        (row["제목"] for row in rows),
+        (row["링크"] for row in rows),
+        (bool(row["PICK"]) for row in rows),
+        (row["게시일"] for row in rows),
+        (row.get("키워드", "") for row in rows) if has_keywords else None,
+    )
+
+
+def normalize_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """concat 등으로 풀린 dtype을 스키마대로 되돌림"""
+    import pandas as pd
+
+    df = df.astype({
+        "그룹":   pd.CategoricalDtype(GROUPS),
+        "매체명": "category",
+        "PICK":   bool,
+    })
+    if "키워드" in df.columns:
+        df["키워드"] = df["키워드"].fillna("")
+    return df
+
+
+def concat_frames(frames: list) -> pd.DataFrame:
+    import pandas as pd
+
+    frames = [f for f in frames if f is not None and not f.empty]
+    if not frames:
+        return make_frame([], [], [], [], [], [])
+    if len(frames) == 1:
+        return frames[0].reset_index(drop=True)
+    return normalize_frame(pd.concat(frames, ignore_index=True))
+
+
+def format_dates(series: pd.Series) -> pd.Series:
+    """게시일 → 'YYYY-MM-DD HH:MM' 문자열 (NaT → 빈 문자열)"""
+    return series.dt.strftime(DATE_FORMAT).fillna("")
+
+
+def export_frame(df: pd.DataFrame, hyperlink: bool = True) -> pd.DataFrame:
+    """
+    내보내기용 문자열 프레임.
+    hyperlink=True 이면 제목을 =HYPERLINK(링크, 제목) 수식으로 바꾸고 링크 컬럼은 뺀다.
+    """
+    import pandas as pd
+
+    columns = {
+        "그룹":   df["그룹"].astype(object),
+        "매체명": df["매체명"].astype(object),
+    }
+    if hyperlink:
+        columns["제목"] = [
+            f'=HYPERLINK("{link}", "{title.replace(chr(34), chr(39))}")'
+            for link, title in zip(df["링크"].tolist(), df["제목"].tolist())
+        ]
+    else:
+        columns["제목"] = df["제목"]
+        columns["링크"] = df["링크"]
+    columns["PICK"] = df["PICK"].map({True: "PICK", False: ""})
+    columns["게시일"] = format_dates(df["게시일"])
+    for col in ("키워드", "클러스터", "유사기사"):
+        if col in df.columns:
+            columns[col] = df[col]
+    return pd.DataFrame(columns).reset_index(drop=True)
+
+
+# ── 저장용 직렬화 (검색 스냅샷) ───────────────────────────────
+
+def frame_to_json(df: pd.DataFrame) -> str:
+    columns = {col: df[col].tolist() for col in df.columns if col != "게시일"}
+    columns["게시일"] = [None if d is None or d != d else d.isoformat()
+                        for d in df["게시일"].tolist()]
+    return json.dumps({"schema": SCHEMA_VERSION, "columns": columns}, ensure_ascii=False)
+
+
+def frame_from_json(text: str) -> pd.DataFrame | None:
+    """frame_to_json 결과 → DataFrame (스키마가 다르면 None)"""
+    data = json.loads(text)
+    if not isinstance(data, dict) or data.get("schema") != SCHEMA_VERSION:
+        return None
+    columns = data["columns"]
+    return make_frame(
+        columns["그룹"], columns["매체명"], columns["제목"], columns["링크"], columns["PICK"],
+        (datetime.fromisoformat(d) if d else None for d in columns["게시일"]),
+        columns.get("키워드"),
+    )
+
+
+def stored_publishers(text: str) -> set:
+    """frame_to_json 결과의 매체명 집합 (DataFrame을 만들지 않고 확인)"""
+    data = json.loads(text)
+    if not isinstance(data, dict) or data.get("schema") != SCHEMA_VERSION:
+        return set()
+    return set(data["columns"]["매체명"])
@@ -0,0 +1,224 @@
+# ============================================================
+#  네이버 뉴스 클리핑 - HTTP 세션 · 호스트별 요청 제한 · 재시도
+#
+#  모든 외부 요청(검색 API, 기사 페이지, 추가 매체)은 http_get /
+#  http_get_async를 거친다. 호스트마다 토큰 버킷으로 초당 요청 수를,
+#  세마포어로 동시 요청 수를 제한하고, 429 · 5xx · 타임아웃은
+#  지수 백오프(지터 포함)로 재시도한다. 429를 받으면 그 호스트의
+#  속도를 절반으로 낮추고, 성공이 이어지면 설정값까지 서서히 되돌린다.
+# ============================================================
+
+import time
+import random
+import asyncio
+import threading
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from . import metrics
+from .config import (
+    HEADERS, MAX_WORKERS, JOB_MAX_RUNNING, NAVER_API_URL, API_RATE_LIMIT, API_MAX_WORKERS,
+    HOST_LIMITS, DEFAULT_HOST_LIMIT, HTTP_MAX_RETRIES, RETRY_STATUSES,
+    BACKOFF_BASE, BACKOFF_MAX, RETRY_AFTER_MAX,
+)
+
+_session = None
+
+
+def get_session() -> requests.Session:
+    """
+    스레드 백엔드용 공유 Session (호스트별 keep-alive 커넥션 재사용).
+    검색 작업 JOB_MAX_RUNNING개가 각자 MAX_WORKERS개 스레드로 같은 호스트를
+    받을 수 있으므로, 호스트당 풀 크기는 그 합에 맞춘다 (작으면 urllib3가
+    "Connection pool is full" 경고와 함께 커넥션을 버린다).
+    """
+    global _session
+    if _session is None:
+        session = requests.Session()
+        session.headers.update(HEADERS)
+        adapter = HTTPAdapter(pool_connections=MAX_WORKERS,
+                              pool_maxsize=MAX_WORKERS * JOB_MAX_RUNNING)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _session = session
+    return _session
+
+
+# ══════════════════════════════════════════════════════════════
+#  호스트별 요청 제한
+# ══════════════════════════════════════════════════════════════
+
+class HostLimiter:
+    """
+    호스트 하나의 초당 요청 수(토큰 버킷) · 동시 요청 수 제한.
+    버킷 크기는 min(rate, concurrency) 이므로 순간 몰림도 동시 요청 수를 넘지 않는다.
+    """
+
+    RECOVERY = 0.05      # 성공 1회당 회복량 (설정 속도 대비 비율)
+    MIN_FACTOR = 0.1     # 429가 반복돼도 설정 속도의 이 비율 아래로는 낮추지 않음
+
+    def __init__(self, rate: float, concurrency: int, host: str = ""):
+        self.host = host
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = float(max(1, min(rate, concurrency)))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(concurrency)
+        self._waiting = 0    # 동시 요청 슬롯을 기다리는 요청 수
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고, 보내기 전에 기다려야 할 시간(초)을 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            depth = max(0, int(-self._tokens)) + self._waiting
+        metrics.note_queue(self.host, depth)
+        return max(delay, self._blocked_until - now)
+
+    def acquire(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        with self._lock:
+            self._waiting += 1
+        self._slots.acquire()
+        with self._lock:
+            self._waiting -= 1
+
+    def release(self) -> None:
+        self._slots.release()
+
+    def on_success(self) -> None:
+        if self.rate < self.max_rate:
+            with self._lock:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * self.RECOVERY)
+
+    def on_throttled(self, retry_after: float) -> None:
+        """429 응답: 속도를 절반으로 낮추고 retry_after 동안 새 요청을 막음"""
+        with self._lock:
+            self.rate = max(self.max_rate * self.MIN_FACTOR, self.rate / 2)
+            self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def _host_limit(host: str) -> tuple:
+    if host == urlsplit(NAVER_API_URL).hostname:
+        return API_RATE_LIMIT, API_MAX_WORKERS
+    return HOST_LIMITS.get(host, DEFAULT_HOST_LIMIT)
+
+
+def get_host_limiter(url: str) -> HostLimiter:
+    host = (urlsplit(url).hostname or "").lower()
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = _limiters[host] = HostLimiter(*_host_limit(host), host=host)
+        return limiter
+
+
+# ══════════════════════════════════════════════════════════════
+#  재시도
+# ══════════════════════════════════════════════════════════════
+
+def backoff_delay(attempt: int) -> float:
+    """attempt번째 재시도 대기 시간 (full jitter 지수 백오프)"""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+
+def retry_after_delay(value: str | None, attempt: int) -> float:
+    """Retry-After 헤더(초 또는 HTTP 날짜) → 대기 시간, 없으면 백오프"""
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            pass
+    return backoff_delay(attempt)
+
+
+def http_get(url: str, retries: int = HTTP_MAX_RETRIES, **kwargs) -> requests.Response:
+    """
+    공유 Session GET + 호스트별 제한 + 재시도.
+    재시도를 다 써도 실패하면 마지막 응답을 반환하거나 마지막 예외를 올린다.
+    Retry-After가 RETRY_AFTER_MAX보다 길면 기다리지 않고 그 응답을 반환한다.
+    stream=True면 받은 바이트는 본문을 읽는 쪽이 metrics.record_bytes로 기록한다.
+    """
+    limiter = get_host_limiter(url)
+    for attempt in range(retries + 1):
+        limiter.acquire()
+        started = time.perf_counter()
+        try:
+            res = get_session().get(url, **kwargs)
+        except (requests.Timeout, requests.ConnectionError) as e:
+            metrics.record_request(limiter.host, type(e).__name__, time.perf_counter() - started)
+            if attempt == retries:
+                raise
+            delay = backoff_delay(attempt)
+        else:
+            # 스트리밍 응답은 본문을 일부만 읽을 수 있으므로 읽는 쪽이 record_bytes로 기록
+            nbytes = 0 if kwargs.get("stream") else len(res.content)
+            metrics.record_request(limiter.host, res.status_code,
+                                   time.perf_counter() - started, nbytes)
+            if res.status_code not in RETRY_STATUSES:
+                limiter.on_success()
+                return res
+            delay = retry_after_delay(res.headers.get("Retry-After"), attempt)
+            if res.status_code == 429:
+                limiter.on_throttled(delay)
+            if attempt == retries or delay > RETRY_AFTER_MAX:
+                return res
+            res.close()
+        finally:
+            limiter.release()
+        time.sleep(delay)
+
+
+async def http_get_async(session, url: str, retries: int = HTTP_MAX_RETRIES, **kwargs):
+    """
+    http_get의 aiohttp 버전 (ClientResponse 반환, 호출 측에서 async with로 닫는다).
+    http_get(stream=True)처럼 받은 바이트는 본문을 읽는 쪽이 기록한다.
+    동시 연결 수는 TCPConnector(limit_per_host)가 맡고, 여기서는 속도 · 재시도만 처리.
+    """
+    import aiohttp
+
+    limiter = get_host_limiter(url)
+    for attempt in range(retries + 1):
+        delay = limiter.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        started = time.perf_counter()
+        try:
+            res = await session.get(url, **kwargs)
+        except (asyncio.TimeoutError, aiohttp.ClientConnectionError) as e:
+            metrics.record_request(limiter.host, type(e).__name__, time.perf_counter() - started)
+            if attempt == retries:
+                raise
+            delay = backoff_delay(attempt)
+        else:
+            # 본문은 아직 읽지 않았으므로 바이트는 읽는 쪽이 record_bytes로 기록
+            metrics.record_request(limiter.host, res.status, time.perf_counter() - started)
+            if res.status not in RETRY_STATUSES:
+                limiter.on_success()
+                return res
+            delay = retry_after_delay(res.headers.get("Retry-After"), attempt)
+            if res.status == 429:
+                limiter.on_throttled(delay)
+            if attempt == retries or delay > RETRY_AFTER_MAX:
+                return res
+            res.release()
+        await asyncio.sleep(delay)
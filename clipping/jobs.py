@@ -0,0 +1,182 @@
+# ============================================================
+#  네이버 뉴스 클리핑 - 백그라운드 검색 작업 관리자
+#
+#  검색은 화면 스크립트가 아니라 프로세스 공용 워커(JOB_MAX_RUNNING개)에서
+#  돈다. 화면은 작업 ID만 들고 진행률 · 미리보기 · 결과를 가져가므로
+#  위젯을 건드리거나 창을 닫아도 검색은 이어진다.
+#
+#  - 대기열은 세션별로 따로 두고, 빈 워커는 세션을 돌아가며(round-robin)
+#    다음 작업을 가져간다 → 한 세션이 작업을 몰아 넣어도 다른 세션이 밀리지 않음
+#  - 세션당 대기 + 실행 중 작업은 JOB_MAX_QUEUED개까지
+#  - 끝난 작업은 JOB_RESULT_TTL 동안 보관 (결과를 가져가면 forget으로 정리)
+# ============================================================
+
+from __future__ import annotations
+
+import time
+import uuid
+import threading
+from collections import OrderedDict, deque
+
+from . import metrics
+from .config import JOB_MAX_RUNNING, JOB_MAX_QUEUED, JOB_RESULT_TTL
+
+QUEUED, RUNNING, DONE, FAILED, CANCELLED = "queued", "running", "done", "failed", "cancelled"
+
+
+class JobQueueFull(Exception):
+    """세션의 작업 수가 JOB_MAX_QUEUED를 넘음 (메시지는 사용자 표시용)"""
+
+
+class SearchJob:
+    """
+    검색 작업 하나. target(job)이 워커에서 실행되며, job.progress /
+    job.preview를 검색 함수의 progress · preview 콜백으로 넘기면 된다.
+    """
+
+    def __init__(self, session: str, label: str, target):
+        self.id = uuid.uuid4().hex
+        self.session = session
+        self.label = label
+        self.target = target
+        self.status = QUEUED
+        self.pct = 0
+        self.message = "⏳ 대기 중..."
+        self.partial = None      # 최근 미리보기 DataFrame
+        self.result = None
+        self.error = ""
+        self.report = None       # metrics 요약 (SearchReport.summary())
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+
+    @property
+    def active(self) -> bool:
+        return self.status in (QUEUED, RUNNING)
+
+    def progress(self, pct: int, message: str) -> None:
+        self.pct, self.message = pct, message
+
+    def preview(self, df) -> None:
+        self.partial = df
+
+
+class JobManager:
+    def __init__(self, max_running: int = JOB_MAX_RUNNING, max_queued: int = JOB_MAX_QUEUED,
+                 result_ttl: float = JOB_RESULT_TTL):
+        self.max_running = max_running
+        self.max_queued = max_queued
+        self.result_ttl = result_ttl
+        self._jobs = {}                  # id → SearchJob
+        self._queues = OrderedDict()     # session → deque[SearchJob] (순서 = 다음 차례)
+        self._cond = threading.Condition()
+        self._workers = []
+
+    # ── 화면 쪽 ───────────────────────────────────────────────
+    def submit(self, session: str, label: str, target) -> SearchJob:
+        with self._cond:
+            self._expire()
+            active = sum(1 for job in self._jobs.values() if job.session == session and job.active)
+            if active >= self.max_queued:
+                raise JobQueueFull(
+                    f"진행 중인 검색이 {active}건 있습니다. 끝난 뒤에 다시 시도해주세요.")
+            job = SearchJob(session, label, target)
+            self._jobs[job.id] = job
+            self._queues.setdefault(session, deque()).append(job)
+            if len(self._workers) < self.max_running:
+                worker = threading.Thread(target=self._work, name=f"clipping-job-{len(self._workers)}",
+                                          daemon=True)
+                self._workers.append(worker)
+                worker.start()
+            self._cond.notify()
+        metrics.count("job_submitted")
+        return job
+
+    def get(self, job_id: str | None) -> SearchJob | None:
+        return self._jobs.get(job_id) if job_id else None
+
+    def position(self, job: SearchJob) -> int:
+        """대기 중인 작업 앞에 남은 대기 작업 수 (세션 순환 순서 기준, 실행 중이면 0)"""
+        with self._cond:
+            if job.status != QUEUED:
+                return 0
+            queues = list(self._queues.values())
+            ahead = 0
+            for rank in range(len(self._queues[job.session])):
+                for queue in queues:
+                    if rank < len(queue):
+                        if queue[rank] is job:
+                            return ahead
+                        ahead += 1
+            return ahead
+
+    def cancel(self, job_id: str) -> bool:
+        """대기 중인 작업만 취소할 수 있다 (실행 중인 검색은 끝까지 진행)"""
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is None or job.status != QUEUED:
+                return False
+            self._queues[job.session].remove(job)
+            job.status, job.finished = CANCELLED, time.time()
+            return True
+
+    def forget(self, job_id: str) -> None:
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is not None and not job.active:
+                del self._jobs[job_id]
+
+    def stats(self) -> dict:
+        with self._cond:
+            statuses = [job.status for job in self._jobs.values()]
+            return {status: statuses.count(status) for status in (QUEUED, RUNNING)}
+
+    # ── 워커 ──────────────────────────────────────────────────
+    def _expire(self) -> None:
+        cutoff = time.time() - self.result_ttl
+        for job_id in [job_id for job_id, job in self._jobs.items()
+                       if not job.active and job.finished < cutoff]:
+            del self._jobs[job_id]
+
+    def _next(self) -> SearchJob:
+        """세션을 돌아가며 다음 작업을 꺼낸다 (없으면 기다림)"""
+        with self._cond:
+            while True:
+                for session in list(self._queues):
+                    queue = self._queues.pop(session)
+                    if queue:
+                        job = queue.popleft()
+                        if queue:
+                            self._queues[session] = queue    # 맨 뒤로 → 다음 차례는 다른 세션
+                        job.status, job.started = RUNNING, time.time()
+                        return job
+                self._cond.wait()
+
+    def _work(self) -> None:
+        while True:
+            job = self._next()
+            metrics.add_stage("job_wait", job.started - job.created)
+            status = DONE
+            try:
+                with metrics.recording(job.label) as report:
+                    job.result = job.target(job)
+            except Exception as e:
+                job.error = str(e) or type(e).__name__
+                status = FAILED
+            job.report = report.summary()
+            job.partial = None
+            job.finished = time.time()
+            job.status = status    # 화면은 상태만 보고 결과를 가져가므로 마지막에 바꾼다
+
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    """프로세스 공용 작업 관리자 (Streamlit 세션 전체가 공유)"""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = JobManager()
+        return _manager
@@ -0,0 +1,333 @@
+# ============================================================
+#  네이버 뉴스 클리핑 - 수집 계측 (구간 시간 · 호스트별 요청 · 캐시)
+#
+#  - stage(name)       : 구간 소요 시간 (api, crawl, parse, frame, cluster,
+#                        extra:<매체>, excel ...)
+#  - record_request()  : 외부 요청 1회 (호스트, 상태, 시간, 바이트)
+#  - record_bytes()    : 스트리밍 응답에서 실제로 읽은 바이트 (읽는 쪽이 기록)
+#  - count()           : 캐시 적중/미스 등 카운터
+#  - note_queue()      : 호스트별 대기열 길이 (요청 제한에 걸려 기다리는 요청 수)
+#
+#  값은 프로세스 누적 레지스트리(Prometheus 텍스트)에 항상 쌓이고,
+#  recording()으로 연 검색 보고서가 있으면 그 보고서에도 함께 기록된다.
+#  보고서는 검색이 끝나면 METRICS_LOG_PATH에 JSON 한 줄로 남는다.
+# ============================================================
+
+from __future__ import annotations
+
+import os
+import json
+import time
+import bisect
+import threading
+import contextvars
+from contextlib import contextmanager
+from datetime import datetime
+
+from .config import KST, METRICS_LOG_PATH, LATENCY_BUCKETS
+
+_current = contextvars.ContextVar("clipping_search_report", default=None)
+
+
+def _percentile(values: list, q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+class SearchReport:
+    """검색 한 번의 계측 결과 (스레드 안전)"""
+
+    def __init__(self, label: str = ""):
+        self.label = label
+        self.started = time.time()
+        self.elapsed = 0.0
+        self.stages = {}      # name → [seconds, count]
+        self.requests = {}    # host → {"latency": [...], "bytes", "status": {code: n}, "errors"}
+        self.counters = {}
+        self.queue_max = {}   # host → 최대 대기열 길이
+        self._lock = threading.Lock()
+
+    def add_stage(self, name: str, seconds: float) -> None:
+        with self._lock:
+            entry = self.stages.setdefault(name, [0.0, 0])
+            entry[0] += seconds
+            entry[1] += 1
+
+    def add_request(self, host: str, status: str, seconds: float, nbytes: int) -> None:
+        with self._lock:
+            entry = self.requests.setdefault(
+                host, {"latency": [], "bytes": 0, "status": {}, "errors": 0})
+            entry["latency"].append(seconds)
+            entry["bytes"] += nbytes
+            entry["status"][status] = entry["status"].get(status, 0) + 1
+            if not status.startswith("2"):
+                entry["errors"] += 1
+
+    def add_bytes(self, host: str, nbytes: int) -> None:
+        with self._lock:
+            entry = self.requests.setdefault(
+                host, {"latency": [], "bytes": 0, "status": {}, "errors": 0})
+            entry["bytes"] += nbytes
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def note_queue(self, host: str, depth: int) -> None:
+        with self._lock:
+            if depth > self.queue_max.get(host, 0):
+                self.queue_max[host] = depth
+
+    def summary(self) -> dict:
+        """JSON으로 내보낼 수 있는 요약 (호스트별 p50/p95 포함)"""
+        with self._lock:
+            hosts = {
+                host: {
+                    "requests": len(entry["latency"]),
+                    "errors": entry["errors"],
+                    "status": dict(entry["status"]),
+                    "bytes": entry["bytes"],
+                    "p50_ms": round(_percentile(entry["latency"], 0.5) * 1000, 1),
+                    "p95_ms": round(_percentile(entry["latency"], 0.95) * 1000, 1),
+                    "max_ms": round(max(entry["latency"], default=0) * 1000, 1),
+                    "queue_max": self.queue_max.get(host, 0),
+                }
+                for host, entry in self.requests.items()
+            }
+            caches = {}
+            for name, n in self.counters.items():
+                cache, _, result = name.rpartition("_")
+                if result in ("hit", "miss"):
+                    caches.setdefault(cache, {"hit": 0, "miss": 0})[result] = n
+            for stats in caches.values():
+                total = stats["hit"] + stats["miss"]
+                stats["hit_rate"] = round(stats["hit"] / total, 3) if total else None
+            return {
+                "label": self.label,
+                "started": datetime.fromtimestamp(self.started, KST).isoformat(timespec="seconds"),
+                "elapsed_s": round(self.elapsed, 3),
+                "stages": {name: {"seconds": round(s, 3), "count": c}
+                           for name, (s, c) in self.stages.items()},
+                "hosts": hosts,
+                "caches": caches,
+                "counters": dict(self.counters),
+            }
+
+
+# ══════════════════════════════════════════════════════════════
+#  프로세스 누적 레지스트리 (Prometheus 텍스트)
+# ══════════════════════════════════════════════════════════════
+
+class _Registry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stage = {}          # name → [seconds, count]
+        self.req_total = {}      # (host, status) → n
+        self.req_latency = {}    # host → [bucket counts..., sum, count]
+        self.req_bytes = {}      # host → bytes
+        self.counters = {}
+        self.queue_max = {}
+        self.searches = 0
+
+    def add_stage(self, name: str, seconds: float) -> None:
+        with self._lock:
+            entry = self.stage.setdefault(name, [0.0, 0])
+            entry[0] += seconds
+            entry[1] += 1
+
+    def add_request(self, host: str, status: str, seconds: float, nbytes: int) -> None:
+        with self._lock:
+            self.req_total[(host, status)] = self.req_total.get((host, status), 0) + 1
+            hist = self.req_latency.setdefault(host, [0] * len(LATENCY_BUCKETS) + [0.0, 0])
+            for i in range(bisect.bisect_left(LATENCY_BUCKETS, seconds), len(LATENCY_BUCKETS)):
+                hist[i] += 1
+            hist[-2] += seconds
+            hist[-1] += 1
+            self.req_bytes[host] = self.req_bytes.get(host, 0) + nbytes
+
+    def add_bytes(self, host: str, nbytes: int) -> None:
+        with self._lock:
+            self.req_bytes[host] = self.req_bytes.get(host, 0) + nbytes
+
+    def count(self, name: str, n: int) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def note_queue(self, host: str, depth: int) -> None:
+        with self._lock:
+            if depth > self.queue_max.get(host, 0):
+                self.queue_max[host] = depth
+
+    def render(self) -> str:
+        def esc(value) -> str:
+            return str(value).replace("\\", "\\\\").replace('"', '\\"')
+
+        with self._lock:
+            lines = [
+                "# HELP clipping_searches_total 완료된 검색 수",
+                "# TYPE clipping_searches_total counter",
+                f"clipping_searches_total {self.searches}",
+                "# HELP clipping_stage_seconds 구간별 누적 소요 시간",
+                "# TYPE clipping_stage_seconds summary",
+            ]
+            for name, (seconds, n) in sorted(self.stage.items()):
+                lines.append(f'clipping_stage_seconds_sum{{stage="{esc(name)}"}} {seconds:.6f}')
+                lines.append(f'clipping_stage_seconds_count{{stage="{esc(name)}"}} {n}')
+            lines += ["# HELP clipping_http_requests_total 외부 요청 수 (호스트 · 상태별)",
+                      "# TYPE clipping_http_requests_total counter"]
+            for (host, status), n in sorted(self.req_total.items()):
+                lines.append(
+                    f'clipping_http_requests_total{{host="{esc(host)}",status="{esc(status)}"}} {n}')
+            lines += ["# HELP clipping_http_request_seconds 외부 요청 응답 시간",
+                      "# TYPE clipping_http_request_seconds histogram"]
+            for host, hist in sorted(self.req_latency.items()):
+                for bound, n in zip(LATENCY_BUCKETS, hist):
+                    lines.append(
+                        f'clipping_http_request_seconds_bucket{{host="{esc(host)}",le="{bound}"}} {n}')
+                lines.append(
+                    f'clipping_http_request_seconds_bucket{{host="{esc(host)}",le="+Inf"}} {hist[-1]}')
+                lines.append(f'clipping_http_request_seconds_sum{{host="{esc(host)}"}} {hist[-2]:.6f}')
+                lines.append(f'clipping_http_request_seconds_count{{host="{esc(host)}"}} {hist[-1]}')
+            lines += ["# HELP clipping_http_response_bytes_total 받은 바이트 수",
+                      "# TYPE clipping_http_response_bytes_total counter"]
+            for host, n in sorted(self.req_bytes.items()):
+                lines.append(f'clipping_http_response_bytes_total{{host="{esc(host)}"}} {n}')
+            lines += ["# HELP clipping_host_queue_depth_max 요청 제한 대기열 최대 길이",
+                      "# TYPE clipping_host_queue_depth_max gauge"]
+            for host, n in sorted(self.queue_max.items()):
+                lines.append(f'clipping_host_queue_depth_max{{host="{esc(host)}"}} {n}')
+            lines += ["# HELP clipping_events_total 캐시 적중 · 미스 등 이벤트 수",
+                      "# TYPE clipping_events_total counter"]
+            for name, n in sorted(self.counters.items()):
+                lines.append(f'clipping_events_total{{event="{esc(name)}"}} {n}')
+        return "\n".join(lines) + "\n"
+
+
+_registry = _Registry()
+
+
+# ══════════════════════════════════════════════════════════════
+#  기록 함수 (보고서가 없어도 레지스트리에는 쌓인다)
+# ══════════════════════════════════════════════════════════════
+
+def current() -> SearchReport | None:
+    return _current.get()
+
+
+def add_stage(name: str, seconds: float) -> None:
+    _registry.add_stage(name, seconds)
+    report = _current.get()
+    if report is not None:
+        report.add_stage(name, seconds)
+
+
+@contextmanager
+def stage(name: str):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_stage(name, time.perf_counter() - started)
+
+
+def record_request(host: str, status, seconds: float, nbytes: int = 0) -> None:
+    """status: HTTP 상태 코드 또는 예외 이름 (timeout 등)"""
+    status = str(status)
+    _registry.add_request(host, status, seconds, nbytes)
+    report = _current.get()
+    if report is not None:
+        report.add_request(host, status, seconds, nbytes)
+
+
+def record_bytes(host: str, nbytes: int) -> None:
+    """스트리밍 응답에서 실제로 읽은 바이트 (요청 수는 record_request가 센다)"""
+    if not nbytes:
+        return
+    _registry.add_bytes(host, nbytes)
+    report = _current.get()
+    if report is not None:
+        report.add_bytes(host, nbytes)
+
+
+def count(name: str, n: int = 1) -> None:
+    if not n:
+        return
+    _registry.count(name, n)
+    report = _current.get()
+    if report is not None:
+        report.count(name, n)
+
+
+def note_queue(host: str, depth: int) -> None:
+    _registry.note_queue(host, depth)
+    report = _current.get()
+    if report is not None:
+        report.note_queue(host, depth)
+
+
+def bind(fn):
+    """현재 보고서를 스레드 풀 작업에서도 쓰도록 묶은 함수 (contextvars는 스레드로 안 넘어감)"""
+    ctx = contextvars.copy_context()
+    return lambda *args, **kwargs: ctx.copy().run(fn, *args, **kwargs)
+
+
+@contextmanager
+def recording(label: str = "", log_path: str | None = METRICS_LOG_PATH):
+    """
+    with recording("패션") as report: ... — 블록 안의 계측을 report에 모으고,
+    끝나면 log_path(JSON Lines)에 요약 한 줄을 남긴다.
+    """
+    report = SearchReport(label)
+    token = _current.set(report)
+    started = time.perf_counter()
+    try:
+        yield report
+    finally:
+        report.elapsed = time.perf_counter() - started
+        _current.reset(token)
+        with _registry._lock:
+            _registry.searches += 1
+        if log_path:
+            write_jsonl(report, log_path)
+
+
+def write_jsonl(report: SearchReport, path: str) -> None:
+    try:
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(report.summary(), ensure_ascii=False) + "\n")
+    except OSError:
+        pass
+
+
+def render_prometheus() -> str:
+    return _registry.render()
+
+
+def serve_metrics(port: int, host: str = "127.0.0.1"):
+    """GET /metrics 로 Prometheus 텍스트를 내보내는 백그라운드 서버 (헤드리스 실행용)"""
+    import http.server
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_response(404)
+                self.end_headers()
+                return
+            body = render_prometheus().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,133 @@
+# ============================================================
+#  네이버 뉴스 클리핑 - 네이버 검색 API
+# ============================================================
+
+import re
+import html
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from .config import (
+    KST, NAVER_API_URL, API_TIMEOUT, API_PAGE_SIZE, API_MAX_START,
+    API_MAX_WORKERS,
+)
+from . import metrics
+from .http import http_get
+
+
+def clean_html_text(text: str) -> str:
+    if not text:
+        return ""
+    text = html.unescape(text)
+    text = re.sub(r'<[^>]*>', '', text)
+    return text.replace('"', "'")
+
+
+class NaverApiError(Exception):
+    """검색 API가 200 이외의 상태 코드를 반환한 경우"""
+
+    def __init__(self, status_code: int):
+        super().__init__(f"네이버 API 오류: {status_code}")
+        self.status_code = status_code
+
+
+def fetch_api_page(query: str, start: int, naver_headers: dict) -> list:
+    """검색 API 한 페이지 → [{"pub_date", "link", "title"}] (최신순)"""
+    res = http_get(
+        NAVER_API_URL,
+        params={"query": query, "display": API_PAGE_SIZE, "start": start, "sort": "date"},
+        headers=naver_headers,
+        timeout=API_TIMEOUT,
+    )
+    if res.status_code != 200:
+        raise NaverApiError(res.status_code)
+    items = []
+    for item in res.json().get('items', []):
+        items.append({
+            "pub_date": datetime.strptime(
+                item['pubDate'], '%a, %d %b %Y %H:%M:%S +0900'
+            ).replace(tzinfo=KST),
+            "link": item.get('link', ''),
+            "title": clean_html_text(item.get('title', '')),
+        })
+    return items
+
+
+def collect_api_items(query: str, naver_headers: dict, since: datetime,
+                      executor: ThreadPoolExecutor | None = None) -> list:
+    """
+    since 이후 기사를 API가 허용하는 범위(start ≤ 1000) 안에서 모두 수집.
+
+    최신순 정렬이므로 '마지막 기사가 since 이전인 첫 페이지'를 start
+    오프셋에 대한 이분 탐색으로 찾고, 그 앞의 남은 페이지는 동시에 요청한다.
+    executor를 넘기면 남은 페이지를 그 풀에서 요청한다 (일괄 검색 공용 풀).
+    """
+    starts = list(range(1, API_MAX_START + 1, API_PAGE_SIZE))
+    pages = {}
+
+    def load(idx: int) -> list:
+        if idx not in pages:
+            pages[idx] = fetch_api_page(query, starts[idx], naver_headers)
+        return pages[idx]
+
+    def crosses_cutoff(items: list) -> bool:
+        # 빈/짧은 페이지는 결과의 끝, 마지막 기사가 since 이전이면 기간의 끝
+        return len(items) < API_PAGE_SIZE or items[-1]["pub_date"] < since
+
+    # ── 경계 페이지 이분 탐색 ─────────────────────────────────
+    lo, hi = 0, len(starts) - 1
+    if crosses_cutoff(load(0)):
+        hi = 0
+    else:
+        lo = 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if crosses_cutoff(load(mid)):
+                hi = mid
+            else:
+                lo = mid + 1
+
+    # ── 경계 앞의 남은 페이지 병렬 수집 ───────────────────────
+    missing = [idx for idx in range(hi + 1) if idx not in pages]
+    if missing:
+        own_executor = executor is None
+        if own_executor:
+            executor = ThreadPoolExecutor(max_workers=API_MAX_WORKERS)
+        try:
+            fetch = metrics.bind(lambda i: fetch_api_page(query, starts[i], naver_headers))
+            for idx, items in zip(missing, executor.map(fetch, missing)):
+                pages[idx] = items
+        finally:
+            if own_executor:
+                executor.shutdown()
+
+    raw_items, seen = [], set()
+    for idx in range(hi + 1):
+        for item in pages[idx]:
+            # 수집 도중 새 기사가 올라오면 페이지 경계가 밀려 중복될 수 있음
+            if item["pub_date"] < since or item["link"] in seen:
+                continue
+            seen.add(item["link"])
+            raw_items.append(item)
+    return raw_items
+
+
+def collect_new_api_items(query: str, naver_headers: dict, since: datetime,
+                          newest: datetime, seen_links: set) -> list:
+    """
+    증분 검색용: 최신순으로 페이지를 넘기다가 이미 본 시점(newest)보다
+    오래된 기사가 나오면 멈추고, 그 사이의 새 기사만 반환.
+    """
+    cutoff = max(since, newest)
+    raw_items = []
+    for start in range(1, API_MAX_START + 1, API_PAGE_SIZE):
+        items = fetch_api_page(query, start, naver_headers)
+        for item in items:
+            if item["pub_date"] < cutoff:
+                return raw_items
+            if item["link"] not in seen_links:
+                seen_links.add(item["link"])
+                raw_items.append(item)
+        if len(items) < API_PAGE_SIZE:
+            break
+    return raw_items
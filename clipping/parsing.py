@@ -0,0 +1,188 @@
+# ============================================================
+#  네이버 뉴스 클리핑 - HTML 파서 백엔드
+#
+#  기사 · 추가 매체 페이지에서 쓰는 기능(CSS 선택, 속성, 텍스트,
+#  상위 태그 찾기)만 공통 함수로 감싸고, 설치된 가장 빠른 파서를 쓴다.
+#    selectolax (lexbor) > lxml (+cssselect) > BeautifulSoup html.parser
+#  HTML_PARSER 설정(환경변수 CLIPPING_HTML_PARSER)으로 고정할 수도 있다.
+#
+#  선택자는 백엔드별로 한 번만 컴파일해 재사용한다 (compile_css).
+# ============================================================
+
+from __future__ import annotations
+
+import functools
+
+from .config import HTML_PARSER
+
+
+class _SelectolaxBackend:
+    name = "selectolax"
+
+    def __init__(self):
+        from selectolax.lexbor import LexborHTMLParser
+        self._parser = LexborHTMLParser
+
+    def parse(self, text: str):
+        return self._parser(text)
+
+    def compile(self, css: str):
+        return css    # lexbor가 내부에서 선택자를 캐시한다
+
+    def select(self, node, selector) -> list:
+        # 선택자 목록("a, b")에 둘 다 맞는 노드는 lexbor가 중복으로 돌려준다
+        found, seen = [], set()
+        for match in node.css(selector):
+            if match.mem_id not in seen:
+                seen.add(match.mem_id)
+                found.append(match)
+        return found
+
+    def select_one(self, node, selector):
+        return node.css_first(selector)
+
+    def attr(self, node, name: str) -> str | None:
+        return node.attributes.get(name)
+
+    def text(self, node, strip: bool = False) -> str:
+        return node.text(deep=True, strip=strip)
+
+    def parent(self, node):
+        return node.parent
+
+    def tag(self, node) -> str:
+        return node.tag
+
+
+class _LxmlBackend:
+    name = "lxml"
+
+    def __init__(self):
+        import lxml.html
+        from lxml.etree import XPath
+        from cssselect import GenericTranslator
+        self._fromstring = lxml.html.fromstring
+        self._xpath = XPath
+        self._translator = GenericTranslator()
+
+    def parse(self, text: str):
+        return self._fromstring(text or "<html></html>")
+
+    def compile(self, css: str):
+        return self._xpath(self._translator.css_to_xpath(css))
+
+    def select(self, node, selector) -> list:
+        return selector(node)
+
+    def select_one(self, node, selector):
+        found = selector(node)
+        return found[0] if found else None
+
+    def attr(self, node, name: str) -> str | None:
+        return node.get(name)
+
+    def text(self, node, strip: bool = False) -> str:
+        if strip:
+            return "".join(s.strip() for s in node.itertext())
+        return "".join(node.itertext())
+
+    def parent(self, node):
+        return node.getparent()
+
+    def tag(self, node) -> str:
+        return node.tag if isinstance(node.tag, str) else ""
+
+
+class _SoupBackend:
+    name = "html.parser"
+
+    def __init__(self):
+        from bs4 import BeautifulSoup
+        import soupsieve
+        self._soup = BeautifulSoup
+        self._compile = soupsieve.compile
+
+    def parse(self, text: str):
+        return self._soup(text, 'html.parser')
+
+    def compile(self, css: str):
+        return self._compile(css)
+
+    def select(self, node, selector) -> list:
+        return selector.select(node)
+
+    def select_one(self, node, selector):
+        return selector.select_one(node)
+
+    def attr(self, node, name: str) -> str | None:
+        value = node.get(name)
+        return " ".join(value) if isinstance(value, list) else value
+
+    def text(self, node, strip: bool = False) -> str:
+        return node.get_text(strip=strip)
+
+    def parent(self, node):
+        return node.parent
+
+    def tag(self, node) -> str:
+        return node.name or ""
+
+
+_BACKENDS = {
+    "selectolax": _SelectolaxBackend,
+    "lxml": _LxmlBackend,
+    "html.parser": _SoupBackend,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def get_backend(name: str | None = None):
+    """name(또는 HTML_PARSER) 백엔드, "auto"면 설치된 것 중 가장 빠른 것"""
+    name = name or HTML_PARSER
+    candidates = list(_BACKENDS) if name == "auto" else [name]
+    for candidate in candidates:
+        try:
+            return _BACKENDS[candidate]()
+        except ImportError:
+            continue
+    return _SoupBackend()
+
+
+@functools.lru_cache(maxsize=256)
+def compile_css(css: str, backend_name: str | None = None):
+    return get_backend(backend_name).compile(css)
+
+
+# ── 공통 함수 (기본 백엔드) ───────────────────────────────────
+
+def parse(text: str):
+    return get_backend().parse(text)
+
+
+def select(node, css: str) -> list:
+    backend = get_backend()
+    return backend.select(node, compile_css(css))
+
+
+def select_one(node, css: str):
+    backend = get_backend()
+    return backend.select_one(node, compile_css(css))
+
+
+def attr(node, name: str) -> str:
+    return get_backend().attr(node, name) or ""
+
+
+def text(node, strip: bool = False) -> str:
+    return get_backend().text(node, strip)
+
+
+def closest(node, tags: tuple):
+    """node의 상위 태그 중 tags에 해당하는 가장 가까운 것 (없으면 None)"""
+    backend = get_backend()
+    node = backend.parent(node)
+    while node is not None:
+        if backend.tag(node) in tags:
+            return node
+        node = backend.parent(node)
+    return None
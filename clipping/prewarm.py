@@ -0,0 +1,361 @@
+# ============================================================
+#  네이버 뉴스 클리핑 - 예약 사전 수집 (헤드리스 스케줄러)
+#
+#  실행 방법 (앱과 같은 작업 폴더에서, 별도 프로세스로):
+#    python -m clipping.prewarm                               # 설정의 키워드 · 일정
+#    python -m clipping.prewarm -f keywords.txt --cron "20 8 * * 1-5"
+#    python -m clipping.prewarm "패션 트렌드" --once          # 지금 한 번만
+#
+#  일정마다 키워드를 하나씩 run_all_sources로 수집(네이버 + 추가 매체)해
+#  결과를 PrewarmStore에 저장한다. 같은 수집에서 기사 정보 캐시 · 증분 검색
+#  스냅샷 · 아카이브도 함께 채워진다.
+#  화면은 저장된 결과(PREWARM_MAX_AGE 이내)를 바로 보여주고, 원하면 그 이후의
+#  새 기사만 증분 검색으로 반영한다 (refresh_prewarmed).
+#
+#  cron 식은 "분 시 일 월 요일" 5필드 (*, a-b, a,b, */n, 요일 0·7 = 일요일, KST).
+# ============================================================
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import sqlite3
+import argparse
+import threading
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from . import metrics
+from .config import (
+    KST, PREWARM_PATH, PREWARM_KEYWORDS_PATH, PREWARM_SCHEDULE, PREWARM_MAX_AGE,
+)
+from .frame import frame_to_json, frame_from_json, stored_publishers
+from .search import Preview, Progress, SearchError, _no_progress, run_all_sources
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# ── cron 일정 ─────────────────────────────────────────────────
+
+class CronSchedule:
+    """5필드 cron 식 (분 시 일 월 요일) → 다음 실행 시각 계산"""
+
+    _FIELDS = (("minute", 0, 59), ("hour", 0, 23), ("day", 1, 31), ("month", 1, 12),
+               ("weekday", 0, 7))
+
+    def __init__(self, expr: str):
+        parts = expr.split()
+        if len(parts) != 5:
+            raise ValueError(f"cron 식은 '분 시 일 월 요일' 5필드입니다: {expr!r}")
+        self.expr = expr
+        values = [self._parse(part, lo, hi) for part, (_, lo, hi) in zip(parts, self._FIELDS)]
+        self.minutes, self.hours, self.days, self.months, weekdays = values
+        self.weekdays = {d % 7 for d in weekdays}    # 7 = 일요일
+        # 일 · 요일이 둘 다 지정되면 둘 중 하나만 맞아도 실행 (cron 규칙)
+        self._any_day, self._any_weekday = parts[2] == "*", parts[4] == "*"
+
+    @staticmethod
+    def _parse(part: str, lo: int, hi: int) -> set:
+        values = set()
+        for item in part.split(","):
+            spec, _, step = item.partition("/")
+            if spec == "*":
+                start, end = lo, hi
+            elif "-" in spec:
+                start, end = (int(v) for v in spec.split("-", 1))
+            else:
+                start = end = int(spec)
+            if not (lo <= start <= end <= hi) or (step and int(step) < 1):
+                raise ValueError(f"cron 필드 범위 오류: {item!r} ({lo}-{hi})")
+            values.update(range(start, end + 1, int(step) if step else 1))
+        return values
+
+    def _day_matches(self, dt: datetime) -> bool:
+        in_days = dt.day in self.days
+        in_weekdays = (dt.isoweekday() % 7) in self.weekdays
+        if self._any_day or self._any_weekday:
+            return in_days and in_weekdays
+        return in_days or in_weekdays
+
+    def next_after(self, dt: datetime) -> datetime:
+        """dt 이후(초과) 첫 실행 시각 (분 단위)"""
+        dt = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = dt + timedelta(days=366 * 5)
+        while dt < limit:
+            if dt.month not in self.months or not self._day_matches(dt):
+                dt = (dt + timedelta(days=1)).replace(hour=0, minute=0)
+            elif dt.hour not in self.hours:
+                dt = (dt + timedelta(hours=1)).replace(minute=0)
+            elif dt.minute not in self.minutes:
+                dt += timedelta(minutes=1)
+            else:
+                return dt
+        raise ValueError(f"실행 시각이 없는 cron 식입니다: {self.expr!r}")
+
+
+# ── 사전 수집 결과 저장소 ─────────────────────────────────────
+
+def _extras_key(extras) -> str:
+    return ",".join(sorted(extras))
+
+
+class PrewarmStore:
+    """(검색어, 기간, 추가 매체)별 사전 수집 결과 (SQLite WAL, 앱 · 스케줄러 프로세스 공용)"""
+
+    def __init__(self, path: str = PREWARM_PATH):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS prewarmed (
+                query    TEXT NOT NULL,
+                days     INTEGER NOT NULL,
+                extras   TEXT NOT NULL,
+                saved_at REAL NOT NULL,
+                frame    TEXT NOT NULL,
+                PRIMARY KEY (query, days, extras)
+            )""")
+
+    def save(self, query: str, days: int, extras, df: pd.DataFrame) -> None:
+        frame = frame_to_json(df)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO prewarmed VALUES (?, ?, ?, ?, ?)",
+                (query, days, _extras_key(extras), time.time(), frame))
+
+    def load(self, query: str, days: int, extras,
+             max_age: float = PREWARM_MAX_AGE) -> dict | None:
+        """
+        {"saved_at": float, "frame": DataFrame} 또는 None.
+        요청보다 긴 기간으로 수집한 결과도 게시일로 잘라서 쓴다.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT days, saved_at, frame FROM prewarmed "
+                "WHERE query = ? AND extras = ? AND days >= ? AND saved_at >= ? "
+                "ORDER BY days LIMIT 1",
+                (query, _extras_key(extras), days, time.time() - max_age)).fetchone()
+        if row is None:
+            return None
+        frame = frame_from_json(row[2])
+        if frame is None:   # 이전 스키마로 저장된 결과
+            return None
+        if row[0] > days:
+            since = datetime.fromtimestamp(row[1], KST) - timedelta(days=days)
+            frame = frame[frame["게시일"] >= since].reset_index(drop=True)
+        return {"saved_at": row[1], "frame": frame}
+
+    def discard_publishers(self, publishers: set) -> int:
+        """매체명 중 하나라도 publishers에 든 결과 삭제 (매핑 변경 시) → 삭제한 개수"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT query, days, extras, frame FROM prewarmed").fetchall()
+            keys = [(query, days, extras) for query, days, extras, frame in rows
+                    if stored_publishers(frame) & publishers]
+            self._conn.executemany(
+                "DELETE FROM prewarmed WHERE query = ? AND days = ? AND extras = ?", keys)
+        return len(keys)
+
+    def entries(self) -> list:
+        """저장된 (검색어, 기간, 추가 매체, 저장 시각) 목록 (최근 순)"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT query, days, extras, saved_at FROM prewarmed "
+                "ORDER BY saved_at DESC").fetchall()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_prewarm_store() -> PrewarmStore | None:
+    """프로세스 공용 저장소 (열 수 없으면 None → 사전 수집 결과 없이 동작)"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            try:
+                _store = PrewarmStore()
+            except sqlite3.Error:
+                return None
+        return _store
+
+
+# ── 수집 · 조회 ───────────────────────────────────────────────
+
+def load_prewarmed(query: str, days: int, extras) -> dict | None:
+    """화면 검색용: 사전 수집 결과 (유사 기사 묶음 포함) 또는 None"""
+    from .dedupe import add_clusters
+
+    store = get_prewarm_store()
+    try:
+        hit = store.load(query, days, extras) if store is not None else None
+    except sqlite3.Error:
+        metrics.count("prewarm_store_error")
+        hit = None
+    metrics.count("prewarm_hit" if hit is not None else "prewarm_miss")
+    if hit is None or hit["frame"].empty:
+        return None
+    hit["frame"] = add_clusters(hit["frame"])
+    return hit
+
+
+def prewarm_query(query: str, client_id: str, client_secret: str,
+                  progress: Progress = _no_progress, days: int = 7, extras: list = (),
+                  preview: Preview | None = None, use_cache: bool = True) -> pd.DataFrame | None:
+    """
+    검색어 하나를 증분 검색(직전 스냅샷 이후 새 기사만)으로 수집하고 결과를 저장.
+    스케줄러의 정기 수집과 화면의 새 기사 반영이 같이 쓴다.
+    """
+    df = run_all_sources([query], client_id, client_secret, progress, days, extras=list(extras),
+                         incremental=True, preview=preview, use_cache=use_cache)
+    store = get_prewarm_store()
+    if store is not None and df is not None and not df.empty:
+        try:
+            store.save(query, days, extras, df)
+        except sqlite3.Error:
+            metrics.count("prewarm_store_error")
+    return df
+
+
+def run_prewarm(queries: list, client_id: str, client_secret: str,
+                days: int = 7, extras: list = (), log=print) -> dict:
+    """키워드 목록을 차례로 사전 수집 → 검색어별 기사 수 (실패는 -1, 예외는 올리지 않음)"""
+    results = {}
+    with metrics.stage("prewarm"):
+        for query in queries:
+            started = time.perf_counter()
+            try:
+                # 스케줄러는 최신 결과를 새로 만드는 쪽이므로 세션 공용 캐시를 거치지 않는다
+                df = prewarm_query(query, client_id, client_secret, days=days, extras=extras,
+                                   use_cache=False)
+            except SearchError as e:
+                log(f"  ⚠️ {query}: {e}")
+                results[query] = -1
+                continue
+            except Exception as e:
+                # 예기치 못한 오류(SQLite 잠금 등)도 이 키워드만 실패로 두고 다음으로 넘어간다
+                log(f"  ⚠️ {query}: {type(e).__name__}: {e}")
+                results[query] = -1
+                continue
+            results[query] = 0 if df is None else len(df)
+            log(f"  ✅ {query}: {results[query]}건 ({time.perf_counter() - started:.1f}초)")
+    metrics.count("prewarm_failed", sum(1 for n in results.values() if n < 0))
+    return results
+
+
+# ── 스케줄러 CLI ──────────────────────────────────────────────
+
+def load_keywords(path: str) -> list:
+    """키워드 파일 (한 줄에 하나, # 주석 · 빈 줄 무시)"""
+    with open(path, encoding="utf-8") as f:
+        lines = (line.split("#", 1)[0].strip() for line in f)
+        return list(dict.fromkeys(line for line in lines if line))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    from .extras import EXTRA_CRAWLERS
+
+    parser = argparse.ArgumentParser(
+        prog="python -m clipping.prewarm",
+        description="자주 찾는 키워드를 정해진 시각에 미리 수집 (화면 검색을 바로 보여주기 위함)",
+    )
+    parser.add_argument("queries", nargs="*", help="검색어 (없으면 키워드 파일)")
+    parser.add_argument("-f", "--file", default=None,
+                        help=f"키워드 파일 (한 줄에 하나, 기본 {PREWARM_KEYWORDS_PATH})")
+    parser.add_argument("--cron", default=PREWARM_SCHEDULE,
+                        help=f"실행 일정 — cron 5필드, KST (기본 '{PREWARM_SCHEDULE}')")
+    parser.add_argument("--days", type=int, default=7, help="수집 기간 (일, 기본 7)")
+    parser.add_argument(
+        "--extras", default="all",
+        help=f"추가 매체: all | none | 쉼표 구분 ({', '.join(EXTRA_CRAWLERS)})")
+    parser.add_argument("--once", action="store_true", help="지금 한 번만 수집하고 종료")
+    parser.add_argument("--run-now", action="store_true", help="시작하자마자 한 번 수집한 뒤 일정대로")
+    parser.add_argument("--metrics-port", type=int,
+                        help="실행 중 http://127.0.0.1:PORT/metrics 로 Prometheus 지표 제공")
+    return parser
+
+
+def main(argv: list | None = None) -> int:
+    from .cli import load_credentials
+    from .extras import EXTRA_CRAWLERS
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    queries = list(args.queries)
+    if args.file or not queries:
+        path = args.file or PREWARM_KEYWORDS_PATH
+        try:
+            queries += load_keywords(path)
+        except OSError as e:
+            parser.error(f"키워드 파일을 열 수 없습니다: {path} ({e.strerror})")
+    queries = list(dict.fromkeys(q.strip() for q in queries if q.strip()))
+    if not queries:
+        parser.error("사전 수집할 키워드가 없습니다.")
+
+    if args.extras == "all":
+        extras = list(EXTRA_CRAWLERS)
+    elif args.extras == "none":
+        extras = []
+    else:
+        extras = [name.strip() for name in args.extras.split(",") if name.strip()]
+        unknown = [name for name in extras if name not in EXTRA_CRAWLERS]
+        if unknown:
+            parser.error(f"알 수 없는 추가 매체: {', '.join(unknown)}")
+
+    try:
+        schedule = CronSchedule(args.cron)
+    except ValueError as e:
+        parser.error(str(e))
+
+    client_id, client_secret = load_credentials()
+    if not client_id or not client_secret:
+        print("API 키가 설정되지 않았습니다. NAVER_CLIENT_ID / NAVER_CLIENT_SECRET 을 확인해주세요.",
+              file=sys.stderr)
+        return 2
+
+    if args.metrics_port:
+        metrics.serve_metrics(args.metrics_port)
+
+    def log(message: str) -> None:
+        print(message, file=sys.stderr, flush=True)
+
+    def run() -> dict:
+        log(f"[{datetime.now(KST):%Y-%m-%d %H:%M}] 사전 수집 시작 — 키워드 {len(queries)}개")
+        try:
+            with metrics.recording(f"prewarm: {', '.join(queries)}") as report:
+                results = run_prewarm(queries, client_id, client_secret, args.days, extras, log)
+            # 캐시 · 아카이브 · 저장소 쓰기 실패는 수집을 멈추지 않으므로 여기서 드러낸다
+            errors = {name: n for name, n in report.counters.items() if name.endswith("_error")}
+            if errors:
+                log("  ⚠️ 저장 실패: " + ", ".join(f"{name} {n}회" for name, n in errors.items()))
+            return results
+        except Exception as e:
+            # 한 번의 실행이 실패해도 데몬은 다음 일정까지 계속 돈다
+            log(f"  ⚠️ 사전 수집 실패: {type(e).__name__}: {e}")
+            return {query: -1 for query in queries}
+
+    if args.once:
+        results = run()
+        return 1 if all(n < 0 for n in results.values()) else 0
+
+    if args.run_now:
+        run()
+    try:
+        while True:
+            next_run = schedule.next_after(datetime.now(KST))
+            log(f"다음 사전 수집: {next_run:%Y-%m-%d %H:%M} ({schedule.expr})")
+            # 긴 sleep 중 시계가 바뀌어도 늦지 않게 최대 1분씩 나눠 기다린다
+            while (remaining := (next_run - datetime.now(KST)).total_seconds()) > 0:
+                time.sleep(min(remaining, 60))
+            run()
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+# ============================================================
+#  네이버 뉴스 클리핑 - 매체 매핑 · URL 기반 매체명 판별
+#
+#  매핑(도메인 키 → 매체명, 네이버 oid → 매체명, 매체명 → 그룹)은
+#  PUBLISHER_MAP_PATH의 JSON 파일에 버전과 함께 있다. 읽을 때 조회용
+#  불변 스냅샷(PublisherMappings)으로 컴파일하고, 파일이 바뀌면
+#  (PUBLISHER_RELOAD_INTERVAL마다 확인) 새 스냅샷으로 통째로 바꾼다.
+#  바뀐 키에 걸리는 조회 결과 · 캐시만 버리고 나머지는 그대로 쓴다.
+# ============================================================
+
+from __future__ import annotations
+
+import os
+import re
+import json
+import time
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from . import metrics
+from .config import PUBLISHER_MAP_PATH, PUBLISHER_RELOAD_INTERVAL
+
+# ══════════════════════════════════════════════════════════════
+#  URL → 매체명
+# ══════════════════════════════════════════════════════════════
+
+class DomainIndex:
+    """
+    FIXED_MAP 키 → 매체명 조회용 사전 컴파일 인덱스.
+
+    1) 도메인 라벨(점 단위) 정확 일치 해시
+    2) 키 전체에 대한 Aho-Corasick 자동자로 도메인 안의 '가장 긴' 키를 찾음
+       (길이가 같으면 앞쪽) — dict 순서와 무관하게 결정적이고 O(len(domain))
+    """
+
+    def __init__(self, mapping: dict):
+        self.exact = dict(mapping)
+        self._goto = [{}]           # 노드별 전이
+        self._fail = [0]
+        self._out = [None]          # 노드에서 끝나는 가장 긴 키
+        for key in mapping:
+            node = 0
+            for ch in key:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(None)
+                node = nxt
+            self._out[node] = key
+        self._build_fail_links()
+
+    def _build_fail_links(self) -> None:
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                # 자기 자신이 끝나는 키가 없으면 실패 링크 쪽의 가장 긴 키를 물려받음
+                if self._out[nxt] is None:
+                    self._out[nxt] = self._out[self._fail[nxt]]
+
+    def longest_match(self, text: str) -> str | None:
+        best, best_start = None, 0
+        node = 0
+        for pos, ch in enumerate(text):
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            key = self._out[node]
+            if key is not None:
+                start = pos - len(key) + 1
+                if best is None or len(key) > len(best) or (len(key) == len(best) and start < best_start):
+                    best, best_start = key, start
+        return best
+
+    def lookup(self, domain: str) -> str | None:
+        for label in domain.split('.'):
+            if label in self.exact:
+                return self.exact[label]
+        key = self.longest_match(domain)
+        return self.exact[key] if key is not None else None
+
+
+_OID_RE    = re.compile(r'article/(\d+)/')
+_PREFIX_RE = re.compile(r'^(www\.|n\.|news\.|m\.|blog\.|sports\.)')
+DOMAIN_CACHE_SIZE = 4096
+
+
+class PublisherMappings:
+    """
+    매핑 파일 한 버전을 컴파일한 불변 스냅샷.
+    키는 정규화해 둔다 (도메인 키: 소문자, oid: 3자리, 매체명: 앞뒤 공백 제거).
+    """
+
+    def __init__(self, data: dict):
+        self.version = int(data.get("version", 0))
+        self.fixed = MappingProxyType(
+            {key.strip().lower(): name.strip() for key, name in data["fixed"].items()})
+        self.oid = MappingProxyType(
+            {oid.strip().zfill(3): name.strip() for oid, name in data["oid"].items()})
+        self.groups = MappingProxyType(
+            {name.strip(): group for name, group in data["groups"].items()})
+        self.index = DomainIndex(self.fixed)
+        self._domains = OrderedDict()    # 도메인 → 매체명 (조회 결과 LRU)
+        self._domains_lock = threading.Lock()
+
+    def publisher_for_domain(self, domain: str) -> str:
+        with self._domains_lock:
+            name = self._domains.get(domain)
+            if name is not None:
+                self._domains.move_to_end(domain)
+                return name
+        stripped = _PREFIX_RE.sub('', domain)
+        name = self.index.lookup(stripped)
+        if name is None:
+            name = stripped.split('.')[0].upper()
+        with self._domains_lock:
+            self._domains[domain] = name
+            if len(self._domains) > DOMAIN_CACHE_SIZE:
+                self._domains.popitem(last=False)    # 가장 오래 안 쓴 도메인
+        return name
+
+    def publisher_from_url(self, link: str) -> str:
+        if "naver.com" in link:
+            m = _OID_RE.search(link)
+            if m:
+                name = self.oid.get(m.group(1).zfill(3))
+                if name is not None:
+                    return name
+        try:
+            domain = link.split('//')[-1].split('/')[0].lower()
+            return self.publisher_for_domain(domain)
+        except Exception:
+            return "기타매체"
+
+    def group(self, publisher: str) -> str:
+        return self.groups.get(publisher, "")
+
+    def clear_cache(self) -> None:
+        with self._domains_lock:
+            self._domains.clear()
+
+    def changes(self, old: PublisherMappings) -> dict:
+        """이전 스냅샷 대비 바뀐 도메인 키 · oid · 영향받는 매체명"""
+        def changed(a: Mapping, b: Mapping) -> set:
+            return {key for key in a.keys() | b.keys() if a.get(key) != b.get(key)}
+
+        keys, oids, grouped = (changed(old.fixed, self.fixed), changed(old.oid, self.oid),
+                               changed(old.groups, self.groups))
+        publishers = set(grouped)
+        for key in keys:
+            publishers.update(filter(None, (old.fixed.get(key), self.fixed.get(key))))
+        for oid in oids:
+            publishers.update(filter(None, (old.oid.get(oid), self.oid.get(oid))))
+        return {"keys": keys, "oids": oids, "publishers": publishers}
+
+    def inherit_cache(self, old: PublisherMappings, keys: set) -> None:
+        """
+        이전 스냅샷의 도메인 조회 결과 중 여전히 유효한 것만 물려받는다.
+        조회 결과는 도메인에 부분 문자열로 들어 있는 키에만 좌우되므로,
+        바뀐 키가 들어 있지 않은 도메인은 결과가 같다.
+        """
+        with old._domains_lock:
+            entries = list(old._domains.items())    # 오래 안 쓴 순서 유지
+        with self._domains_lock:
+            for domain, name in entries:
+                stripped = _PREFIX_RE.sub('', domain)
+                if not any(key in stripped for key in keys):
+                    self._domains[domain] = name
+
+
+# ══════════════════════════════════════════════════════════════
+#  스냅샷 로드 · 교체
+# ══════════════════════════════════════════════════════════════
+
+def load_mappings(path: str = PUBLISHER_MAP_PATH) -> PublisherMappings:
+    with open(path, encoding="utf-8") as f:
+        return PublisherMappings(json.load(f))
+
+
+def _file_stamp(path: str) -> tuple | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+_path = PUBLISHER_MAP_PATH
+_mappings = load_mappings(_path)
+_stamp = _file_stamp(_path)
+_checked_at = time.monotonic()
+_reload_lock = threading.Lock()
+
+
+def _invalidate(changes: dict) -> None:
+    """
+    바뀐 매체가 든 저장 결과만 버림: 공용 검색 결과 · 증분 검색 스냅샷 ·
+    사전 수집 결과 (모두 저장 시점 매핑의 그룹 · 매체명을 담고 있다).
+    기사 정보 캐시는 페이지에서 찾은 매체명만 담으므로 그대로 둔다.
+    """
+    from .cache import get_search_cache, get_snapshot_store
+    from .prewarm import get_prewarm_store
+
+    publishers = changes["publishers"]
+    if not publishers:
+        return
+
+    def affected(value) -> bool:
+        # 네이버 결과 DataFrame만 매핑에 좌우된다 (추가 매체 행은 고정 매체명)
+        columns = getattr(value, "columns", ())
+        return "매체명" in columns and bool(value["매체명"].isin(publishers).any())
+
+    get_search_cache().discard_if(affected)
+    for name, store in (("snapshot", get_snapshot_store()), ("prewarm_store", get_prewarm_store())):
+        if store is None:
+            continue
+        try:
+            metrics.count("publisher_map_discarded", store.discard_publishers(publishers))
+        except sqlite3.Error:
+            metrics.count(f"{name}_error")
+
+
+def reload_mappings(path: str | None = None, force: bool = False) -> bool:
+    """
+    매핑 파일이 바뀌었으면 새 스냅샷으로 교체 (교체했으면 True).
+    파일을 읽거나 해석하지 못하면 지금 스냅샷을 그대로 쓴다.
+    """
+    global _path, _mappings, _stamp, _checked_at
+    with _reload_lock:
+        path = path or _path
+        stamp = _file_stamp(path)
+        _checked_at = time.monotonic()
+        if not force and path == _path and stamp == _stamp:
+            return False
+        try:
+            new = load_mappings(path)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            metrics.count("publisher_map_error")
+            _stamp = stamp    # 같은 잘못된 파일은 다시 읽지 않음
+            return False
+        old = _mappings
+        changes = new.changes(old)
+        new.inherit_cache(old, changes["keys"])
+        _mappings, _path, _stamp = new, path, stamp    # 이후 조회는 새 스냅샷
+    metrics.count("publisher_map_reload")
+    _invalidate(changes)
+    return True
+
+
+def current_mappings() -> PublisherMappings:
+    """지금 매핑 스냅샷 (PUBLISHER_RELOAD_INTERVAL마다 파일 변경 확인)"""
+    if time.monotonic() - _checked_at >= PUBLISHER_RELOAD_INTERVAL:
+        reload_mappings()
+    return _mappings
+
+
+class _MappingView(Mapping):
+    """항상 지금 스냅샷을 가리키는 읽기 전용 매핑 (FIXED_MAP 등 기존 이름용)"""
+
+    def __init__(self, attr: str):
+        self._attr = attr
+
+    def _current(self) -> Mapping:
+        return getattr(current_mappings(), self._attr)
+
+    def __getitem__(self, key):
+        return self._current()[key]
+
+    def __iter__(self):
+        return iter(self._current())
+
+    def __len__(self) -> int:
+        return len(self._current())
+
+
+FIXED_MAP = _MappingView("fixed")
+OID_MAP   = _MappingView("oid")
+GROUP_MAP = _MappingView("groups")
+
+
+def publisher_from_url(link: str) -> str:
+    return current_mappings().publisher_from_url(link)
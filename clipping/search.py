@@ -0,0 +1,411 @@
+# ============================================================
+#  네이버 뉴스 클리핑 - 검색 파이프라인 (API 수집 → 크롤링 → DataFrame)
+# ============================================================
+
+from __future__ import annotations
+
+import time
+import sqlite3
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from typing import TYPE_CHECKING, Callable
+
+from .config import (
+    KST, API_MAX_WORKERS, EXTRA_MAX_WORKERS, EXTRA_SOURCE_DEADLINE, PREVIEW_INTERVAL,
+)
+from . import metrics
+from .archive import get_archive
+from .articles import crawl_articles
+from .cache import get_search_cache, get_snapshot_store
+from .dedupe import add_clusters
+from .extras import EXTRA_CRAWLERS
+from .frame import concat_frames, frame_from_rows, make_frame
+from .naver_api import NaverApiError, collect_api_items, collect_new_api_items
+from .publishers import current_mappings, publisher_from_url
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# progress(pct, message): 0~100 진행률과 현재 단계 문구를 받는 콜백
+Progress = Callable[[int, str], None]
+# preview(df): 크롤링이 끝나기 전의 중간 결과 DataFrame을 받는 콜백
+Preview = Callable[["pd.DataFrame"], None]
+
+
+class SearchError(Exception):
+    """검색을 끝까지 진행할 수 없는 오류 (메시지는 사용자 표시용)"""
+
+
+def _no_progress(pct: int, message: str) -> None:
+    pass
+
+
+def _naver_headers(client_id: str, client_secret: str) -> dict:
+    return {
+        "X-Naver-Client-Id": client_id,
+        "X-Naver-Client-Secret": client_secret,
+    }
+
+
+def build_news_frame(raw_items: list, crawl_results: list,
+                     keywords: list | None = None) -> pd.DataFrame:
+    """API 기사 + 크롤링 결과 → 결과 DataFrame (컬럼 단위로 구성)"""
+    infos      = [info or {} for info in crawl_results[:len(raw_items)]]
+    publishers = [info.get("publisher", "기타매체") for info in infos]
+    groups = current_mappings().groups
+    return make_frame(
+        groups=[groups.get(publisher, "") for publisher in publishers],
+        publishers=publishers,
+        titles=[item["title"] for item in raw_items],
+        links=[item["link"] for item in raw_items],
+        picks=[info.get("pick") == "PICK" for info in infos],
+        pub_dates=[item["pub_date"] for item in raw_items],
+        keywords=keywords,
+    )
+
+
+class LivePreview:
+    """
+    크롤링 도중의 결과 → 미리보기 DataFrame.
+    매체명은 URL 기준 추정값(publisher_from_url)으로 시작하고, 기사별 크롤링
+    결과가 오는 대로 그 행의 매체명 · PICK을 바꾼다. 콜백은 PREVIEW_INTERVAL에
+    한 번만 호출해 변경분을 묶어서 반영한다.
+    """
+
+    def __init__(self, callback: Preview, raw_items: list,
+                 keywords: list | None = None, base: pd.DataFrame | None = None):
+        self._callback = callback
+        self._raw_items = raw_items
+        self._keywords = keywords
+        self._base = base    # 함께 보여줄 기존 결과 (증분 검색의 직전 결과)
+        self._infos = [{"publisher": publisher_from_url(item["link"]), "pick": ""}
+                       for item in raw_items]
+        self._last = 0.0
+        self._dirty = True
+
+    def update(self, idx: int, info: dict) -> None:
+        self._infos[idx] = info
+        self._dirty = True
+        if time.monotonic() - self._last >= PREVIEW_INTERVAL:
+            self.emit()
+
+    def emit(self) -> None:
+        if not self._dirty:
+            return
+        with metrics.stage("preview"):
+            df = build_news_frame(self._raw_items, self._infos, self._keywords)
+            if self._base is not None:
+                df = concat_frames([df, self._base])
+        self._dirty = False
+        self._last = time.monotonic()
+        self._callback(df)
+
+
+def run_search(query: str, client_id: str, client_secret: str,
+               progress: Progress = _no_progress, days: int = 7,
+               incremental: bool = False, preview: Preview | None = None) -> pd.DataFrame | None:
+    """
+    검색어 하나의 기사 수집 → 결과 DataFrame (결과가 없으면 None).
+    API 오류는 SearchError로 올린다.
+
+    incremental=True 이면 저장된 직전 결과(SNAPSHOT_MAX_AGE 이내) 이후의
+    새 기사만 수집 · 크롤링해 합치고, since 밖으로 밀려난 기사는 뺀다.
+    preview가 있으면 API 수집 직후부터 중간 결과를 넘긴다 (LivePreview).
+    """
+    naver_headers = _naver_headers(client_id, client_secret)
+    now = datetime.now(KST)
+    since = now - timedelta(days=days)
+
+    store = get_snapshot_store()
+    snapshot = None
+    if incremental and store is not None:
+        try:
+            snapshot = store.load(query, days)
+        except sqlite3.Error:
+            metrics.count("snapshot_error")
+        metrics.count("snapshot_hit" if snapshot is not None else "snapshot_miss")
+
+    # ── Step 1: API 수집 ──────────────────────────────────────
+    progress(5, f"🔍 '{query}' 기사 수집 중...")
+
+    try:
+        with metrics.stage("api"):
+            if snapshot is not None:
+                raw_items = collect_new_api_items(
+                    query, naver_headers, since,
+                    snapshot["newest"], set(snapshot["frame"]["링크"]))
+            else:
+                raw_items = collect_api_items(query, naver_headers, since)
+    except NaverApiError as e:
+        raise SearchError(f"네이버 API 오류: {e.status_code} — API 키를 확인해주세요.") from e
+    except Exception as e:
+        raise SearchError(f"API 요청 오류: {e}") from e
+
+    if not raw_items and snapshot is None:
+        return None
+
+    progress(20, f"📰 {len(raw_items)}개 기사 수집 완료 — 매체명 · PICK 크롤링 중...")
+
+    # 증분 검색: 직전 결과 중 기간 안에 남는 기사
+    old = None
+    if snapshot is not None:
+        old = snapshot["frame"]
+        old = old[old["게시일"] >= since]
+    live = LivePreview(preview, raw_items, base=old) if preview else None
+    if live:
+        live.emit()
+
+    # ── Step 2: 병렬 크롤링 ───────────────────────────────────
+    def on_progress(done: int, total: int) -> None:
+        pct = 20 + int(done / total * 70)   # 20~90% 구간
+        progress(pct, f"🔄 크롤링 진행: {done} / {total}")
+
+    with metrics.stage("crawl"):
+        crawl_results = crawl_articles([item["link"] for item in raw_items], on_progress,
+                                       on_result=live.update if live else None)
+
+    # ── Step 3: DataFrame 구성 ────────────────────────────────
+    progress(95, "📊 데이터 정리 중...")
+
+    with metrics.stage("frame"):
+        df = build_news_frame(raw_items, crawl_results)
+    newest = max((item["pub_date"] for item in raw_items), default=None)
+    if snapshot is not None:
+        # 새 기사 + 직전 결과, 기간 밖으로 밀려난 기사는 제외
+        df = concat_frames([df, old])
+        df = df.drop_duplicates(subset="링크").reset_index(drop=True)
+        newest = max(newest or snapshot["newest"], snapshot["newest"])
+
+    if store is not None and newest is not None:
+        try:
+            store.save(query, days, newest, df)
+        except sqlite3.Error:
+            metrics.count("snapshot_error")
+
+    progress(100, "✅ 완료!")
+    return df
+
+
+def run_batch_search(queries: list, client_id: str, client_secret: str,
+                     progress: Progress = _no_progress, days: int = 7,
+                     preview: Preview | None = None) -> pd.DataFrame | None:
+    """
+    여러 키워드를 한 번에 수집.
+    API 페이지는 공용 풀에서 요청하고, 여러 키워드에 걸친 기사는 한 번만
+    크롤링한다. 결과에는 기사별로 걸린 키워드 목록(키워드 컬럼)이 붙는다.
+    일부 키워드의 요청 실패는 건너뛰고 완료 문구에 표시한다.
+    """
+    queries = list(dict.fromkeys(q.strip() for q in queries if q.strip()))
+    naver_headers = _naver_headers(client_id, client_secret)
+    since = datetime.now(KST) - timedelta(days=days)
+
+    # ── Step 1: 키워드별 API 수집 (공용 페이지 풀) ────────────
+    progress(5, f"🔍 키워드 {len(queries)}개 기사 수집 중...")
+
+    by_query, failed = {}, []
+    api_started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=API_MAX_WORKERS) as page_pool, \
+            ThreadPoolExecutor(max_workers=API_MAX_WORKERS) as query_pool:
+        future_to_query = {
+            query_pool.submit(metrics.bind(collect_api_items), q, naver_headers, since, page_pool): q
+            for q in queries
+        }
+        for done, future in enumerate(as_completed(future_to_query), start=1):
+            q = future_to_query[future]
+            try:
+                by_query[q] = future.result()
+            except NaverApiError as e:
+                raise SearchError(f"네이버 API 오류: {e.status_code} — API 키를 확인해주세요.") from e
+            except Exception:
+                failed.append(q)
+                by_query[q] = []
+            progress(5 + int(done / len(queries) * 15),
+                     f"🔍 키워드 수집 진행: {done} / {len(queries)}")
+    metrics.add_stage("api", time.perf_counter() - api_started)
+
+    # ── 링크 기준 중복 제거 (키워드 입력 순서 유지) ───────────
+    raw_items, keywords = [], {}
+    for q in queries:
+        for item in by_query.get(q, []):
+            link = item["link"]
+            if link not in keywords:
+                keywords[link] = []
+                raw_items.append(item)
+            keywords[link].append(q)
+
+    if not raw_items:
+        return None
+
+    progress(20, f"📰 {len(raw_items)}개 기사 수집 완료 — 매체명 · PICK 크롤링 중...")
+
+    item_keywords = [", ".join(keywords[item["link"]]) for item in raw_items]
+    live = LivePreview(preview, raw_items, item_keywords) if preview else None
+    if live:
+        live.emit()
+
+    # ── Step 2: 병렬 크롤링 (기사당 1회) ──────────────────────
+    def on_progress(done: int, total: int) -> None:
+        progress(20 + int(done / total * 70), f"🔄 크롤링 진행: {done} / {total}")
+
+    with metrics.stage("crawl"):
+        crawl_results = crawl_articles([item["link"] for item in raw_items], on_progress,
+                                       on_result=live.update if live else None)
+
+    # ── Step 3: DataFrame 구성 ────────────────────────────────
+    progress(95, "📊 데이터 정리 중...")
+
+    with metrics.stage("frame"):
+        df = build_news_frame(raw_items, crawl_results, item_keywords)
+
+    progress(100, "✅ 완료!" + (f" (요청 실패: {', '.join(failed)})" if failed else ""))
+    return df
+
+
+def run_all_sources(queries: list, client_id: str, client_secret: str,
+                    progress: Progress = _no_progress, days: int = 7,
+                    extras: list = (), batch: bool = False,
+                    incremental: bool = False,
+                    preview: Preview | None = None,
+                    use_cache: bool = True) -> pd.DataFrame | None:
+    """
+    네이버 파이프라인과 추가 매체(EXTRA_CRAWLERS)를 동시에 실행해 병합.
+
+    추가 매체는 시작과 동시에 백그라운드에서 돌고, 끝나는 대로 결과를 모은다.
+    네이버 수집이 끝난 뒤에도 남은 매체는 마감 시간까지만 기다리며,
+    매체별 상태는 진행 문구 아래에 함께 표시된다.
+    병합한 결과에는 유사 기사 묶음(클러스터 · 유사기사 컬럼)을 붙인다.
+    preview에는 네이버 중간 결과에 그때까지 모인 추가 매체 기사를 붙여 넘긴다.
+
+    네이버 결과((검색어, 기간)별)와 추가 매체 결과((매체, 검색어, 기간)별)는
+    세션 공용 캐시(SEARCH_CACHE_TTL)를 거친다. 같은 검색이 다른 세션에서
+    진행 중이면 새로 수집하지 않고 그 결과를 함께 받는다 (use_cache=False면 생략).
+    결과는 로컬 아카이브(clipping.archive)에도 쌓인다.
+    """
+    shared = get_search_cache() if use_cache else None
+    since = datetime.now(KST) - timedelta(days=days)
+    jobs = [(name, q) for q in queries for name in extras]
+    workers = min(EXTRA_MAX_WORKERS, len(jobs)) or 1
+    # 작업이 워커 수보다 많으면 대기열만큼 마감을 늘려준다
+    deadline = time.monotonic() + EXTRA_SOURCE_DEADLINE * -(-len(jobs) // workers)
+
+    remaining = {name: 0 for name in extras}
+    counts = {name: 0 for name in extras}
+    failed = set()
+    for name, _ in jobs:
+        remaining[name] += 1
+    extra_rows = {}
+
+    def run_extra(name: str, q: str) -> list:
+        with metrics.stage(f"extra:{name}"):
+            if shared is None:
+                return EXTRA_CRAWLERS[name](q, since)
+            rows = shared.get_or_run(("extra", name, q, days),
+                                     lambda: EXTRA_CRAWLERS[name](q, since), name="extra_cache")
+            # 캐시된 행은 세션끼리 공유하므로 복사본에 키워드를 붙인다
+            return [dict(row) for row in rows]
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    future_to_job = {
+        executor.submit(metrics.bind(run_extra), name, q): (name, q) for name, q in jobs
+    }
+    pending = set(future_to_job)
+
+    def collect_finished() -> None:
+        for future in [f for f in pending if f.done()]:
+            pending.discard(future)
+            name, q = future_to_job[future]
+            remaining[name] -= 1
+            try:
+                rows = future.result()
+            except Exception:
+                failed.add(name)
+                continue
+            for row in rows:
+                if row["링크"] in extra_rows:
+                    if batch:
+                        extra_rows[row["링크"]]["키워드"] += f", {q}"
+                    continue
+                if batch:
+                    row["키워드"] = q
+                extra_rows[row["링크"]] = row
+                counts[name] += 1
+
+    def source_line(timed_out: bool = False) -> str:
+        labels = []
+        for name in extras:
+            if remaining[name]:
+                label = "⏱ 시간 초과" if timed_out else "⏳ 수집 중"
+            elif name in failed:
+                label = "⚠️ 실패"
+            else:
+                label = f"✅ {counts[name]}건"
+            labels.append(f"{name} {label}")
+        return " · ".join(labels)
+
+    last_pct = 0
+
+    def naver_progress(pct: int, message: str) -> None:
+        # 네이버 진행 문구에 매체별 상태를 덧붙임
+        nonlocal last_pct
+        last_pct = pct
+        collect_finished()
+        progress(pct, f"{message}\n{source_line()}" if extras else message)
+
+    def with_extras(df: pd.DataFrame | None) -> pd.DataFrame:
+        if not extra_rows:
+            return concat_frames([df])
+        return concat_frames([df, frame_from_rows(list(extra_rows.values()))])
+
+    def naver_preview(df: pd.DataFrame) -> None:
+        collect_finished()
+        preview(with_extras(df))
+
+    def run_naver() -> pd.DataFrame | None:
+        on_preview = naver_preview if preview else None
+        if batch:
+            return run_batch_search(queries, client_id, client_secret, naver_progress, days,
+                                    preview=on_preview)
+        return run_search(queries[0], client_id, client_secret,
+                          naver_progress, days, incremental, preview=on_preview)
+
+    def on_wait() -> None:
+        naver_progress(20, "🔁 같은 검색이 이미 진행 중입니다 — 그 결과를 함께 받습니다...")
+
+    try:
+        if shared is None:
+            df = run_naver()
+        else:
+            # 증분 검색은 저장된 직전 결과에 기대므로 전체 검색과 결과를 나누지 않는다
+            # (일괄 검색은 incremental을 쓰지 않는다)
+            key = ("naver", tuple(queries) if batch else queries[0], days, batch,
+                   incremental and not batch)
+            df = shared.get_or_run(key, run_naver, on_wait=on_wait)
+
+        # ── 남은 추가 매체: 마감까지 끝나는 대로 병합 ──────────
+        with metrics.stage("extras_wait"):
+            collect_finished()    # 마감이 이미 지났어도 끝난 매체는 반영
+            while pending and time.monotonic() < deadline:
+                wait(pending, timeout=deadline - time.monotonic(), return_when=FIRST_COMPLETED)
+                collect_finished()
+                progress(last_pct, f"🔍 추가 매체 수집 중...\n{source_line()}")
+                if preview:
+                    preview(with_extras(df))
+        metrics.count("extra_timeout", len(pending))
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if extras:
+        progress(100, f"✅ 완료!\n{source_line(timed_out=True)}")
+    if extra_rows:
+        df = with_extras(df)
+    if df is not None and not df.empty:
+        with metrics.stage("cluster"):
+            df = add_clusters(df)
+        archive = get_archive()
+        if archive is not None:
+            try:
+                with metrics.stage("archive"):
+                    metrics.count("archive_added", archive.add_frame(df, ", ".join(queries)))
+            except sqlite3.Error:
+                metrics.count("archive_error")
+    return df
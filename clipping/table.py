@@ -0,0 +1,115 @@
+# ============================================================
+#  네이버 뉴스 클리핑 - 결과 테이블 HTML (페이지 단위 렌더링)
+#
+#  행 HTML은 내용 기준으로 한 번만 만들어 캐시하고, 화면에는 현재
+#  페이지의 행만 이어 붙인다. 페이지를 넘겨도 다른 행은 다시 만들지 않는다.
+# ============================================================
+
+from __future__ import annotations
+
+import html
+import functools
+from typing import TYPE_CHECKING
+
+from .config import GROUP_COLORS
+from .dedupe import collapse_clusters
+from .frame import format_dates
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# ── 그룹 배지 색상 (Streamlit 테이블용 HTML) ─────────────────
+GROUP_BADGE = {
+    "그룹 A": "background:#D5F5E3; color:#1e7e34; padding:2px 8px; border-radius:4px; font-weight:bold;",
+    "그룹 B": "background:#FEF9E7; color:#856404; padding:2px 8px; border-radius:4px; font-weight:bold;",
+    "그룹 C": "background:#FDEBD0; color:#c05621; padding:2px 8px; border-radius:4px; font-weight:bold;",
+    "":       "color:#999; padding:2px 8px;",
+}
+
+ROW_CACHE_SIZE = 20_000
+
+TABLE_STYLE = """
+        <style>
+            .clip-table { width:100%; border-collapse:collapse; font-size:0.9rem; }
+            .clip-table th { background:#2C3E50; color:#fff; padding:8px 10px;
+                             text-align:left; position:sticky; top:0; }
+            .clip-table tr:hover { filter: brightness(0.96); }
+        </style>"""
+
+
+@functools.lru_cache(maxsize=ROW_CACHE_SIZE)
+def render_row(group: str, publisher: str, title: str, link: str,
+               pick: bool, pub_date: str, keywords: str | None = None,
+               similar: int = 1) -> str:
+    """기사 한 줄 → <tr> HTML (같은 내용이면 캐시된 문자열 재사용)"""
+    badge_style = GROUP_BADGE.get(group, GROUP_BADGE[""])
+    badge      = f'<span style="{badge_style}">{group if group else "미분류"}</span>'
+    pick_html  = '<span style="color:#e74c3c;font-weight:bold;">PICK</span>' if pick else ""
+    keyword_td = (f'<td style="padding:6px 10px;border-bottom:1px solid #eee;color:#555;font-size:0.85em;">{html.escape(keywords)}</td>'
+                  if keywords is not None else "")
+    title_html = (f'<a href="{html.escape(link)}" target="_blank" style="text-decoration:none;color:#1a73e8;">'
+                  f'{html.escape(title, quote=False)}</a>')
+    if similar > 1:
+        title_html += f' <span style="color:#999;font-size:0.8em;">유사 {similar - 1}건</span>'
+    row_bg = GROUP_COLORS.get(group, "#FFFFFF")
+    return f"""
+            <tr style="background:{row_bg};">
+                <td style="padding:6px 10px;border-bottom:1px solid #eee;white-space:nowrap;">{badge}</td>
+                <td style="padding:6px 10px;border-bottom:1px solid #eee;white-space:nowrap;font-weight:500;">{html.escape(publisher, quote=False)}</td>
+                <td style="padding:6px 10px;border-bottom:1px solid #eee;">{title_html}</td>
+                <td style="padding:6px 10px;border-bottom:1px solid #eee;text-align:center;">{pick_html}</td>
+                <td style="padding:6px 10px;border-bottom:1px solid #eee;white-space:nowrap;color:#666;font-size:0.85em;">{pub_date}</td>{keyword_td}
+            </tr>"""
+
+
+# 화면 정렬 기준 → 컬럼
+SORT_COLUMNS = {"게시일": "게시일", "그룹": "그룹", "매체명": "매체명", "제목": "제목"}
+
+
+def filter_view(df: pd.DataFrame, groups: tuple = (), pick_only: bool = False,
+                keyword: str = "", sort_by: str = "게시일",
+                ascending: bool = False, collapse: bool = False) -> pd.DataFrame:
+    """
+    그룹 · PICK · 제목 키워드 필터와 정렬을 적용한 뷰 (groups의 "미분류" = 빈 그룹).
+    collapse=True 이면 유사 기사 묶음마다 정렬상 첫 기사만 남긴다.
+    """
+    selected_groups = [("" if g == "미분류" else g) for g in groups]
+    mask = df["그룹"].isin(selected_groups)
+    if pick_only:
+        mask &= df["PICK"]
+    keyword = keyword.strip()
+    if keyword:
+        mask &= df["제목"].str.contains(keyword, case=False, na=False)
+
+    view = df[mask].sort_values(
+        by=SORT_COLUMNS[sort_by], ascending=ascending
+    ).reset_index(drop=True)
+    return collapse_clusters(view) if collapse else view
+
+
+def _text(values) -> list:
+    return ["" if v is None or v != v else str(v) for v in values]
+
+
+def render_table(df_view: pd.DataFrame, start: int = 0, stop: int | None = None) -> str:
+    """df_view[start:stop] 구간만 HTML 테이블로 렌더링"""
+    window = df_view.iloc[start:stop]
+    has_keywords = "키워드" in window.columns
+    columns = [_text(window[col].tolist()) for col in ("그룹", "매체명", "제목", "링크")]
+    columns += [window["PICK"].tolist(), format_dates(window["게시일"]).tolist()]
+    keywords = _text(window["키워드"].tolist()) if has_keywords else [None] * len(window)
+    similar = window["유사기사"].tolist() if "유사기사" in window.columns else [1] * len(window)
+    rows_html = "".join(render_row(*row, kw, sim)
+                        for row, kw, sim in zip(zip(*columns), keywords, similar))
+
+    return f"""{TABLE_STYLE}
+        <div style="overflow-x:auto; max-height:600px; overflow-y:auto;">
+        <table class="clip-table">
+            <thead>
+                <tr>
+                    <th>그룹</th><th>매체명</th><th>제목</th><th>PICK</th><th>게시일</th>{"<th>키워드</th>" if has_keywords else ""}
+                </tr>
+            </thead>
+            <tbody>{rows_html}</tbody>
+        </table>
+        </div>"""